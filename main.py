@@ -22,6 +22,8 @@ import src.layers.monitoring.monitoring as monitoring
 from src.utils.socket import web_socket
 import src.utils.database.member_vector as member_vector
 import src.utils.database.faq_vector as faq_vector
+import src.utils.database.cache_warmup as cache_warmup
+import src.utils.database.redis_caching as redis_caching
 
 
 logging.basicConfig(
@@ -147,6 +149,22 @@ async def week_response_statistics():
         )
 
 
+# Redis/프로메테우스 조회가 블로킹이므로 일반 함수로 두어 스레드풀에서 실행
+@app.get("/api/chatbot/cache-stats")
+def cache_stats(top: int = 20):
+    """의미 캐시 현황 (적중률, 유사도 분포, 항목 수, 메모리, 자주 조회된 질문)"""
+    try:
+        result = redis_caching.get_cache_stats(top_n=top)
+        result.update(monitoring.get_semantic_cache_stats())
+        return result
+    except Exception as e:
+        print(f"의미 캐시 현황 API 오류: {e}")
+        raise HTTPException(
+            status_code=400,
+            detail=f"의미 캐시 현황 조회 중 오류가 발생했습니다: {str(e)}",
+        )
+
+
 # 임베딩을 위한 파일 URL 수집 API
 @app.post("/api/chatbot/file")
 async def file_collect(payload: FilePayload):
@@ -187,6 +205,17 @@ async def file_collect(payload: FilePayload):
         raise HTTPException(status_code=400)
 
 
+# 야간 데이터 동기화 (조직도, FAQ) 후 의미 캐시 예열
+# 예열은 두 동기화가 모두 끝난 뒤 실행
+def sync_and_warmup():
+    for sync in (member_vector.save_data, faq_vector.upsert_faq):
+        try:
+            sync()
+        except Exception as e:
+            logging.error(f"야간 동기화 실패 [{sync.__module__}]: {e}")
+    cache_warmup.run_warmup()
+
+
 if __name__ == "__main__":
     env_path = os.path.join(os.path.dirname(__file__), "..", "..", "..", ".env")
     load_dotenv(dotenv_path=os.path.abspath(env_path))
@@ -198,10 +227,15 @@ if __name__ == "__main__":
     client = web_socket.WebSocketClient(ws_url, BOT_TOKEN, webhook_url)
     threading.Thread(target=client.connect_with_retry, daemon=True).start()
 
+    # 시작 시 의미 캐시 예열 (최근 자주 나온 질문)
+    cache_warmup.start_warmup()
+
     # BackgroundScheduler로 매일 4시 함수 실행
     scheduler = BackgroundScheduler()
-    scheduler.add_job(member_vector.save_data, "cron", hour=4, minute=0)
-    scheduler.add_job(faq_vector.upsert_faq, "cron", hour=4, minute=0)
+    scheduler.add_job(sync_and_warmup, "cron", hour=4, minute=0)
+    # 의미 캐시 자체 예산 적용 및 항목 수/메모리 메트릭 갱신
+    scheduler.add_job(redis_caching.enforce_cache_budget, "interval", minutes=1)
+    scheduler.add_job(redis_caching.report_cache_usage, "interval", minutes=1)
     scheduler.start()
 
     uvicorn.run(app, host="0.0.0.0", port=8001)
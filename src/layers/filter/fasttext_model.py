@@ -3,16 +3,31 @@ import logging
 import os
 
 from src.layers.filter.preprocessing import preprocess_text
-
-
-# 모델 재학습
-def model_retrain(input_path="./dataset/train.txt"):
+from src.utils.tools.pipeline_language import (
+    REQUESTED_PIPELINE_LANG,
+    save_model_language,
+)
+
+# 요청된 파이프라인 언어에 맞는 학습 데이터 (한국어 입력은 번역 없이 분류)
+# 한국어 모델로 재학습한 뒤 다시 시작하면 파이프라인이 한국어로 동작
+TRAIN_LANG = REQUESTED_PIPELINE_LANG
+TRAIN_DATA_PATH = (
+    "./dataset/train_ko.txt"
+    if TRAIN_LANG.upper().startswith("KO")
+    else "./dataset/train.txt"
+)
+
+
+# 모델 재학습 (train_lang: 학습 데이터의 언어, 모델과 함께 기록)
+def model_retrain(input_path=TRAIN_DATA_PATH, train_lang=TRAIN_LANG):
     global model
 
     try:
         if not os.path.exists(input_path):
             return None
 
+        os.makedirs(os.path.dirname(model_path), exist_ok=True)
+
         # 모델 학습
         model = fasttext.train_supervised(
             input=input_path,
@@ -25,7 +40,8 @@ def model_retrain(input_path="./dataset/train.txt"):
         )
 
         model.save_model(model_path)
-        logging.info(f"모델이 {model_path}에 저장되었습니다.")
+        save_model_language(train_lang)
+        logging.info(f"모델이 {model_path}에 저장되었습니다. (학습 언어: {train_lang})")
 
         # 동적 import
         from src.layers.filter.feedback_modal import (
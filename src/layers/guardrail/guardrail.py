@@ -1,9 +1,14 @@
 import pandas as pd
+import threading
 import logging
+import time
 import os
+from collections import namedtuple
 from groq import Groq
 from dotenv import load_dotenv
 
+from src.layers.guardrail.keyword_matcher import KeywordMatcher
+
 current_script_dir = os.path.dirname(os.path.abspath(__file__))
 DOTENV_FILE_PATH = os.path.join(current_script_dir, '..', '..', '..', '.env')
 
@@ -14,14 +19,17 @@ else:
     logging.warning(".env file을 찾을 수 없음")
     
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+DEFAULT_CSV_PATH = os.path.join(current_script_dir, '..', '..', '..', 'dataset', 'chat_scenario_dataset.csv')
+RELOAD_CHECK_INTERVAL = float(os.getenv("GUARDRAIL_RELOAD_INTERVAL", 5))
+SAFE_RESPONSE = "정상적인 대화입니다."
+DEFAULT_BLOCK_RESPONSE = "부적절한 표현이 감지되었습니다. 다른 표현을 사용해주세요."
 
-# Guardrail 시스템 초기화 (Groq 클라이언트 + 블랙리스트 데이터)
-def setup_guardrail(csv_file_path: str = None, groq_api_key: str = None) -> tuple:
 
-    # Groq 클라이언트 초기화
+# Groq 클라이언트 생성
+def create_groq_client(groq_api_key: str = None) -> Groq | None:
     groq_client = None
     api_key = groq_api_key or GROQ_API_KEY
-    
+
     if api_key:
         try:
             groq_client = Groq(api_key=api_key)
@@ -30,6 +38,15 @@ def setup_guardrail(csv_file_path: str = None, groq_api_key: str = None) -> tupl
             logging.error(f"Groq 클라이언트 초기화 실패: {e}")
     else:
         logging.warning("Groq API 키가 설정되지 않아 2차 LLM 필터링이 작동하지 않습니다.")
+
+    return groq_client
+
+
+# Guardrail 시스템 초기화 (Groq 클라이언트 + 블랙리스트 데이터)
+def setup_guardrail(csv_file_path: str = None, groq_api_key: str = None) -> tuple:
+
+    # Groq 클라이언트 초기화
+    groq_client = create_groq_client(groq_api_key)
     
     # 블랙리스트 데이터 로드
     blacklist_keywords = set()
@@ -54,16 +71,16 @@ def load_blacklist_data(file_path: str) -> tuple[set, dict]:
             df = pd.read_csv(file_path, encoding='cp949')
         except Exception as e:
             logging.error(f"오류: 블랙리스트 CSV 파일을 로드할 수 없습니다. 파일 경로와 인코딩을 확인해주세요. ({e})")
-            return set(), {}
+            raise
             
     blacklist_data = df[df['상태'] == '블랙 리스트 (자체 지정)']
 
     blacklist_keywords = set()
     blacklist_responses = {}
 
-    for _, row in blacklist_data.iterrows():
-        keyword = str(row['차단 키워드']).strip()
-        response = str(row['대응 응답']).strip()
+    for keyword, response in zip(blacklist_data['차단 키워드'], blacklist_data['대응 응답']):
+        keyword = str(keyword).strip()
+        response = str(response).strip()
         
         if keyword:
             blacklist_keywords.add(keyword)
@@ -77,7 +94,7 @@ def load_blacklist_data(file_path: str) -> tuple[set, dict]:
 def filter_profanity_stage1(user_input: str, blacklist_keywords: set, blacklist_responses: dict) -> str | None:
     for keyword in blacklist_keywords:
         if keyword in user_input:
-            return blacklist_responses.get(keyword, "부적절한 표현이 감지되었습니다. 다른 표현을 사용해주세요.")
+            return blacklist_responses.get(keyword, DEFAULT_BLOCK_RESPONSE)
     return None
 
 
@@ -137,7 +154,104 @@ def comprehensive_profanity_filter(user_input: str, blacklist_keywords: set, bla
         return stage2_response
     
     # 모든 필터링을 통과한 경우
-    return "정상적인 대화입니다."
+    return SAFE_RESPONSE
+
+
+# 블랙리스트 스냅샷 (교체 시 참조 하나만 바꿔 원자적으로 교체)
+GuardrailState = namedtuple("GuardrailState", ["mtime", "matcher", "responses"])
+
+
+# 프로세스 전역 가드레일 엔진
+# 시작 시 한 번만 CSV를 읽고, 파일 mtime이 바뀌면 새 스냅샷을 만들어 교체
+class GuardrailEngine:
+    def __init__(self, csv_file_path: str = DEFAULT_CSV_PATH, groq_api_key: str = None):
+        self.csv_file_path = csv_file_path
+        self.groq_client = create_groq_client(groq_api_key)
+        self._reload_lock = threading.Lock()
+        self._last_check = time.monotonic()
+        try:
+            self._state = self._build_state()
+        except Exception as e:
+            # mtime을 비워 두어 다음 확인 때 다시 로드
+            logging.error(f"블랙리스트 로드 실패: {e}")
+            self._state = GuardrailState(None, KeywordMatcher([]), {})
+
+    # CSV를 읽어 Aho-Corasick 매처 구성 (파일이 없거나 읽을 수 없으면 예외)
+    def _build_state(self) -> GuardrailState:
+        mtime = os.path.getmtime(self.csv_file_path)
+        blacklist_keywords, blacklist_responses = load_blacklist_data(self.csv_file_path)
+        matcher = KeywordMatcher(sorted(blacklist_keywords))
+        logging.info(f"가드레일 엔진 구성 완료: 키워드 {len(matcher)}개")
+        return GuardrailState(mtime, matcher, blacklist_responses)
+
+    # 파일 변경 시 핫 리로드 (확인 주기는 RELOAD_CHECK_INTERVAL로 제한)
+    def reload_if_changed(self, force: bool = False) -> bool:
+        now = time.monotonic()
+        if not force and now - self._last_check < RELOAD_CHECK_INTERVAL:
+            return False
+
+        if not self._reload_lock.acquire(blocking=False):
+            return False
+        try:
+            self._last_check = now
+            try:
+                mtime = os.path.getmtime(self.csv_file_path)
+            except OSError:
+                return False
+
+            if not force and mtime == self._state.mtime:
+                return False
+
+            # 저장 중인 파일 등으로 읽기에 실패하면 기존 스냅샷을 유지하고 다음 확인 때 재시도
+            try:
+                new_state = self._build_state()
+            except Exception as e:
+                logging.error(f"블랙리스트 다시 로드 실패, 기존 목록을 유지합니다: {e}")
+                return False
+            self._state = new_state
+            logging.info("블랙리스트 변경을 감지하여 가드레일을 다시 로드했습니다.")
+            return True
+        finally:
+            self._reload_lock.release()
+
+    # 1단계: 블랙리스트 매칭
+    def check_stage1(self, user_input: str) -> str | None:
+        self.reload_if_changed()
+        state = self._state
+        keyword = state.matcher.find_first(user_input)
+        if keyword is None:
+            return None
+        return state.responses.get(keyword, DEFAULT_BLOCK_RESPONSE)
+
+    # 2단계: LLM 필터링 (공유 Groq 클라이언트 사용)
+    def check_stage2(self, user_input: str) -> str | None:
+        return filter_profanity_stage2_llm(user_input, self.groq_client)
+
+    # 종합 필터링
+    def check(self, user_input: str) -> str:
+        stage1_response = self.check_stage1(user_input)
+        if stage1_response:
+            return stage1_response
+
+        stage2_response = self.check_stage2(user_input)
+        if stage2_response:
+            return stage2_response
+
+        return SAFE_RESPONSE
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+# 전역 가드레일 엔진 반환 (최초 호출 시 한 번만 생성)
+def get_guardrail_engine() -> GuardrailEngine:
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = GuardrailEngine()
+    return _engine
 
 
 # --- 메인 실행 로직 ---
@@ -148,8 +262,7 @@ if __name__ == "__main__":
         format='%(asctime)s - %(levelname)s - %(message)s'
     )
     
-    csv_file_path = './dataset/chat_scenario_dataset.csv'
-    groq_client, blacklist_keywords, blacklist_responses = setup_guardrail(csv_file_path)
+    engine = get_guardrail_engine()
 
     print("\n--- 종합 금지어 필터링 테스트 ---")
     test_inputs_comprehensive = [
@@ -165,6 +278,6 @@ if __name__ == "__main__":
     ]
     
     for test_input in test_inputs_comprehensive:
-        final_response = comprehensive_profanity_filter(test_input, blacklist_keywords, blacklist_responses, groq_client)
+        final_response = engine.check(test_input)
         print(f"입력: '{test_input}' -> 최종 응답: '{final_response}'")
     
\ No newline at end of file
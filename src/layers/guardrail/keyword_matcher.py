@@ -0,0 +1,70 @@
+from collections import deque
+
+
+# Aho-Corasick 기반 다중 키워드 매칭
+# 키워드 수와 관계없이 입력 문자열을 한 번만 순회하여 금지어를 찾음
+class KeywordMatcher:
+    def __init__(self, keywords):
+        self.keywords = [k for k in dict.fromkeys(keywords) if k]
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        self._build()
+
+    def __len__(self):
+        return len(self.keywords)
+
+    # 트라이 구성 후 BFS로 실패 링크 연결
+    def _build(self):
+        for idx, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[state][char] = next_state
+                state = next_state
+            self._output[state].append(idx)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                # 실패 링크의 출력도 함께 상속 (접미사 키워드 매칭)
+                self._output[next_state] = (
+                    self._output[next_state] + self._output[self._fail[next_state]]
+                )
+
+    # 입력에서 가장 먼저 끝나는 키워드 반환 (없으면 None)
+    def find_first(self, text: str) -> str | None:
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                return self.keywords[output[state][0]]
+        return None
+
+    # 입력에 포함된 모든 키워드 반환 (등장 순서)
+    def find_all(self, text: str) -> list[str]:
+        matches = []
+        state = 0
+        for char in text:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for idx in self._output[state]:
+                matches.append(self.keywords[idx])
+        return matches
@@ -67,6 +67,132 @@ weekly_responses = Counter(
     ['week','label_type','day_of_week']
 )
 
+# 파이프라인 워커 풀 대기열 길이
+worker_queue_depth = Gauge(
+    'chatbot_worker_queue_depth',
+    'Number of pipeline jobs waiting in the worker queue',
+    ['pool']
+)
+
+# 파이프라인 워커 풀 대기 시간
+worker_wait_time = Histogram(
+    'chatbot_worker_wait_time_seconds',
+    'Time a pipeline job waited in the queue before execution',
+    ['pool'],
+    buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30]
+)
+
+# 파이프라인 워커 풀 거절/폐기 수
+worker_rejected = Counter(
+    'chatbot_worker_rejected_total',
+    'Total number of pipeline jobs rejected or dropped by the worker pool',
+    ['pool', 'reason']
+)
+
+# 로컬 언어 감지로 생략된 번역 수
+translation_skipped = Counter(
+    'chatbot_translation_skipped_total',
+    'Total number of DeepL translations avoided by local language detection',
+    ['direction']
+)
+
+# 번역 캐시 조회 결과
+translation_cache = Counter(
+    'chatbot_translation_cache_total',
+    'Translation cache lookups by tier and result',
+    ['tier', 'result']
+)
+
+embedding_cache = Counter(
+    'chatbot_embedding_cache_total',
+    'Embedding cache lookups by tier and result',
+    ['tier', 'result']
+)
+
+embedding_batch_size = Histogram(
+    'chatbot_embedding_batch_size',
+    'Number of texts sent per batched embedding call',
+    buckets=[1, 2, 4, 8, 16, 32, 64, 128]
+)
+
+embedding_batch_fill_ratio = Histogram(
+    'chatbot_embedding_batch_fill_ratio',
+    'Batch size divided by the configured maximum batch size',
+    buckets=[0.05, 0.1, 0.25, 0.5, 0.75, 1.0]
+)
+
+embedding_batch_wait = Histogram(
+    'chatbot_embedding_batch_wait_seconds',
+    'Time the oldest request waited before its batch was sent',
+    buckets=[0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1]
+)
+
+cache_warmup_progress = Gauge(
+    'chatbot_cache_warmup_progress',
+    'Fraction of warm-up candidates processed by source',
+    ['source']
+)
+
+cache_warmup_entries = Counter(
+    'chatbot_cache_warmup_entries_total',
+    'Cache warm-up entries by source and result',
+    ['source', 'result']
+)
+
+single_flight = Counter(
+    'chatbot_single_flight_total',
+    'Requests handled by single-flight coalescing by role',
+    ['role']
+)
+
+# 의미 캐시 조회 결과 (hit, near_miss, miss)
+semantic_cache_lookups = Counter(
+    'chatbot_semantic_cache_total',
+    'Semantic cache lookups by label, language and result',
+    ['label', 'lang', 'result']
+)
+
+semantic_cache_similarity = Histogram(
+    'chatbot_semantic_cache_similarity',
+    'Best similarity score returned by a semantic cache lookup',
+    ['label'],
+    buckets=[0.5, 0.6, 0.7, 0.75, 0.8, 0.825, 0.85, 0.875, 0.9, 0.95, 0.99, 1.0]
+)
+
+semantic_cache_tier = Counter(
+    'chatbot_semantic_cache_tier_total',
+    'Semantic cache hits and stale evictions by tier',
+    ['tier', 'result']
+)
+
+semantic_cache_entries = Gauge(
+    'chatbot_semantic_cache_entries',
+    'Number of entries in the semantic cache index'
+)
+
+semantic_cache_memory = Gauge(
+    'chatbot_semantic_cache_memory_bytes',
+    'Semantic cache memory: used (entries x sampled bytes per entry), per_entry, and Redis instance_used/max for the whole instance',
+    ['kind']
+)
+
+semantic_cache_evicted_keys = Gauge(
+    'chatbot_semantic_cache_evicted_keys',
+    'Keys evicted by the Redis maxmemory policy since Redis started'
+)
+
+semantic_cache_admission = Counter(
+    'chatbot_semantic_cache_admission_total',
+    'Semantic cache write candidates admitted or rejected by the frequency filter',
+    ['result']
+)
+
+retrieval_cache = Counter(
+    'chatbot_retrieval_cache_total',
+    'Qdrant retrieval cache lookups by collection, tier and result',
+    ['collection', 'tier', 'result']
+)
+
 # metrics 객체 생성 (이 부분을 추가!)
 class ChatbotMetrics:
     def __init__(self):
@@ -79,6 +205,26 @@ class ChatbotMetrics:
         self.average_response_time = average_response_time
         self.prompt_template_usage = prompt_template_usage
         self.weekly_responses = weekly_responses
+        self.worker_queue_depth = worker_queue_depth
+        self.worker_wait_time = worker_wait_time
+        self.worker_rejected = worker_rejected
+        self.translation_skipped = translation_skipped
+        self.translation_cache = translation_cache
+        self.embedding_cache = embedding_cache
+        self.embedding_batch_size = embedding_batch_size
+        self.embedding_batch_fill_ratio = embedding_batch_fill_ratio
+        self.embedding_batch_wait = embedding_batch_wait
+        self.cache_warmup_progress = cache_warmup_progress
+        self.cache_warmup_entries = cache_warmup_entries
+        self.single_flight = single_flight
+        self.semantic_cache_lookups = semantic_cache_lookups
+        self.semantic_cache_similarity = semantic_cache_similarity
+        self.semantic_cache_tier = semantic_cache_tier
+        self.semantic_cache_entries = semantic_cache_entries
+        self.semantic_cache_memory = semantic_cache_memory
+        self.semantic_cache_evicted_keys = semantic_cache_evicted_keys
+        self.semantic_cache_admission = semantic_cache_admission
+        self.retrieval_cache = retrieval_cache
 
 # 전역 metrics 객체 생성
 metrics = ChatbotMetrics()
\ No newline at end of file
@@ -147,6 +147,113 @@ def record_weekly_response(label_type, success=True):
     ).inc()
 
 
+# 워커 풀 대기열 길이 기록
+def record_worker_queue_depth(pool, depth):
+    """워커 풀 대기열 길이 기록"""
+    metrics.worker_queue_depth.labels(pool=pool).set(depth)
+
+
+# 워커 풀 대기 시간 기록
+def record_worker_wait_time(pool, wait_seconds):
+    """작업이 대기열에서 기다린 시간 기록"""
+    metrics.worker_wait_time.labels(pool=pool).observe(wait_seconds)
+
+
+# 워커 풀 거절/폐기 기록
+def record_worker_rejected(pool, reason):
+    """대기열 초과로 거절되거나 폐기된 작업 기록"""
+    metrics.worker_rejected.labels(pool=pool, reason=reason).inc()
+
+
+# 생략된 번역 기록
+def record_translation_skipped(direction):
+    """로컬 언어 감지로 DeepL 호출을 생략한 횟수 기록"""
+    metrics.translation_skipped.labels(direction=direction).inc()
+
+
+# 번역 캐시 조회 기록
+def record_translation_cache(tier, result):
+    """번역 캐시 계층별 hit/miss 기록"""
+    metrics.translation_cache.labels(tier=tier, result=result).inc()
+
+
+# 임베딩 캐시 조회 기록
+def record_embedding_cache(tier, result, count=1):
+    """임베딩 캐시 계층별 hit/miss 기록"""
+    if count:
+        metrics.embedding_cache.labels(tier=tier, result=result).inc(count)
+
+
+# 임베딩 배치 기록
+def record_embedding_batch(size, fill_ratio, wait_seconds):
+    """임베딩 배치 크기, 채움 비율, 대기 시간 기록"""
+    metrics.embedding_batch_size.observe(size)
+    metrics.embedding_batch_fill_ratio.observe(fill_ratio)
+    metrics.embedding_batch_wait.observe(wait_seconds)
+
+
+# 캐시 예열 진행률 기록
+def record_cache_warmup(source, processed, total, seeded=0, skipped=0):
+    """캐시 예열 진행률과 저장/건너뛴 항목 수 기록"""
+    metrics.cache_warmup_progress.labels(source=source).set(
+        processed / total if total else 1.0
+    )
+    if seeded:
+        metrics.cache_warmup_entries.labels(source=source, result="seeded").inc(seeded)
+    if skipped:
+        metrics.cache_warmup_entries.labels(source=source, result="skipped").inc(
+            skipped
+        )
+
+
+# 동일 질문 합치기 기록
+def record_single_flight(role):
+    """동일 질문 합치기 역할 기록 (leader, local_follower, remote_follower, fallback)"""
+    metrics.single_flight.labels(role=role).inc()
+
+
+# 의미 캐시 조회 결과 기록
+def record_semantic_cache_lookup(label_type, lang, result, similarity):
+    """의미 캐시 조회 결과(hit, near_miss, miss)와 최고 유사도 기록"""
+    metrics.semantic_cache_lookups.labels(
+        label=label_type, lang=lang, result=result
+    ).inc()
+    if similarity > 0:
+        metrics.semantic_cache_similarity.labels(label=label_type).observe(similarity)
+
+
+# 의미 캐시 계층별 결과 기록
+def record_semantic_cache_tier(tier, result):
+    """의미 캐시 계층별 hit/stale 기록 (exact, l1, redis)"""
+    metrics.semantic_cache_tier.labels(tier=tier, result=result).inc()
+
+
+# 의미 캐시 사용량 기록
+def record_semantic_cache_usage(
+    entries, cache_memory, used_memory, max_memory, bytes_per_entry, evicted_keys
+):
+    """의미 캐시 항목 수, 메모리 사용량(캐시 추정치, 인스턴스 전체), 제거된 키 수 기록"""
+    metrics.semantic_cache_entries.set(entries)
+    metrics.semantic_cache_memory.labels(kind="used").set(cache_memory)
+    metrics.semantic_cache_memory.labels(kind="instance_used").set(used_memory)
+    metrics.semantic_cache_memory.labels(kind="max").set(max_memory)
+    metrics.semantic_cache_memory.labels(kind="per_entry").set(bytes_per_entry)
+    metrics.semantic_cache_evicted_keys.set(evicted_keys)
+
+
+# 의미 캐시 입장 정책 결과 기록
+def record_semantic_cache_admission(result, count=1):
+    """의미 캐시 입장 정책 결과 기록 (admitted, rejected)"""
+    if count:
+        metrics.semantic_cache_admission.labels(result=result).inc(count)
+
+
+# 검색 결과 캐시 조회 기록
+def record_retrieval_cache(collection, tier, result):
+    """Qdrant 검색 결과 캐시 계층별 hit/miss 기록"""
+    metrics.retrieval_cache.labels(collection=collection, tier=tier, result=result).inc()
+
+
 ### 프로메테우스 쿼리 함수 ###
 def query_prometheus(query):
     """프로메테우스 API를 통한 쿼리 실행"""
@@ -435,3 +542,48 @@ def get_week_response():
     except Exception as e:
         logging.error(f"주간 응답 통계 오류: {e}")
         return {"values": [0] * 7}
+
+
+# 의미 캐시 적중률과 유사도 분포
+def get_semantic_cache_stats():
+    """의미 캐시 라벨/언어별 적중률과 최고 유사도 분포"""
+    try:
+        result = query_prometheus(
+            "sum by (label, lang, result) (chatbot_semantic_cache_total)"
+        ) or []
+        groups = {}
+        for item in result:
+            metric = item["metric"]
+            key = (metric.get("label", "unknown"), metric.get("lang", "unknown"))
+            counts = groups.setdefault(key, {"hit": 0, "near_miss": 0, "miss": 0})
+            counts[metric.get("result", "miss")] = int(float(item["value"][1]))
+
+        hit_rate = []
+        for (label, lang), counts in sorted(groups.items()):
+            total = sum(counts.values())
+            hit_rate.append(
+                {
+                    "label": label,
+                    "lang": lang,
+                    **counts,
+                    "total": total,
+                    "hit_rate": round(counts["hit"] / total * 100, 2) if total else 0,
+                }
+            )
+
+        # 누적 히스토그램 (le 이하 유사도의 조회 수)
+        buckets = query_prometheus(
+            "sum by (le) (chatbot_semantic_cache_similarity_bucket)"
+        ) or []
+        similarity = sorted(
+            (
+                {"le": item["metric"]["le"], "count": int(float(item["value"][1]))}
+                for item in buckets
+            ),
+            key=lambda bucket: float(bucket["le"]),
+        )
+
+        return {"hit_rate": hit_rate, "similarity": similarity}
+    except Exception as e:
+        logging.error(f"의미 캐시 통계 오류: {e}")
+        return {"hit_rate": [], "similarity": []}
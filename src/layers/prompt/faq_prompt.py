@@ -2,6 +2,7 @@ import logging
 
 from src.utils.tools.embedding import vectorize
 from src.utils.database.connect_qdrant import init_qdrant
+from src.utils.database.retrieval_cache import cached_search
 
 QDRANT_COLLECTION = "faq-vectors"
 SIMILARITY_THRESHOLD = 0.78
@@ -11,22 +12,25 @@ qdrant_client = init_qdrant(QDRANT_COLLECTION)
 
 
 # 사용자 질문을 받아 벡터화 후 FAQ와 유사도 비교하여 적합한 답변 반환
-def find_faq_answer(user_question: str, return_top_n: int = 3):
+# query_vector: 요청 컨텍스트에서 이미 계산된 임베딩 (없으면 새로 계산)
+def find_faq_answer(user_question: str, return_top_n: int = 3, query_vector=None):
     try:
         # 사용자 질문 벡터화
         logging.info(f"검색 질문: {user_question}")
-        query_vector = vectorize(user_question)
+        if query_vector is None:
+            query_vector = vectorize(user_question)
 
-        if not query_vector:
+        if query_vector is None or len(query_vector) == 0:
             logging.error("텍스트를 벡터로 변환하는 데 실패했습니다.")
             return {"status": "error", "message": "질문 처리 중 오류가 발생했습니다."}
 
-        # Qdrant 검색
-        search_results = qdrant_client.search(
-            collection_name=QDRANT_COLLECTION,
-            query_vector=query_vector,
-            limit=return_top_n,
-            with_payload=True,
+        # Qdrant 검색 (임계값 미만 결과는 짧게만 캐시)
+        search_results = cached_search(
+            qdrant_client,
+            QDRANT_COLLECTION,
+            query_vector,
+            return_top_n,
+            negative_below=SIMILARITY_THRESHOLD,
         )
 
         if not search_results:
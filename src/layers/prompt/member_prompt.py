@@ -1,5 +1,6 @@
 from src.utils.database.member_vector import vectorize
 from src.utils.database.connect_qdrant import init_qdrant
+from src.utils.database.retrieval_cache import cached_search
 
 # 환경 변수 설정
 QDRANT_COLLECTION = "member_vectors"
@@ -7,16 +8,16 @@ qdrant_client = None
 
 
 # Qdrant에서 유저 검색
-def search_vec(text):
+def search_vec(text, query_vector=None):
     global qdrant_client
     # Qdrant에서 값 가져오기
-    vec = vectorize(text)
+    vec = query_vector if query_vector is not None else vectorize(text)
 
     if qdrant_client is None:
         qdrant_client = init_qdrant(QDRANT_COLLECTION)
 
-    search_result = qdrant_client.search(
-        collection_name=QDRANT_COLLECTION, query_vector=vec, limit=5
+    search_result = cached_search(
+        qdrant_client, QDRANT_COLLECTION, vec, 5, negative_below=0.5
     )
 
     # 결과 값에 대해서 정확도 필드 추가 및 confidence 0.5 이상만 필터링
@@ -34,8 +35,8 @@ def search_vec(text):
 
 
 # 프롬프트 생성 함수
-def make_prompt(prompt):
-    search_result = search_vec(prompt)
+def make_prompt(prompt, query_vector=None):
+    search_result = search_vec(prompt, query_vector)
     template = f"""You are a company HR representative.
 
 INSTRUCTIONS:
@@ -1,6 +1,8 @@
 from src.utils.tools.embedding import vectorize
 from src.utils.database.connect_qdrant import init_qdrant
 from src.utils.database.connect_mysql import init_mysql
+from src.utils.database.retrieval_cache import cached_search
+from src.utils.tools.lru_cache import LRUCache
 import pandas as pd
 import logging
 import os
@@ -9,6 +11,13 @@ import os
 qdrant_client = init_qdrant("internal_documents")
 qdrant_client = init_qdrant("meeting_vectors")
 
+# 사용자별 부서 ID 캐시 (캐시 조회마다 MySQL을 거치지 않도록 짧게 보관, 부서 없음은 "")
+DEPARTMENT_CACHE_SIZE = int(os.getenv("DEPARTMENT_CACHE_SIZE", 4096))
+DEPARTMENT_CACHE_TTL = int(os.getenv("DEPARTMENT_CACHE_TTL", 300))
+department_cache = LRUCache(
+    max_size=DEPARTMENT_CACHE_SIZE, ttl_seconds=DEPARTMENT_CACHE_TTL
+)
+
 
 def search_authority(user_id):
     conn = init_mysql()
@@ -26,9 +35,33 @@ def search_authority(user_id):
         conn.close()
 
 
-def search_internal_documents(question, user_id, auth):
-    # 질문 임베딩 생성
-    question_vector = vectorize(question)
+# 사용자의 부서 ID (없거나 조회 실패 시 None, 조회 실패는 캐시하지 않음)
+def search_department(user_id):
+    cached = department_cache.get(user_id)
+    if cached is not None:
+        return cached or None
+
+    conn = init_mysql()
+    try:
+        sql = "SELECT department_id FROM users WHERE user_id = %s;"
+        df = pd.read_sql(sql, conn, params=(user_id,))
+        if df.empty or pd.isna(df["department_id"].iloc[0]):
+            department = ""
+        else:
+            department = str(df["department_id"].iloc[0])
+    except Exception as e:
+        logging.error(f"MySQL 데이터 로드 실패: {e}")
+        return None
+    finally:
+        conn.close()
+
+    department_cache.set(user_id, department)
+    return department or None
+
+
+def search_internal_documents(question, user_id, auth, query_vector=None):
+    # 질문 임베딩 생성 (요청 컨텍스트에서 계산된 값이 있으면 재사용)
+    question_vector = query_vector if query_vector is not None else vectorize(question)
     collections = ["internal_documents", "meeting_vectors"]  # mp3 형태도 포함
 
     file_name = search_authority(user_id)
@@ -48,12 +81,13 @@ def search_internal_documents(question, user_id, auth):
     result = []
     # Qdrant에서 유사한 청크 검색
     for collection in collections:
-        search_result = qdrant_client.search(
-            collection_name=collection,
-            query_vector=question_vector,
-            limit=4,
+        search_result = cached_search(
+            qdrant_client,
+            collection,
+            question_vector,
+            4,
             query_filter=filter_param,
-            with_payload=True,
+            negative_below=0.5,
         )
     # 결과 값에 대해서 정확도 필드 추가 및 confidence 0.5 이상만 필터링
     filter = [hit.payload for hit in search_result if hit.score >= 0.5]
@@ -65,9 +99,9 @@ def search_internal_documents(question, user_id, auth):
 
 
 # 프롬프트 생성 함수
-def build_prompt(question, user_id, auth=True):
+def build_prompt(question, user_id, auth=True, query_vector=None):
     # 질문과 유사도가 높은 문서
-    result = search_internal_documents(question, user_id, auth)
+    result = search_internal_documents(question, user_id, auth, query_vector)
     if not result:
         logging.error("관련 문서를 찾을 수 없습니다.")
         return "**No related data available. Please inform the user politely.**"
@@ -1,6 +1,7 @@
 import logging
 
 from src.utils.database.connect_qdrant import init_qdrant
+from src.utils.database.retrieval_cache import cached_search
 from src.utils.tools.embedding import vectorize
 
 # 환경설정 및 클라이언트 설정
@@ -12,16 +13,18 @@ qdrant_client = init_qdrant(QDRANT_COLLECTION)
 
 
 # 템플릿 유사도 검색 함수
-def find_similar_template(query: str):
+def find_similar_template(query: str, query_vector=None):
     try:
         logging.info(f"검색 쿼리: {query}")
-        query_vector = vectorize(query)
-
-        search_results = qdrant_client.search(
-            collection_name=QDRANT_COLLECTION,
-            query_vector=query_vector,
-            limit=1,
-            with_payload=True,
+        if query_vector is None:
+            query_vector = vectorize(query)
+
+        search_results = cached_search(
+            qdrant_client,
+            QDRANT_COLLECTION,
+            query_vector,
+            1,
+            negative_below=SIMILARITY_THRESHOLD,
         )
 
         if not search_results:
@@ -57,9 +60,9 @@ def find_similar_template(query: str):
 
 
 # 템플릿 프롬프트 생성 함수
-def make_prompt(query: str):
+def make_prompt(query: str, query_vector=None):
     # 템플릿 검색
-    finded = find_similar_template(query)
+    finded = find_similar_template(query, query_vector)
     matched_template = (
         finded["matched_template"] if finded.get("status") == "success" else None
     )
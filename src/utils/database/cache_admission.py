@@ -0,0 +1,77 @@
+import os
+import time
+import hashlib
+import logging
+
+import src.layers.monitoring.monitoring as monitoring
+import src.utils.database.connect_redis as connect_redis
+from src.utils.database.redis_caching import make_doc_id
+
+# 의미 캐시 입장 정책 (TinyLFU 방식)
+# 질문 빈도를 Redis의 count-min sketch로 근사하고, 충분히 반복된 질문만 캐시에 저장
+# 시간 창(window)마다 새 sketch를 쓰고 직전 창과 합산하므로 오래된 빈도는 자연히 사라짐
+CACHE_ADMISSION_MIN_COUNT = int(os.getenv("CACHE_ADMISSION_MIN_COUNT", 2))
+CACHE_ADMISSION_WINDOW = int(os.getenv("CACHE_ADMISSION_WINDOW", 86400))
+SKETCH_DEPTH = 4
+SKETCH_WIDTH = int(os.getenv("CACHE_ADMISSION_SKETCH_WIDTH", 65536))
+SKETCH_PREFIX = "cache:admission:"
+DB_PORT = 0
+
+# 빈도 기록용 Redis (연결 실패 시 모든 항목을 저장)
+try:
+    redis_client = connect_redis.get_redis_client(DB_PORT)
+except Exception as e:
+    logging.warning(f"캐시 입장 정책 Redis 연결 실패, 모든 항목을 저장합니다: {e}")
+    redis_client = None
+
+
+# 질문의 sketch 위치 (행마다 다른 해시)
+def _cells(question: str) -> list:
+    doc_id = make_doc_id(question)
+    cells = []
+    for row in range(SKETCH_DEPTH):
+        digest = hashlib.blake2b(
+            f"{row}:{doc_id}".encode("utf-8"), digest_size=8
+        ).digest()
+        cells.append(f"{row}:{int.from_bytes(digest, 'little') % SKETCH_WIDTH}")
+    return cells
+
+
+# 질문 빈도를 기록하고 캐시 저장 여부 반환 (questions와 같은 순서)
+# 현재 창과 직전 창의 추정 빈도 합이 CACHE_ADMISSION_MIN_COUNT 이상이면 저장
+def admit(questions) -> list:
+    if not questions:
+        return []
+    if CACHE_ADMISSION_MIN_COUNT <= 1 or redis_client is None:
+        return [True] * len(questions)
+
+    window = int(time.time() // CACHE_ADMISSION_WINDOW)
+    current_key = f"{SKETCH_PREFIX}{window}"
+    previous_key = f"{SKETCH_PREFIX}{window - 1}"
+    cells = [_cells(question) for question in questions]
+
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        for question_cells in cells:
+            for cell in question_cells:
+                pipe.hincrby(current_key, cell, 1)
+            pipe.hmget(previous_key, question_cells)
+        pipe.expire(current_key, CACHE_ADMISSION_WINDOW * 2)
+        results = pipe.execute()
+    except Exception as e:
+        logging.warning(f"캐시 입장 빈도 기록 실패, 모두 저장합니다: {e}")
+        return [True] * len(questions)
+
+    admitted = []
+    step = SKETCH_DEPTH + 1
+    for i in range(len(questions)):
+        current = results[i * step : i * step + SKETCH_DEPTH]
+        previous = results[i * step + SKETCH_DEPTH]
+        estimate = min(count + int(prev or 0) for count, prev in zip(current, previous))
+        admitted.append(estimate >= CACHE_ADMISSION_MIN_COUNT)
+
+    monitoring.record_semantic_cache_admission("admitted", sum(admitted))
+    monitoring.record_semantic_cache_admission(
+        "rejected", len(admitted) - sum(admitted)
+    )
+    return admitted
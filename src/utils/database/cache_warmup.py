@@ -0,0 +1,108 @@
+import os
+import time
+import logging
+import threading
+
+import src.layers.monitoring.monitoring as monitoring
+import src.utils.database.redis_caching as redis_caching
+
+# 캐시 예열 설정
+WARMUP_RATE = float(os.getenv("CACHE_WARMUP_RATE", 50))  # 초당 저장 항목 수
+WARMUP_BATCH_SIZE = int(os.getenv("CACHE_WARMUP_BATCH_SIZE", 20))
+WARMUP_HOT_QUESTIONS = int(os.getenv("CACHE_WARMUP_HOT_QUESTIONS", 500))
+WARMUP_HOT_DAYS = int(os.getenv("CACHE_WARMUP_HOT_DAYS", 7))
+
+_running = threading.Lock()
+
+
+# 최근 자주 나온 질문 (답변은 살아 있는 캐시 항목에서 가져오고, 벡터는 임베딩 캐시에서 조회)
+# 라벨별 TTL로 다시 저장해 자주 나오는 질문이 만료 직전에 빠지지 않도록 유지
+def frequent_entries() -> list:
+    frequent = redis_caching.get_frequent_questions(
+        WARMUP_HOT_QUESTIONS, WARMUP_HOT_DAYS
+    )
+    return [
+        entry._replace(ttl_sec=redis_caching.cache_ttl(entry.label, entry.versions))
+        for entry, _ in frequent
+    ]
+
+
+SOURCES = {
+    "frequent": frequent_entries,
+}
+# 이미 있는 항목도 다시 저장하는 소스 (TTL 갱신)
+REFRESH_SOURCES = {"frequent"}
+
+
+# 한 소스의 항목을 속도 제한을 지키며 캐시에 저장 (REFRESH_SOURCES가 아니면 이미 있는 항목은 건너뜀)
+def _seed(source, entries) -> int:
+    total = len(entries)
+    seeded = 0
+    monitoring.record_cache_warmup(source, 0, total)
+
+    for start in range(0, total, WARMUP_BATCH_SIZE):
+        started_at = time.monotonic()
+        batch = entries[start : start + WARMUP_BATCH_SIZE]
+
+        if source in REFRESH_SOURCES:
+            exists = [False] * len(batch)
+        else:
+            exists = redis_caching.cache_exists(batch)
+        new_entries = [entry for entry, hit in zip(batch, exists) if not hit]
+        if new_entries:
+            redis_caching.add_cache_batch(new_entries, log_questions=False)
+        seeded += len(new_entries)
+
+        processed = start + len(batch)
+        monitoring.record_cache_warmup(
+            source,
+            processed,
+            total,
+            seeded=len(new_entries),
+            skipped=len(batch) - len(new_entries),
+        )
+        logging.info(f"캐시 예열 [{source}] {processed}/{total} (저장 {seeded}건)")
+
+        # 초당 WARMUP_RATE건을 넘지 않도록 대기
+        if WARMUP_RATE > 0:
+            delay = len(batch) / WARMUP_RATE - (time.monotonic() - started_at)
+            if delay > 0:
+                time.sleep(delay)
+
+    return seeded
+
+
+# 캐시 예열 실행 (동시에 한 번만 실행)
+def run_warmup(sources=tuple(SOURCES)) -> dict:
+    if not _running.acquire(blocking=False):
+        logging.info("캐시 예열이 이미 진행 중입니다.")
+        return {}
+
+    results = {}
+    try:
+        for source in sources:
+            try:
+                results[source] = _seed(source, SOURCES[source]())
+            except Exception as e:
+                logging.error(f"캐시 예열 실패 [{source}]: {e}")
+                results[source] = 0
+        logging.info(f"캐시 예열 완료: {results}")
+        return results
+    finally:
+        _running.release()
+
+
+# 백그라운드 스레드에서 캐시 예열 시작
+def start_warmup(sources=tuple(SOURCES)) -> threading.Thread:
+    thread = threading.Thread(
+        target=run_warmup, args=(sources,), name="cache-warmup", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    print(run_warmup())
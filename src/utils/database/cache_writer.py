@@ -0,0 +1,133 @@
+import os
+import time
+import atexit
+import logging
+import threading
+from collections import deque
+
+import src.layers.monitoring.monitoring as monitoring
+import src.utils.database.redis_caching as redis_caching
+import src.utils.database.cache_admission as cache_admission
+
+# 쓰기 지연(write-behind) 설정
+CACHE_WRITE_QUEUE_SIZE = int(os.getenv("CACHE_WRITE_QUEUE_SIZE", 1000))
+CACHE_WRITE_BATCH_SIZE = int(os.getenv("CACHE_WRITE_BATCH_SIZE", 32))
+CACHE_WRITE_FLUSH_MS = float(os.getenv("CACHE_WRITE_FLUSH_MS", 50))
+# drop_oldest: 가장 오래된 항목을 버리고 추가, drop_newest: 새 항목을 버림
+CACHE_WRITE_DROP_POLICY = os.getenv("CACHE_WRITE_DROP_POLICY", "drop_oldest")
+CACHE_WRITE_DRAIN_TIMEOUT = float(os.getenv("CACHE_WRITE_DRAIN_TIMEOUT", 10))
+
+
+# 의미 캐시 쓰기를 백그라운드에서 모아 처리
+# 응답 전송 경로에서는 대기열에 넣기만 하고, 임베딩과 Redis 저장은 배치로 수행
+class CacheWriteBehind:
+    name = "cache_write"
+
+    def __init__(
+        self,
+        max_pending: int = CACHE_WRITE_QUEUE_SIZE,
+        batch_size: int = CACHE_WRITE_BATCH_SIZE,
+        flush_ms: float = CACHE_WRITE_FLUSH_MS,
+        drop_policy: str = CACHE_WRITE_DROP_POLICY,
+    ):
+        self.max_pending = max(1, max_pending)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.0, flush_ms) / 1000
+        self.drop_policy = drop_policy
+        self._pending = deque()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._closed = False
+
+    def pending(self) -> int:
+        return len(self._pending)
+
+    # 캐시 쓰기 등록 (대기열이 가득 차면 정책에 따라 폐기, 등록 여부 반환)
+    # kwargs: redis_caching.CacheEntry의 나머지 필드 (ttl_sec, vector, versions, label, scope)
+    def submit(self, question, answer, url_data=None, **kwargs) -> bool:
+        entry = redis_caching.CacheEntry(question, answer, url_data, **kwargs)
+        with self._cond:
+            if self._closed:
+                monitoring.record_worker_rejected(self.name, "shutdown")
+                return False
+
+            if len(self._pending) >= self.max_pending:
+                if self.drop_policy == "drop_newest":
+                    monitoring.record_worker_rejected(self.name, "drop_newest")
+                    return False
+                self._pending.popleft()
+                monitoring.record_worker_rejected(self.name, "drop_oldest")
+
+            self._pending.append(entry)
+            monitoring.record_worker_queue_depth(self.name, len(self._pending))
+            self._cond.notify()
+
+        self._ensure_started()
+        return True
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._cond:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="cache-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+
+                # 배치가 찰 때까지 최대 flush_interval 동안 대기
+                deadline = time.monotonic() + self.flush_interval
+                while len(self._pending) < self.batch_size and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                count = min(self.batch_size, len(self._pending))
+                batch = [self._pending.popleft() for _ in range(count)]
+                monitoring.record_worker_queue_depth(self.name, len(self._pending))
+
+            try:
+                # 여러 번 나온 질문만 저장 (한 번뿐인 질문이 자주 쓰는 항목을 밀어내지 않도록)
+                admitted = cache_admission.admit([entry.question for entry in batch])
+                batch = [entry for entry, ok in zip(batch, admitted) if ok]
+                if batch:
+                    redis_caching.add_cache_batch(batch)
+            except Exception as e:
+                logging.error(f"캐시 쓰기 배치 실패 ({len(batch)}건): {e}")
+
+    # 남은 항목을 저장하고 종료 (여러 번 호출해도 안전)
+    def drain(self, timeout: float = CACHE_WRITE_DRAIN_TIMEOUT):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                logging.warning(
+                    f"캐시 쓰기 대기열 정리 시간 초과: {self.pending()}건 남음"
+                )
+
+
+writer = CacheWriteBehind()
+
+
+# 캐시 쓰기 등록
+def submit(question, answer, url_data=None, **kwargs) -> bool:
+    return writer.submit(question, answer, url_data, **kwargs)
+
+
+# 종료 시 남은 캐시 쓰기 처리
+def drain(timeout: float = CACHE_WRITE_DRAIN_TIMEOUT):
+    writer.drain(timeout)
+
+
+atexit.register(drain)
@@ -4,6 +4,8 @@ from dotenv import load_dotenv
 import logging
 import os
 
+from src.utils.tools.embedding_provider import get_provider
+
 
 env_path = os.path.join(os.path.dirname(__file__), "..", "..", "..", ".env")
 load_dotenv(dotenv_path=os.path.abspath(env_path))
@@ -20,14 +22,22 @@ def init_qdrant(collection_name):
     collections = qdrant_client.get_collections().collections
     collections = [c.name for c in collections]
 
+    # 벡터 차원은 임베딩 백엔드를 따름
+    dim = get_provider().dim
+
     if collection_name not in collections:
         qdrant_client.create_collection(
             collection_name=collection_name,
-            vectors_config=VectorParams(size=768, distance=Distance.COSINE),
+            vectors_config=VectorParams(size=dim, distance=Distance.COSINE),
         )
         logging.info(f"'{collection_name}' 컬렉션을 생성했습니다.")
     else:
         logging.info(f"'{collection_name}' 컬렉션이 이미 존재합니다.")
+        size = qdrant_client.get_collection(collection_name).config.params.vectors.size
+        if size != dim:
+            logging.warning(
+                f"'{collection_name}' 컬렉션 차원({size})이 임베딩 차원({dim})과 다릅니다. 컬렉션을 재생성하세요."
+            )
 
     return qdrant_client
 
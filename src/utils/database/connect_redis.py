@@ -12,13 +12,15 @@ REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
 
 
 # Redis 클라이언트 초기화 및 설정
-def get_redis_client(db_port):
+# decode_responses=False: 벡터 등 바이너리 값을 그대로 다룰 때 사용
+# host/port: 기본 인스턴스가 아닌 별도 Redis를 사용할 때 지정
+def get_redis_client(db_port, decode_responses=True, host=None, port=None):
     redis_client = redis.Redis(
-        host=REDIS_HOST,
-        port=REDIS_PORT,
+        host=host or REDIS_HOST,
+        port=port or REDIS_PORT,
         db=db_port,
         password=REDIS_PASSWORD,
-        decode_responses=True,
+        decode_responses=decode_responses,
         socket_connect_timeout=5,
         socket_timeout=5,
     )
@@ -0,0 +1,135 @@
+import os
+import time
+import uuid
+import logging
+import threading
+
+import src.utils.database.connect_redis as connect_redis
+
+# 원본 데이터 버전 관리
+# Qdrant 컬렉션별 버전 번호를 Redis 해시에 보관하고, 동기화/적재 작업이 버전을 올림
+# 의미 캐시 항목은 답변을 만들 때의 버전을 함께 저장하므로 버전이 바뀌면 오래된 항목이 됨
+# 캐시와 같은 Redis를 쓰므로 해시가 메모리 정책으로 제거될 수 있음
+# 해시를 처음 만들 때 epoch 값을 함께 기록하고 모든 버전 기록에 포함해,
+# 해시가 사라진 뒤 카운터가 1부터 다시 시작해도 이전 기록이 현재 버전으로 취급되지 않게 함
+DATA_VERSION_KEY = "data:versions"
+EPOCH_FIELD = "_epoch"
+DATA_VERSION_CHECK_INTERVAL = float(os.getenv("DATA_VERSION_CHECK_INTERVAL", 5))
+DB_PORT = 0
+
+# 라벨별로 답변이 의존하는 컬렉션
+LABEL_COLLECTIONS = {
+    "__label__org_chart": ("member_vectors",),
+    "__label__form_request": ("template_vectors",),
+    "__label__internal_info": (
+        "faq-vectors",
+        "internal_documents",
+        "meeting_vectors",
+    ),
+}
+
+# 버전 저장용 Redis (연결 실패 시 모든 버전을 0으로 취급)
+try:
+    redis_client = connect_redis.get_redis_client(DB_PORT)
+except Exception as e:
+    logging.warning(f"데이터 버전 Redis 연결 실패: {e}")
+    redis_client = None
+
+_versions = {}
+_epoch = ""
+_checked_at = float("-inf")
+_lock = threading.Lock()
+
+
+# 현재 컬렉션별 버전 (DATA_VERSION_CHECK_INTERVAL 동안은 로컬 값 사용)
+def current() -> dict:
+    _refresh()
+    return _versions
+
+
+# 현재 버전 해시의 epoch (해시가 없으면 빈 문자열)
+def epoch() -> str:
+    _refresh()
+    return _epoch
+
+
+def _refresh() -> None:
+    global _versions, _epoch, _checked_at
+    now = time.monotonic()
+    if redis_client is None or now - _checked_at < DATA_VERSION_CHECK_INTERVAL:
+        return
+
+    with _lock:
+        if now - _checked_at < DATA_VERSION_CHECK_INTERVAL:
+            return
+        try:
+            raw = redis_client.hgetall(DATA_VERSION_KEY)
+            _epoch = raw.pop(EPOCH_FIELD, "")
+            _versions = {name: int(version) for name, version in raw.items()}
+        except Exception as e:
+            logging.warning(f"데이터 버전 조회 실패: {e}")
+        _checked_at = now
+
+
+# 컬렉션 데이터가 바뀌었음을 기록 (새 버전 반환, 실패 시 None)
+# 해시가 없으면 새 epoch로 만들어지므로 이전 기록은 모두 오래된 것이 됨
+def bump(collection: str):
+    global _versions, _epoch, _checked_at
+    if redis_client is None:
+        return None
+    try:
+        pipe = redis_client.pipeline(transaction=True)
+        pipe.hsetnx(DATA_VERSION_KEY, EPOCH_FIELD, uuid.uuid4().hex)
+        pipe.hincrby(DATA_VERSION_KEY, collection, 1)
+        pipe.hget(DATA_VERSION_KEY, EPOCH_FIELD)
+        _, version, epoch_value = pipe.execute()
+    except Exception as e:
+        logging.error(f"데이터 버전 갱신 실패 [{collection}]: {e}")
+        return None
+
+    with _lock:
+        if epoch_value != _epoch:
+            # 해시가 새로 만들어졌으면 다른 컬렉션 버전도 다시 읽도록 함
+            _checked_at = float("-inf")
+        _epoch = epoch_value
+        _versions = {**_versions, collection: version}
+    logging.info(f"데이터 버전 갱신 [{collection}] -> {version}")
+    return version
+
+
+# 라벨의 답변이 의존하는 컬렉션
+def collections_for_label(label: str) -> tuple:
+    return LABEL_COLLECTIONS.get(label, ())
+
+
+# 컬렉션 하나의 현재 버전 문자열 ("<epoch>.<버전>", 캐시 키 등에 사용)
+def collection_version(collection: str) -> str:
+    return f"{epoch()}.{current().get(collection, 0)}"
+
+
+# 컬렉션들의 현재 버전을 문자열로 기록 ("_epoch=...,faq-vectors=3,internal_documents=1")
+# 의존하는 컬렉션이 없으면 빈 문자열
+def stamp(collections) -> str:
+    collections = sorted(set(collections))
+    if not collections:
+        return ""
+    versions = current()
+    return ",".join(
+        [f"{EPOCH_FIELD}={epoch()}"]
+        + [f"{collection}={versions.get(collection, 0)}" for collection in collections]
+    )
+
+
+# 기록된 버전이 모두 현재 버전과 같은지 여부 (빈 값은 항상 유효)
+# epoch가 없거나 다르면 버전 해시가 다시 만들어진 것이므로 오래된 기록
+def is_current(version_stamp) -> bool:
+    if not version_stamp:
+        return True
+    versions = current()
+    parts = dict(part.partition("=")[::2] for part in version_stamp.split(","))
+    if parts.pop(EPOCH_FIELD, None) != epoch():
+        return False
+    for collection, version in parts.items():
+        if versions.get(collection, 0) != int(version or 0):
+            return False
+    return True
@@ -11,10 +11,10 @@ from src.layers.LLM.bedrock_model import call_image_ocr
 from io import BytesIO
 from docx import Document
 from dotenv import load_dotenv
-from qdrant_client.models import PointStruct
 from src.utils.database.connect_qdrant import init_qdrant
 
 from src.utils.tools.embedding import vectorize
+import src.utils.database.data_version as data_version
 
 
 # 환경 변수 설정
@@ -35,13 +35,28 @@ def save_data(file_name, ori, vector):
     # Qdrant 클라이언트 lazy initialization (이중 체크)
     if qdrant_client is None:
         qdrant_client = init_qdrant(QDRANT_COLLECTION)
-    point_id = str(uuid.uuid4())
-    points = [
-        PointStruct(
-            id=point_id, vector=vector, payload={"text": ori, "file_name": file_name}
-        )
-    ]
-    qdrant_client.upsert(collection_name=QDRANT_COLLECTION, points=points)
+    # 벡터 배열을 리스트로 바꾸지 않고 (1, dim) 뷰로 그대로 전달
+    qdrant_client.upload_collection(
+        collection_name=QDRANT_COLLECTION,
+        vectors=vector.reshape(1, -1),
+        payload=[{"text": ori, "file_name": file_name}],
+        ids=[str(uuid.uuid4())],
+        wait=True,
+    )
+
+
+# Qdrant에 여러 청크 저장 (vectors: (n, dim) float32 행렬)
+def save_batch(file_name, chunks, vectors):
+    global qdrant_client
+    if qdrant_client is None:
+        qdrant_client = init_qdrant(QDRANT_COLLECTION)
+    qdrant_client.upload_collection(
+        collection_name=QDRANT_COLLECTION,
+        vectors=vectors,
+        payload=[{"text": chunk, "file_name": file_name} for chunk in chunks],
+        ids=[str(uuid.uuid4()) for _ in chunks],
+        wait=True,
+    )
 
 
 ##########################################################################
@@ -292,14 +307,21 @@ def process_and_store(file_info):
         return
 
     logging.info(f"[{document.upper()}] 청크 개수: {len(chunks)}")
+    valid_chunks = []
     for i, chunk in enumerate(chunks):
         if not chunk.strip():
             logging.warning(f"빈 청크 발견, 벡터화 및 저장을 건너뜁니다. (index: {i})")
             continue
         logging.info(f"--- 청크 {i+1} ---\n{chunk}\n")
-        # 임베딩 및 Qdrant 저장
-        vector = vectorize(chunk)
-        save_data(file_name, chunk, vector)
+        valid_chunks.append(chunk)
+
+    # 임베딩 (한 번의 배치 호출) 및 Qdrant 저장
+    if valid_chunks:
+        vectors = vectorize(valid_chunks)
+        save_batch(file_name, valid_chunks, vectors)
+
+        # 문서가 추가되었으므로 사내 정보 캐시 답변은 무효
+        data_version.bump(QDRANT_COLLECTION)
 
 
 if __name__ == "__main__":
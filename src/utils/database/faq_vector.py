@@ -1,10 +1,10 @@
 import logging
 import pandas as pd
-from qdrant_client.models import PointStruct
 
 from src.utils.database.connect_qdrant import init_qdrant, reset_collection
 from src.utils.database.connect_mysql import init_mysql
 from src.utils.tools.embedding import vectorize
+import src.utils.database.data_version as data_version
 
 QDRANT_COLLECTION = "faq-vectors"
 qdrant_client = init_qdrant(QDRANT_COLLECTION)
@@ -37,37 +37,42 @@ def upsert_faq():
         print("데이터 로드에 실패하여 작업을 중단합니다.")
         return
 
-    points = []
-    for idx, row in faq_data.iterrows():
-        try:
-            question = row["question"]
-            print(f"  - {idx}번 질문 벡터화 중: {question[:30]}...")
-
-            vector = vectorize(question)
-
-            point = PointStruct(
-                id=idx,
-                vector=vector,
-                payload={
-                    "faq_id": idx,
-                    "question": question,
-                    "answer": row["answer"],
-                    "category": row["category"],
-                },
-            )
-            points.append(point)
-
-        except Exception as e:
-            logging.error(f"질문 {idx} 처리 중 오류: {e}")
-            continue
-
-    if points:
-        qdrant_client.upsert(
-            collection_name=QDRANT_COLLECTION, points=points, wait=True
-        )
-        logging.info(f"Qdrant에 {len(points)}개의 FAQ 벡터 저장을 완료했습니다.")
-    else:
+    if faq_data.empty:
         logging.error("저장할 벡터가 없습니다.")
+        return
+
+    ids = faq_data.index.tolist()
+    payloads = [
+        {
+            "faq_id": idx,
+            "question": question,
+            "answer": answer,
+            "category": category,
+        }
+        for idx, question, answer, category in zip(
+            ids, faq_data["question"], faq_data["answer"], faq_data["category"]
+        )
+    ]
+
+    try:
+        # 전체 질문을 한 번에 벡터화 ((n, dim) float32 행렬)
+        print(f"  - {len(ids)}개 질문 벡터화 중...")
+        vectors = vectorize(faq_data["question"].tolist())
+
+        # 행렬을 그대로 업로드 (포인트별 리스트 변환 없음)
+        qdrant_client.upload_collection(
+            collection_name=QDRANT_COLLECTION,
+            vectors=vectors,
+            payload=payloads,
+            ids=ids,
+            wait=True,
+        )
+        logging.info(f"Qdrant에 {len(ids)}개의 FAQ 벡터 저장을 완료했습니다.")
+    except Exception as e:
+        logging.error(f"FAQ 벡터 저장 실패: {e}")
+
+    # 컬렉션을 초기화했으므로 저장 성공 여부와 관계없이 기존 캐시 답변은 무효
+    data_version.bump(QDRANT_COLLECTION)
 
 
 if __name__ == "__main__":
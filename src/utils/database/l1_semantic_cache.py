@@ -0,0 +1,193 @@
+import time
+import threading
+import numpy as np
+
+
+# 프로세스 내부 의미 캐시 (L1)
+# 자주 조회되는 캐시 항목의 질문 벡터를 float32 행렬로 보관하고 한 번의 내적으로 검색
+# policy: "lru" (가장 오래 사용하지 않은 항목 제거) | "lfu" (가장 적게 사용된 항목 제거)
+# partition: 라벨/언어/권한 범위 등 검색 범위 (같은 partition의 항목끼리만 비교)
+class L1SemanticCache:
+    def __init__(self, capacity: int, dim: int, policy: str = "lfu", ttl_seconds=300):
+        self.capacity = max(1, capacity)
+        self.dim = dim
+        self.policy = policy.lower()
+        self.ttl_seconds = ttl_seconds
+
+        self._matrix = np.zeros((self.capacity, dim), dtype=np.float32)
+        self._valid = np.zeros(self.capacity, dtype=bool)
+        self._hits = np.zeros(self.capacity, dtype=np.int64)
+        self._last_used = np.zeros(self.capacity, dtype=np.float64)
+        self._expires_at = np.zeros(self.capacity, dtype=np.float64)
+        self._partition = np.full(self.capacity, -1, dtype=np.int64)
+        # partition <-> 정수 ID (항목이 하나도 남지 않은 partition은 삭제)
+        self._partition_ids = {}  # partition -> 정수 ID
+        self._partition_names = {}  # 정수 ID -> partition
+        self._partition_counts = {}  # 정수 ID -> 항목 수
+        self._next_partition_id = 0
+        self._entries = [None] * self.capacity  # (doc_id, answer, matched_template)
+        self._slots = {}  # doc_id -> slot
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._slots
+
+    # 가장 유사한 항목 검색 (min_similarity 미만이거나 없으면 None)
+    # partitions: 검색할 partition 목록 (None이면 전체)
+    # 반환: (doc_id, answer, similarity, matched_template)
+    def search(self, query_vector, min_similarity: float, partitions=None):
+        query = _normalize(query_vector)
+        now = time.monotonic()
+        with self._lock:
+            if not self._slots:
+                return None
+            if partitions is not None:
+                ids = [
+                    self._partition_ids[p]
+                    for p in partitions
+                    if p in self._partition_ids
+                ]
+                if not ids:
+                    return None
+
+            expired = self._valid & (self._expires_at <= now)
+            for slot in np.flatnonzero(expired):
+                self._remove_slot(int(slot))
+
+            candidates = self._valid
+            if partitions is not None:
+                candidates = candidates & np.isin(self._partition, ids)
+
+            similarities = self._matrix @ query
+            similarities[~candidates] = -np.inf
+            slot = int(np.argmax(similarities))
+            similarity = float(similarities[slot])
+            if not candidates[slot] or similarity < min_similarity:
+                return None
+
+            self._hits[slot] += 1
+            self._last_used[slot] = now
+            doc_id, answer, matched_template = self._entries[slot]
+            return doc_id, answer, similarity, matched_template
+
+    # 문서 ID로 직접 조회 (없거나 만료되면 None)
+    # 반환: (answer, matched_template)
+    def get(self, doc_id):
+        now = time.monotonic()
+        with self._lock:
+            slot = self._slots.get(doc_id)
+            if slot is None:
+                return None
+            if self._expires_at[slot] <= now:
+                self._remove_slot(slot)
+                return None
+            self._hits[slot] += 1
+            self._last_used[slot] = now
+            _, answer, matched_template = self._entries[slot]
+            return answer, matched_template
+
+    # 항목 추가 (이미 있으면 갱신, 가득 차면 정책에 따라 한 항목 제거)
+    def put(
+        self,
+        doc_id,
+        vector,
+        answer,
+        matched_template=None,
+        ttl_seconds=None,
+        partition="",
+    ):
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        now = time.monotonic()
+        with self._lock:
+            partition_id = self._acquire_partition(partition)
+            slot = self._slots.get(doc_id)
+            if slot is None:
+                slot = self._free_slot()
+                self._slots[doc_id] = slot
+                self._hits[slot] = 0
+            else:
+                self._release_partition(int(self._partition[slot]))
+
+            self._matrix[slot] = _normalize(vector)
+            self._valid[slot] = True
+            self._last_used[slot] = now
+            self._expires_at[slot] = now + ttl
+            self._partition[slot] = partition_id
+            self._entries[slot] = (doc_id, answer, matched_template)
+
+    # 항목 무효화
+    def invalidate(self, doc_id) -> bool:
+        with self._lock:
+            slot = self._slots.get(doc_id)
+            if slot is None:
+                return False
+            self._remove_slot(slot)
+            return True
+
+    def clear(self):
+        with self._lock:
+            self._valid[:] = False
+            self._partition[:] = -1
+            self._entries = [None] * self.capacity
+            self._slots.clear()
+            self._partition_ids.clear()
+            self._partition_names.clear()
+            self._partition_counts.clear()
+
+    def _free_slot(self) -> int:
+        empty = np.flatnonzero(~self._valid)
+        if len(empty):
+            return int(empty[0])
+
+        if self.policy == "lru":
+            victim = int(np.argmin(self._last_used))
+        else:
+            # 사용 횟수가 같으면 오래된 항목부터 제거
+            order = np.lexsort((self._last_used, self._hits))
+            victim = int(order[0])
+        self._remove_slot(victim)
+        return victim
+
+    def _remove_slot(self, slot: int):
+        entry = self._entries[slot]
+        if entry is not None:
+            self._slots.pop(entry[0], None)
+            self._release_partition(int(self._partition[slot]))
+        self._valid[slot] = False
+        self._partition[slot] = -1
+        self._entries[slot] = None
+
+    # partition의 정수 ID를 얻고 항목 수 증가 (처음 보는 partition이면 새 ID 발급)
+    def _acquire_partition(self, partition) -> int:
+        partition_id = self._partition_ids.get(partition)
+        if partition_id is None:
+            partition_id = self._next_partition_id
+            self._next_partition_id += 1
+            self._partition_ids[partition] = partition_id
+            self._partition_names[partition_id] = partition
+            self._partition_counts[partition_id] = 0
+        self._partition_counts[partition_id] += 1
+        return partition_id
+
+    # partition 항목 수 감소 (남은 항목이 없으면 매핑 삭제)
+    def _release_partition(self, partition_id: int):
+        count = self._partition_counts.get(partition_id)
+        if count is None:
+            return
+        if count > 1:
+            self._partition_counts[partition_id] = count - 1
+            return
+        del self._partition_counts[partition_id]
+        del self._partition_ids[self._partition_names.pop(partition_id)]
+
+
+# 단위 벡터로 정규화 (코사인 유사도를 내적으로 계산하기 위함)
+def _normalize(vector) -> np.ndarray:
+    vector = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    if norm == 0:
+        return vector
+    return vector / norm
@@ -1,11 +1,11 @@
 import uuid
 import logging
 import pandas as pd
-from qdrant_client.models import PointStruct
 
 from src.utils.database.connect_qdrant import init_qdrant, reset_collection
 from src.utils.database.connect_mysql import init_mysql
 from src.utils.tools.embedding import vectorize
+import src.utils.database.data_version as data_version
 
 
 QDRANT_COLLECTION = "member_vectors"
@@ -67,15 +67,22 @@ def save_data():
         # 벡터화 및 저장
         if texts:
             vectors = vectorize(texts)
-            batch_data = list(zip(filtered_batch, vectors))
-
-            points = []
-            for data, vector in batch_data:
-                employee_number = data["employee_number"]
-                point_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, employee_number))
-                points.append(PointStruct(id=point_id, vector=vector, payload=data))
+            point_ids = [
+                str(uuid.uuid5(uuid.NAMESPACE_DNS, data["employee_number"]))
+                for data in filtered_batch
+            ]
+
+            # (n, dim) 행렬을 그대로 업로드
+            qdrant_client.upload_collection(
+                collection_name=QDRANT_COLLECTION,
+                vectors=vectors,
+                payload=filtered_batch,
+                ids=point_ids,
+                wait=True,
+            )
 
-            qdrant_client.upsert(collection_name=QDRANT_COLLECTION, points=points)
+    # 조직도가 바뀌었으므로 기존 캐시 답변은 무효
+    data_version.bump(QDRANT_COLLECTION)
 
 
 if __name__ == "__main__":
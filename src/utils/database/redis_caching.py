@@ -1,129 +1,782 @@
+import os
+import re
+import time
 import redis
 import json
 import logging
 import hashlib
+import threading
 import numpy as np
+from collections import Counter
+from typing import NamedTuple
+from redis.commands.search.query import Query
 
+import src.layers.monitoring.monitoring as monitoring
+import src.utils.database.data_version as data_version
 from src.utils.database.connect_redis import get_redis_client
-from src.utils.tools.embedding import vectorize
+from src.utils.database.l1_semantic_cache import L1SemanticCache
+from src.utils.tools.text_normalize import normalize_question
+from src.utils.tools.pipeline_language import PIPELINE_LANG
+import src.utils.tools.embedding_cache as embedding_cache
+from src.utils.tools.embedding import (
+    vectorize,
+    as_float32,
+    EMBEDDING_DIM,
+    EMBEDDING_MODEL,
+)
 
 # 상수 정의
-EMBEDDING_DIMENSION = 768
+EMBEDDING_DIMENSION = EMBEDDING_DIM
 DOC_ID_LENGTH = 12
 DEFAULT_TTL_SECONDS = 3600
+# 원본 데이터 버전이 기록된 항목은 버전이 바뀌면 무효가 되므로 오래 보관
+VERSIONED_TTL_SECONDS = int(os.getenv("CACHE_VERSIONED_TTL", 86400 * 7))
+# 라벨별 TTL (답변이 잘 바뀌지 않는 라벨일수록 길게, 없는 라벨은 위 기본값)
+LABEL_TTL_SECONDS = {
+    "__label__org_chart": int(os.getenv("CACHE_TTL_ORG_CHART", 86400 * 7)),
+    "__label__form_request": int(os.getenv("CACHE_TTL_FORM_REQUEST", 86400 * 7)),
+    "__label__internal_info": int(os.getenv("CACHE_TTL_INTERNAL_INFO", 86400)),
+}
+# 생성 비용에 따른 TTL 배율 (기준 시간보다 빨리 만든 답변은 짧게 보관)
+CACHE_COST_REFERENCE_SECONDS = float(os.getenv("CACHE_COST_REFERENCE_SECONDS", 3))
+CACHE_COST_MIN_FACTOR = float(os.getenv("CACHE_COST_MIN_FACTOR", 0.25))
+CACHE_COST_MAX_FACTOR = float(os.getenv("CACHE_COST_MAX_FACTOR", 2))
 DEFAULT_MIN_SIMILARITY = 0.85
-VECTOR_INDEX_NAME = "vec_idx"
+# 임계값보다 이만큼 낮은 유사도까지는 near-miss로 집계 (임계값 조정용)
+CACHE_NEAR_MISS_MARGIN = float(os.getenv("CACHE_NEAR_MISS_MARGIN", 0.05))
+# 항목당 메모리 추정에 사용하는 표본 키 수
+CACHE_STATS_SAMPLE_SIZE = int(os.getenv("CACHE_STATS_SAMPLE_SIZE", 50))
+# 의미 캐시 자체 예산 (항목 수, 0이면 사용 안 함)
+# 넘으면 남은 TTL이 짧은 항목부터 삭제 (TTL이 생성 비용에 비례하므로 싼 항목이 먼저 빠짐)
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", 10000))
+CACHE_TRIM_SCAN_COUNT = 1000
+
+# 캐시 벡터 저장 형식 (항목당 메모리 절약)
+# CACHE_VECTOR_TYPE: FLOAT32 | FLOAT16 | INT8 (INT8은 Redis 8 이상의 RediSearch 필요)
+# CACHE_VECTOR_DIM: 앞쪽 차원만 잘라 정규화해 저장 (Matryoshka 방식으로 학습된 임베딩은 유사도가 유지됨)
+# CACHE_RESCORE_CANDIDATES: 2 이상이면 후보를 여러 개 받아 임베딩 캐시의 전체 벡터로 다시 비교
+CACHE_VECTOR_TYPE = os.getenv("CACHE_VECTOR_TYPE", "FLOAT32").upper()
+CACHE_VECTOR_DIM = min(int(os.getenv("CACHE_VECTOR_DIM", EMBEDDING_DIM)), EMBEDDING_DIM)
+CACHE_RESCORE_CANDIDATES = int(os.getenv("CACHE_RESCORE_CANDIDATES", 0))
+VECTOR_TYPE_BYTES = {"FLOAT32": 4, "FLOAT16": 2, "INT8": 1}
+INT8_SCALE = 127
+# 노름이 1과 이 값 이내로 차이 나면 이미 단위 벡터로 보고 다시 정규화하지 않음
+UNIT_NORM_TOLERANCE = 1e-4
+# 용량 보고서에서 비교할 차원
+CAPACITY_DIMS = (768, 512, 256, 128)
+
+# 저장 형식이 기본값과 다르면 별도 인덱스 사용 (형식이 다른 기존 항목은 새 인덱스에 색인되지 않음)
+if CACHE_VECTOR_TYPE == "FLOAT32" and CACHE_VECTOR_DIM == EMBEDDING_DIM:
+    VECTOR_INDEX_NAME = "vec_idx"
+else:
+    VECTOR_INDEX_NAME = f"vec_idx_{CACHE_VECTOR_TYPE.lower()}_{CACHE_VECTOR_DIM}"
 REDIS_KEY_PREFIX = "vec:"
 REDIS_MAX_MEMORY = "100mb"
+# 인스턴스 전체(대화 기록, 번역, 검색 결과 캐시 포함)에 적용되므로 LRU 유지
+# 임베딩 캐시는 EMBEDDING_REDIS_HOST로 전용 인스턴스를 지정하면 이 예산에서 빠짐
+# 비용에 따른 정리는 아래 의미 캐시 자체 예산(CACHE_MAX_ENTRIES)에서 처리
+REDIS_MAX_MEMORY_POLICY = os.getenv("CACHE_MAXMEMORY_POLICY", "allkeys-lru")
 DB_PORT = 0
+# 캐시 질문의 언어 (파이프라인이 번역한 텍스트로 저장하므로 파이프라인 언어)
+CACHE_LANG = PIPELINE_LANG
+
+# 검색 범위 (TAG 필드)
+# label: 필터 라벨, scope: 권한 범위 (부서 등, 모두에게 같은 답변이면 GLOBAL_SCOPE)
+# 질문/답변은 항상 파이프라인 언어로 저장되고 응답 시 사용자 언어로 번역하므로 언어로는 나누지 않음
+DEFAULT_LABEL = "unknown"
+GLOBAL_SCOPE = "global"
+TAG_FIELDS = ("label", "scope")
+_TAG_SPECIAL = re.compile(r"[^\w]")
+
+# 벡터 인덱스 설정
+# FLAT: 전수 비교, HNSW: 근사 탐색, AUTO: 캐시 크기가 임계값을 넘으면 FLAT -> HNSW 전환
+CACHE_INDEX_ALGORITHM = os.getenv("CACHE_INDEX_ALGORITHM", "AUTO").upper()
+CACHE_HNSW_THRESHOLD = int(os.getenv("CACHE_HNSW_THRESHOLD", 5000))
+CACHE_HNSW_M = int(os.getenv("CACHE_HNSW_M", 16))
+CACHE_HNSW_EF_CONSTRUCTION = int(os.getenv("CACHE_HNSW_EF_CONSTRUCTION", 200))
+CACHE_HNSW_EF_RUNTIME = int(os.getenv("CACHE_HNSW_EF_RUNTIME", 64))
+INDEX_CHECK_INTERVAL = int(os.getenv("CACHE_INDEX_CHECK_INTERVAL", 500))
+INDEX_RESOLVE_TTL = 30
+HNSW_INDEX_NAME = f"{VECTOR_INDEX_NAME}_hnsw"
+RETURN_FIELDS = ("answer", "matched_template", "versions", "scope", "question", "score")
+
+# L1 (프로세스 내부) 캐시 설정
+# Redis 키스페이스 알림으로 변경된 항목을 무효화하고,
+# 알림을 놓친 경우를 대비해 세대 번호 확인과 TTL로 오래된 항목을 정리
+L1_CACHE_ENABLED = os.getenv("L1_CACHE_ENABLED", "true").lower() == "true"
+L1_CACHE_SIZE = int(os.getenv("L1_CACHE_SIZE", 1024))
+L1_CACHE_POLICY = os.getenv("L1_CACHE_POLICY", "lfu")
+L1_CACHE_TTL = int(os.getenv("L1_CACHE_TTL", 300))
+L1_GENERATION_CHECK_INTERVAL = float(os.getenv("L1_GENERATION_CHECK_INTERVAL", 5))
+GENERATION_KEY = "cache:generation"
+KEYSPACE_EVENTS = "Kghxe"
+
+# 질문 빈도 기록 (캐시 예열에 사용)
+# 일자별 zset(doc_id -> 횟수)과 질문/라벨/범위 해시만 보관 (답변은 살아 있는 캐시 항목에서 읽음)
+QUESTION_LOG_PREFIX = "cache:question_log:"
+QUESTION_ENTRY_PREFIX = "cache:question:"
+QUESTION_LOG_TTL = int(os.getenv("QUESTION_LOG_TTL", 86400 * 7))
+QUESTION_LOG_FLUSH_INTERVAL = 10
 
 
 # Redis 연결
 redis_client = get_redis_client(DB_PORT)
+# 벡터 바이트를 그대로 읽기 위한 클라이언트
+redis_bytes_client = get_redis_client(DB_PORT, decode_responses=False)
 
+l1_cache = L1SemanticCache(
+    L1_CACHE_SIZE, CACHE_VECTOR_DIM, L1_CACHE_POLICY, L1_CACHE_TTL
+)
+_l1_generation = None
+_l1_generation_checked_at = 0.0
+_keyspace_listener = None
 
-# Redis 설정
-def configure_redis() -> None:
-    redis_client.config_set("maxmemory-policy", "allkeys-lru")
-    redis_client.config_set("maxmemory", REDIS_MAX_MEMORY)
+# 아직 Redis에 반영하지 않은 질문 빈도
+_question_counts = Counter()
+_question_counts_lock = threading.Lock()
+_question_counts_flushed_at = time.monotonic()
 
+# 현재 검색에 사용하는 인덱스 (주기적으로 다시 확인)
+_active_index = None
+_active_checked_at = 0.0
+_write_count = 0
+_index_lock = threading.Lock()
+
+
+# 벡터 필드 정의 (알고리즘별 속성)
+def _vector_field(algorithm):
+    attributes = {
+        "TYPE": CACHE_VECTOR_TYPE,
+        "DIM": CACHE_VECTOR_DIM,
+        "DISTANCE_METRIC": "COSINE",
+    }
+    if algorithm == "HNSW":
+        attributes.update(
+            {
+                "M": CACHE_HNSW_M,
+                "EF_CONSTRUCTION": CACHE_HNSW_EF_CONSTRUCTION,
+                "EF_RUNTIME": CACHE_HNSW_EF_RUNTIME,
+            }
+        )
+    return redis.commands.search.field.VectorField("vec", algorithm, attributes)
+
+
+# 인덱스 생성 (이미 있으면 False)
+def _create_index(index_name, algorithm) -> bool:
     try:
-        redis_client.ft(VECTOR_INDEX_NAME).create_index(
+        redis_client.ft(index_name).create_index(
             [
                 redis.commands.search.field.TextField("id"),
-                redis.commands.search.field.VectorField(
-                    "vec",
-                    "FLAT",
-                    {
-                        "TYPE": "FLOAT32",
-                        "DIM": EMBEDDING_DIMENSION,
-                        "DISTANCE_METRIC": "COSINE",
-                    },
-                ),
+                *_tag_fields(TAG_FIELDS),
+                _vector_field(algorithm),
             ],
             definition=redis.commands.search.index_definition.IndexDefinition(
                 prefix=[REDIS_KEY_PREFIX]
             ),
         )
-        logging.info("Vector index created successfully")
+        logging.info(f"Vector index created successfully: {index_name} ({algorithm})")
+        return True
     except redis.exceptions.ResponseError as e:
         if "Index already exists" not in str(e):
             raise
-        logging.info("Vector index already exists")
+        logging.info(f"Vector index already exists: {index_name}")
+        return False
 
 
-# 캐싱 추가
-def add_cache(
-    question: str, answer: str, url_data=None, ttl_sec: int = DEFAULT_TTL_SECONDS
-):
+# TAG 필드 정의
+def _tag_fields(names):
+    return [redis.commands.search.field.TagField(name) for name in names]
+
+
+# 기존 인덱스에 없는 TAG 필드 추가 (FT.ALTER, 추가 후 Redis가 기존 문서를 다시 색인)
+def _ensure_tag_fields(index_name) -> None:
+    info = _index_info(index_name)
+    if info is None:
+        return
+    existing = set()
+    for attribute in info.get("attributes", []):
+        if "attribute" in attribute:
+            existing.add(attribute[attribute.index("attribute") + 1])
+    missing = [name for name in TAG_FIELDS if name not in existing]
+    if missing:
+        redis_client.ft(index_name).alter_schema_add(_tag_fields(missing))
+        logging.info(f"Vector index {index_name}: TAG 필드 추가 {missing}")
+
+
+# TAG 값 이스케이프 ('-', ':' 등 구분자로 해석되는 문자)
+def _escape_tag(value) -> str:
+    return _TAG_SPECIAL.sub(lambda match: "\\" + match.group(0), str(value))
+
+
+# 검색 범위 필터 (권한 범위는 요청 범위 + 공용 범위)
+def _search_filter(label, scope) -> str:
+    scopes = " | ".join(_escape_tag(s) for s in sorted({GLOBAL_SCOPE, scope}))
+    return f"(@label:{{{_escape_tag(label)}}} @scope:{{{scopes}}})"
+
+
+# L1 캐시의 검색 범위 이름
+def _partition(label, scope) -> str:
+    return f"{label}|{scope}"
+
+
+# 인덱스 정보 (없으면 None)
+def _index_info(index_name):
     try:
-        doc_id = hashlib.md5(question.encode("utf-8")).hexdigest()[:DOC_ID_LENGTH]
+        return redis_client.ft(index_name).info()
+    except redis.exceptions.ResponseError:
+        return None
 
-        vector = vectorize(question)
 
-        if url_data is None:
-            matched_template = ""
-        else:
-            matched_template = json.dumps(
-                {"title": url_data.get("title", ""), "url": url_data.get("url", "")},
-                ensure_ascii=False,
-            )
+# 기존 문서 색인(백필)이 끝났는지 여부
+def _index_ready(info) -> bool:
+    return info is not None and int(info.get("indexing", 0)) == 0
+
+
+# 검색에 사용할 인덱스 (INDEX_RESOLVE_TTL 동안 결과 재사용)
+def get_active_index(refresh: bool = False) -> str:
+    global _active_index, _active_checked_at
+    if CACHE_INDEX_ALGORITHM == "FLAT":
+        return VECTOR_INDEX_NAME
+
+    now = time.monotonic()
+    if refresh or _active_index is None or now - _active_checked_at > INDEX_RESOLVE_TTL:
+        _active_index = _resolve_active_index()
+        _active_checked_at = now
+    return _active_index
+
+
+# 검색할 인덱스 결정
+# HNSW 색인이 끝났으면 HNSW, 색인 중이면 남아 있는 FLAT 인덱스 사용
+# FLAT 인덱스가 없으면 (HNSW 전용 설정) 색인 중이어도 HNSW로 검색 (색인된 문서만 조회됨)
+def _resolve_active_index() -> str:
+    hnsw_info = _index_info(HNSW_INDEX_NAME)
+    if _index_ready(hnsw_info):
+        return HNSW_INDEX_NAME
+    if _index_info(VECTOR_INDEX_NAME) is not None:
+        return VECTOR_INDEX_NAME
+    if hnsw_info is not None or CACHE_INDEX_ALGORITHM == "HNSW":
+        return HNSW_INDEX_NAME
+    return VECTOR_INDEX_NAME
+
+
+# 캐시 크기를 확인해 HNSW 인덱스로 전환
+# 1) 임계값을 넘으면 HNSW 인덱스 생성 (Redis가 백그라운드로 기존 문서 색인)
+# 2) 다음 확인 시 색인이 끝났으면 FLAT 인덱스 삭제 (문서는 유지)
+def maybe_migrate_index() -> None:
+    if CACHE_INDEX_ALGORITHM == "FLAT":
+        return
+
+    hnsw_info = _index_info(HNSW_INDEX_NAME)
+    if hnsw_info is None:
+        if CACHE_INDEX_ALGORITHM == "AUTO":
+            flat_info = _index_info(VECTOR_INDEX_NAME)
+            num_docs = int(flat_info.get("num_docs", 0)) if flat_info else 0
+            if num_docs < CACHE_HNSW_THRESHOLD:
+                return
+            logging.info(f"캐시 문서 {num_docs}개, HNSW 인덱스로 전환을 시작합니다.")
+        _create_index(HNSW_INDEX_NAME, "HNSW")
+        return
+
+    if _index_ready(hnsw_info) and _index_info(VECTOR_INDEX_NAME) is not None:
+        redis_client.ft(VECTOR_INDEX_NAME).dropindex(delete_documents=False)
+        logging.info("HNSW 인덱스 전환 완료, FLAT 인덱스를 삭제했습니다.")
+        get_active_index(refresh=True)
+
+
+# 쓰기 횟수를 세어 주기적으로 인덱스 전환 여부 확인
+def _record_write(count: int = 1) -> None:
+    global _write_count
+    with _index_lock:
+        previous = _write_count
+        _write_count += count
+        should_check = (
+            _write_count // INDEX_CHECK_INTERVAL > previous // INDEX_CHECK_INTERVAL
+        )
+    if should_check:
+        try:
+            maybe_migrate_index()
+        except Exception as e:
+            logging.warning(f"벡터 인덱스 전환 확인 실패: {e}")
+
+
+# Redis 설정
+def configure_redis() -> None:
+    redis_client.config_set("maxmemory-policy", REDIS_MAX_MEMORY_POLICY)
+    redis_client.config_set("maxmemory", REDIS_MAX_MEMORY)
+    embedding_cache.configure()
+
+    if CACHE_INDEX_ALGORITHM == "HNSW":
+        _create_index(HNSW_INDEX_NAME, "HNSW")
+    elif CACHE_INDEX_ALGORITHM == "FLAT" or _index_info(HNSW_INDEX_NAME) is None:
+        # AUTO에서 이미 HNSW로 전환된 경우에는 FLAT 인덱스를 다시 만들지 않음
+        _create_index(VECTOR_INDEX_NAME, "FLAT")
+
+    # 검색 범위 TAG가 없던 기존 인덱스 보완 (TAG가 없는 기존 항목은 TTL로 정리됨)
+    for index_name in (VECTOR_INDEX_NAME, HNSW_INDEX_NAME):
+        _ensure_tag_fields(index_name)
+
+    maybe_migrate_index()
+    logging.info(f"Active vector index: {get_active_index(refresh=True)}")
+
+    if L1_CACHE_ENABLED:
+        start_keyspace_listener()
+
+
+# 키스페이스 알림 구독 시작 (캐시 키가 바뀌거나 삭제/만료되면 L1에서 제거)
+def start_keyspace_listener() -> None:
+    global _keyspace_listener
+    if _keyspace_listener is not None:
+        return
+
+    try:
+        current = redis_client.config_get("notify-keyspace-events").get(
+            "notify-keyspace-events", ""
+        )
+        merged = "".join(sorted(set(current) | set(KEYSPACE_EVENTS)))
+        if set(merged) != set(current):
+            redis_client.config_set("notify-keyspace-events", merged)
+    except Exception as e:
+        logging.warning(
+            f"키스페이스 알림 설정 실패, L1 캐시는 세대 번호와 TTL로만 갱신됩니다: {e}"
+        )
+        return
+
+    _keyspace_listener = threading.Thread(
+        target=_listen_keyspace_events, name="l1-cache-invalidator", daemon=True
+    )
+    _keyspace_listener.start()
+
+
+def _listen_keyspace_events() -> None:
+    pattern = f"__keyspace@{DB_PORT}__:{REDIS_KEY_PREFIX}*"
+    while True:
+        try:
+            pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+            pubsub.psubscribe(pattern)
+            # 구독 전에 놓친 변경이 있을 수 있으므로 비우고 시작
+            l1_cache.clear()
+
+            while True:
+                message = pubsub.get_message(timeout=1.0)
+                if message is None:
+                    continue
+                # TTL 설정(expire)은 내용 변경이 아니므로 무시
+                if message["data"] == "expire":
+                    continue
+                key = message["channel"].split("__:", 1)[1]
+                l1_cache.invalidate(key)
+        except Exception as e:
+            logging.warning(f"키스페이스 알림 구독 오류, 재연결합니다: {e}")
+            l1_cache.clear()
+            time.sleep(5)
+
+
+# 세대 번호 확인 (다른 인스턴스가 전체 무효화했으면 L1 비움)
+def _check_generation() -> None:
+    global _l1_generation, _l1_generation_checked_at
+    now = time.monotonic()
+    if now - _l1_generation_checked_at < L1_GENERATION_CHECK_INTERVAL:
+        return
+    _l1_generation_checked_at = now
+
+    try:
+        # 원본 데이터 버전이 바뀌어도 L1 항목이 오래된 답변이 되므로 함께 비교
+        generation = (
+            redis_client.get(GENERATION_KEY),
+            data_version.epoch(),
+            tuple(sorted(data_version.current().items())),
+        )
+    except Exception as e:
+        logging.warning(f"캐시 세대 번호 확인 실패: {e}")
+        l1_cache.clear()
+        return
+
+    if generation != _l1_generation:
+        if len(l1_cache):
+            logging.info("캐시 세대 번호 변경, L1 캐시를 비웁니다.")
+        l1_cache.clear()
+        _l1_generation = generation
+
+
+# 전체 인스턴스의 L1 캐시 무효화
+def bump_generation() -> None:
+    redis_client.incr(GENERATION_KEY)
+    l1_cache.clear()
+
+
+# Redis에서 찾은 항목을 L1에 올림 (조회할 때 함께 받은 저장 벡터 바이트 사용)
+def _promote_to_l1(key, raw_vector, answer, matched_template, partition) -> None:
+    vector = _decode_vector(raw_vector)
+    if vector is None:
+        return
+    l1_cache.put(
+        key,
+        vector,
+        answer,
+        matched_template,
+        partition=partition,
+    )
+
+
+# 바이트 클라이언트로 읽은 값을 문자열로 변환 (없으면 None)
+def _to_str(value):
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+# 캐시에 저장하는 차원으로 줄인 단위 벡터 (float32)
+# 이미 단위 벡터이고 자를 차원이 없으면 입력 배열을 복사하지 않고 그대로 반환
+def reduce_vector(vector) -> np.ndarray:
+    vector = as_float32(vector)[:CACHE_VECTOR_DIM]
+    norm = np.linalg.norm(vector)
+    if not norm or abs(norm - 1.0) <= UNIT_NORM_TOLERANCE:
+        return vector
+    return vector / norm
+
+
+# 저장 형식으로 인코딩 (검색 질의 벡터도 같은 형식이어야 함)
+# FLOAT32는 배열 버퍼를 그대로 넘겨 바이트로 복사하지 않음 (redis-py가 memoryview를 그대로 전송)
+def _encode_vector(vector) -> bytes | memoryview:
+    vector = reduce_vector(vector)
+    if CACHE_VECTOR_TYPE == "FLOAT16":
+        return vector.astype(np.float16).tobytes()
+    if CACHE_VECTOR_TYPE == "INT8":
+        quantized = np.clip(np.rint(vector * INT8_SCALE), -INT8_SCALE, INT8_SCALE)
+        return quantized.astype(np.int8).tobytes()
+    return vector.data
+
+
+# 저장된 바이트를 float32 벡터로 복원 (형식이 다르면 None)
+def _decode_vector(raw):
+    size = VECTOR_TYPE_BYTES[CACHE_VECTOR_TYPE]
+    if raw is None or len(raw) != CACHE_VECTOR_DIM * size:
+        return None
+    if CACHE_VECTOR_TYPE == "FLOAT16":
+        return np.frombuffer(raw, dtype=np.float16).astype(np.float32)
+    if CACHE_VECTOR_TYPE == "INT8":
+        return np.frombuffer(raw, dtype=np.int8).astype(np.float32) / INT8_SCALE
+    return np.frombuffer(raw, dtype=np.float32)
+
+
+# 후보를 전체 차원 float32 벡터로 다시 비교 (임베딩 캐시에 없는 후보는 인덱스 점수 사용)
+# 반환: 유사도가 가장 높은 (doc, similarity)
+def _rescore(docs, query_vector):
+    query = as_float32(query_vector)
+    query_norm = np.linalg.norm(query) or 1.0
+    full_vectors = embedding_cache.get_many(
+        [getattr(doc, "question", "") or "" for doc in docs],
+        EMBEDDING_MODEL,
+        EMBEDDING_DIM,
+    )
+
+    best = None
+    for doc, vector in zip(docs, full_vectors):
+        similarity = 1 - float(doc.score)
+        if vector is not None:
+            norm = np.linalg.norm(vector) or 1.0
+            similarity = float(np.dot(query, vector) / (query_norm * norm))
+        if best is None or similarity > best[1]:
+            best = (doc, similarity)
+    return best
+
+
+# 캐시 항목 TTL (라벨별 기본값에 답변 생성 비용 배율 적용)
+# cost_seconds: 답변 생성에 걸린 시간 (없으면 배율 1)
+def cache_ttl(label: str, versions: str = "", cost_seconds=None) -> int:
+    ttl = LABEL_TTL_SECONDS.get(label)
+    if ttl is None:
+        ttl = VERSIONED_TTL_SECONDS if versions else DEFAULT_TTL_SECONDS
+    if cost_seconds is not None and CACHE_COST_REFERENCE_SECONDS > 0:
+        factor = cost_seconds / CACHE_COST_REFERENCE_SECONDS
+        ttl *= min(CACHE_COST_MAX_FACTOR, max(CACHE_COST_MIN_FACTOR, factor))
+    return max(1, int(ttl))
+
+
+# 오래된 항목 삭제 (다음 요청부터는 새 답변을 생성)
+def _evict_stale(key) -> None:
+    l1_cache.invalidate(key)
+    try:
+        redis_client.unlink(key)
+    except Exception as e:
+        logging.warning(f"오래된 캐시 항목 삭제 실패: {e}")
 
-        key = f"{REDIS_KEY_PREFIX}{doc_id}"
-        pipe = redis_client.pipeline()
-        mapping = {
-            "id": doc_id,
-            "vec": np.array(vector).astype(np.float32).tobytes(),
-            "answer": answer,
-            "question": question,
-            "matched_template": matched_template,
-        }
 
-        pipe.hset(key, mapping=mapping)
-        pipe.expire(key, ttl_sec)
+# 저장할 캐시 항목
+# vector: 이미 계산된 질문 임베딩 (없으면 저장 시 계산)
+# versions: 답변이 의존하는 원본 데이터 버전 (data_version.stamp)
+# ttl_sec: 없으면 버전이 있는 항목은 VERSIONED_TTL_SECONDS, 아니면 DEFAULT_TTL_SECONDS
+# label, scope: 검색 범위 (같은 라벨, 같은 권한 범위 또는 공용 범위에서만 검색됨)
+class CacheEntry(NamedTuple):
+    question: str
+    answer: str
+    url_data: dict | None = None
+    ttl_sec: int | None = None
+    vector: object = None
+    versions: str = ""
+    label: str = DEFAULT_LABEL
+    scope: str = GLOBAL_SCOPE
+
+
+# 캐싱 추가 (인자는 CacheEntry와 같음)
+def add_cache(question: str, answer: str, url_data=None, **kwargs):
+    return add_cache_batch([CacheEntry(question, answer, url_data, **kwargs)])[0]
+
+
+# 여러 캐시 항목을 한 번에 저장
+# entries: CacheEntry 목록
+# 벡터가 없는 항목은 한 번의 배치 호출로 임베딩하고, HSET/EXPIRE는 파이프라인으로 전송
+# log_questions: 질문 빈도 기록 여부 (예열처럼 사용자 질문이 아닌 경우 False)
+def add_cache_batch(entries, log_questions: bool = True) -> list:
+    try:
+        vectors = [entry.vector for entry in entries]
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            computed = vectorize([entries[i].question for i in missing])
+            for i, vector in zip(missing, computed):
+                vectors[i] = vector
+
+        doc_ids = []
+        pipe = redis_client.pipeline(transaction=False)
+        for entry, vector in zip(entries, vectors):
+            ttl_sec = entry.ttl_sec
+            if ttl_sec is None:
+                ttl_sec = (
+                    VERSIONED_TTL_SECONDS if entry.versions else DEFAULT_TTL_SECONDS
+                )
+
+            doc_id, key, mapping = _cache_entry(entry, vector)
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, ttl_sec)
+            if log_questions:
+                entry_key = f"{QUESTION_ENTRY_PREFIX}{doc_id}"
+                pipe.hset(
+                    entry_key,
+                    mapping={
+                        field: mapping[field]
+                        for field in ("question", "label", "scope")
+                    },
+                )
+                pipe.expire(entry_key, QUESTION_LOG_TTL)
+            doc_ids.append(doc_id)
         pipe.execute()
+        _record_write(len(doc_ids))
+
+        if log_questions:
+            for doc_id in doc_ids:
+                _count_question(doc_id)
 
-        return doc_id
+        return doc_ids
 
     except Exception as e:
-        logging.error(f"Error adding Cache {doc_id}: {e}")
+        logging.error(f"Error adding Cache ({len(entries)}건): {e}")
         raise
 
 
-# 답변 검색
-def search_cache(question: str, min_similarity: float = DEFAULT_MIN_SIMILARITY):
+# 질문으로 캐시 문서 ID 생성 (정규화된 질문 + 언어 + 권한 범위의 해시, 같은 질문은 항상 같은 키)
+def make_doc_id(
+    question: str, lang: str = CACHE_LANG, scope: str = GLOBAL_SCOPE
+) -> str:
+    raw = f"{normalize_question(question)}|{lang}"
+    if scope != GLOBAL_SCOPE:
+        raw = f"{raw}|{scope}"
+    return hashlib.md5(raw.encode("utf-8")).hexdigest()[:DOC_ID_LENGTH]
+
+
+# 정확히 같은 질문 조회 (임베딩 없이 키 조회, 요청 범위를 먼저 보고 없으면 공용 범위)
+# on_hit: 적중한 doc_id를 받는 함수 (기본: 바로 질문 빈도 기록, 투기적 조회는 실제 사용 시 기록)
+# 반환: search_cache와 같은 (answer, similarity, matched_template)
+def lookup_exact(
+    question: str, lang: str = CACHE_LANG, scope: str = GLOBAL_SCOPE, on_hit=None
+):
+    on_hit = on_hit or _count_question
+    scopes = [scope] if scope == GLOBAL_SCOPE else [scope, GLOBAL_SCOPE]
+    keys = [f"{REDIS_KEY_PREFIX}{make_doc_id(question, lang, s)}" for s in scopes]
     try:
-        query_vector = vectorize(question)
-        query_bytes = np.array(query_vector).astype(np.float32).tobytes()
+        if L1_CACHE_ENABLED:
+            _check_generation()
+            for key in keys:
+                local = l1_cache.get(key)
+                if local is not None:
+                    answer, matched_template = local
+                    monitoring.record_semantic_cache_tier("exact", "hit")
+                    on_hit(key.removeprefix(REDIS_KEY_PREFIX))
+                    return answer, 1.0, matched_template
 
-        search_query = "*=>[KNN 1 @vec $vec_param AS score]"
-        params = {"vec_param": query_bytes}
-        results = redis_client.ft(VECTOR_INDEX_NAME).search(
-            search_query, query_params=params
+        # L1에 올릴 벡터도 같은 왕복에서 받기 위해 바이트 클라이언트로 조회
+        fields = ["answer", "matched_template", "question", "versions", "label"]
+        if L1_CACHE_ENABLED:
+            fields.append("vec")
+        pipe = redis_bytes_client.pipeline(transaction=False)
+        for key in keys:
+            pipe.hmget(key, *fields)
+        for key, entry_scope, values in zip(keys, scopes, pipe.execute()):
+            answer, matched_template_json, stored_question, versions, label = (
+                _to_str(value) for value in values[:5]
+            )
+            # 해시 충돌 방지를 위해 저장된 질문과 한 번 더 비교
+            if not answer or stored_question is None:
+                continue
+            if normalize_question(stored_question) != normalize_question(question):
+                continue
+            if not data_version.is_current(versions):
+                monitoring.record_semantic_cache_tier("exact", "stale")
+                _evict_stale(key)
+                continue
+
+            matched_template = _parse_matched_template(matched_template_json)
+            if L1_CACHE_ENABLED:
+                _promote_to_l1(
+                    key,
+                    values[5],
+                    answer,
+                    matched_template,
+                    _partition(label or DEFAULT_LABEL, entry_scope),
+                )
+            monitoring.record_semantic_cache_tier("exact", "hit")
+            on_hit(key.removeprefix(REDIS_KEY_PREFIX))
+            return answer, 1.0, matched_template
+
+        return None, 0.0, None
+
+    except Exception as e:
+        logging.error(f"Error getting exact answer: {e}")
+        return None, 0.0, None
+
+
+# 이미 캐시에 있는 항목 여부 (entries와 같은 순서, 오래된 버전의 항목은 없는 것으로 취급)
+def cache_exists(entries) -> list:
+    if not entries:
+        return []
+    pipe = redis_client.pipeline(transaction=False)
+    for entry in entries:
+        doc_id = make_doc_id(entry.question, scope=entry.scope)
+        pipe.hmget(f"{REDIS_KEY_PREFIX}{doc_id}", "answer", "versions")
+    return [
+        bool(answer) and data_version.is_current(versions)
+        for answer, versions in pipe.execute()
+    ]
+
+
+# 캐시 항목 구성 (doc_id, Redis 키, 해시 필드)
+def _cache_entry(entry, vector):
+    doc_id = make_doc_id(entry.question, scope=entry.scope)
+    url_data = entry.url_data
+
+    if url_data is None:
+        matched_template = ""
+    else:
+        matched_template = json.dumps(
+            {"title": url_data.get("title", ""), "url": url_data.get("url", "")},
+            ensure_ascii=False,
         )
 
+    mapping = {
+        "id": doc_id,
+        "vec": _encode_vector(vector),
+        "answer": entry.answer,
+        "question": entry.question,
+        "label": entry.label,
+        "scope": entry.scope,
+        "matched_template": matched_template,
+        "versions": entry.versions,
+    }
+    return doc_id, f"{REDIS_KEY_PREFIX}{doc_id}", mapping
+
+
+# 답변 검색 (같은 라벨/언어이고 요청 범위 또는 공용 범위인 항목만 비교)
+# query_vector: 이미 계산된 질문 임베딩 (없으면 새로 계산)
+# on_hit: lookup_exact와 같음
+def search_cache(
+    question: str,
+    min_similarity: float = DEFAULT_MIN_SIMILARITY,
+    query_vector=None,
+    label: str = DEFAULT_LABEL,
+    scope: str = GLOBAL_SCOPE,
+    on_hit=None,
+):
+    on_hit = on_hit or _count_question
+    try:
+        if query_vector is None:
+            # 정확히 같은 질문이면 임베딩 없이 반환
+            exact = lookup_exact(question, scope=scope, on_hit=on_hit)
+            if exact[0]:
+                return exact
+            query_vector = vectorize(question)
+
+        # L1 캐시 우선 조회 (Redis 왕복 없음)
+        reduced = reduce_vector(query_vector)
+        if L1_CACHE_ENABLED:
+            _check_generation()
+            partitions = [_partition(label, s) for s in {scope, GLOBAL_SCOPE}]
+            local = l1_cache.search(reduced, min_similarity, partitions)
+            if local is not None:
+                key, answer, similarity, matched_template = local
+                monitoring.record_semantic_cache_tier("l1", "hit")
+                on_hit(key.removeprefix(REDIS_KEY_PREFIX))
+                return answer, similarity, matched_template
+
+        query_bytes = _encode_vector(reduced)
+        candidates = max(1, CACHE_RESCORE_CANDIDATES)
+
+        # 필요한 필드를 검색 결과에 함께 받아 한 번의 왕복으로 처리
+        search_query = (
+            Query(
+                f"{_search_filter(label, scope)}"
+                f"=>[KNN {candidates} @vec $vec_param AS score]"
+            )
+            .sort_by("score")
+            .return_fields(*RETURN_FIELDS)
+            .dialect(2)
+        )
+        # L1에 올릴 벡터는 검색 결과에 바이트 그대로 함께 받음 (별도 HGET 없음)
+        if L1_CACHE_ENABLED:
+            search_query.return_field("vec", decode_field=False)
+        params = {"vec_param": query_bytes}
+        try:
+            results = redis_bytes_client.ft(get_active_index()).search(
+                search_query, query_params=params
+            )
+        except redis.exceptions.ResponseError as e:
+            # 다른 인스턴스가 인덱스를 전환한 경우 다시 확인 후 재시도
+            message = str(e).lower()
+            if "no such index" not in message and "unknown index" not in message:
+                raise
+            results = redis_bytes_client.ft(get_active_index(refresh=True)).search(
+                search_query, query_params=params
+            )
+
         if not results.docs:
             return None, 0.0, None
 
-        doc = results.docs[0]
-        similarity = 1 - float(doc.score)
+        if candidates > 1:
+            doc, similarity = _rescore(results.docs, query_vector)
+        else:
+            doc = results.docs[0]
+            similarity = 1 - float(doc.score)
 
         if similarity < min_similarity:
             return None, similarity, None
 
-        answer = redis_client.hget(doc.id, "answer")
-        matched_template_json = redis_client.hget(doc.id, "matched_template")
-        matched_template = None
-        if matched_template_json:
-            decoded = matched_template_json
-            if decoded == "":
-                matched_template = None
-            else:
-                try:
-                    matched_template = json.loads(decoded)
-                except Exception:
-                    matched_template = None
+        answer = getattr(doc, "answer", None)
+        matched_template = _parse_matched_template(
+            getattr(doc, "matched_template", None)
+        )
+        # 원본 데이터가 바뀐 뒤의 항목이면 지우고 새로 생성하도록 함
+        if answer and not data_version.is_current(getattr(doc, "versions", "")):
+            monitoring.record_semantic_cache_tier("redis", "stale")
+            _evict_stale(doc.id)
+            return None, similarity, None
         if answer:
+            if L1_CACHE_ENABLED:
+                partition = _partition(label, getattr(doc, "scope", GLOBAL_SCOPE))
+                _promote_to_l1(
+                    doc.id,
+                    getattr(doc, "vec", None),
+                    answer,
+                    matched_template,
+                    partition,
+                )
+            monitoring.record_semantic_cache_tier("redis", "hit")
+            on_hit(doc.id.removeprefix(REDIS_KEY_PREFIX))
             return answer, similarity, matched_template
 
         return None, similarity, None
@@ -133,6 +786,268 @@ def search_cache(question: str, min_similarity: float = DEFAULT_MIN_SIMILARITY):
         return None, 0.0, None
 
 
+# 조회 결과 분류 (hit, near_miss: 임계값 바로 아래, miss)
+def lookup_result(
+    answer, similarity: float, min_similarity: float = DEFAULT_MIN_SIMILARITY
+) -> str:
+    if answer:
+        return "hit"
+    if similarity >= min_similarity - CACHE_NEAR_MISS_MARGIN:
+        return "near_miss"
+    return "miss"
+
+
+# 의미 캐시가 자체 예산을 넘으면 남은 TTL이 짧은 항목부터 삭제 (삭제한 항목 수 반환)
+# 인스턴스 전체 메모리 정책과 달리 vec: 항목끼리만 비교하므로 다른 DB의 키에 영향 없음
+def enforce_cache_budget() -> int:
+    if CACHE_MAX_ENTRIES <= 0:
+        return 0
+    info = _index_info(get_active_index()) or {}
+    excess = int(info.get("num_docs", 0)) - CACHE_MAX_ENTRIES
+    if excess <= 0:
+        return 0
+
+    keys = []
+    cursor = 0
+    while True:
+        cursor, batch = redis_client.scan(
+            cursor, match=f"{REDIS_KEY_PREFIX}*", count=CACHE_TRIM_SCAN_COUNT
+        )
+        keys.extend(batch)
+        if cursor == 0:
+            break
+
+    pipe = redis_client.pipeline(transaction=False)
+    for key in keys:
+        pipe.ttl(key)
+    # TTL이 없는 키(-1)는 가장 나중에, 이미 사라진 키(-2)는 제외
+    ranked = sorted(
+        (ttl if ttl >= 0 else float("inf"), key)
+        for ttl, key in zip(pipe.execute(), keys)
+        if ttl != -2
+    )
+    victims = [key for _, key in ranked[:excess]]
+
+    for start in range(0, len(victims), CACHE_TRIM_SCAN_COUNT):
+        redis_client.unlink(*victims[start : start + CACHE_TRIM_SCAN_COUNT])
+    for key in victims:
+        l1_cache.invalidate(key)
+    logging.info(
+        f"의미 캐시 예산 초과로 {len(victims)}건 삭제 (예산 {CACHE_MAX_ENTRIES}건)"
+    )
+    return len(victims)
+
+
+# 캐시 항목 수, 메모리 사용량, 제거된 키 수를 조회해 메트릭에 기록
+def report_cache_usage() -> dict:
+    info = _index_info(get_active_index()) or {}
+    entries = int(info.get("num_docs", 0))
+    memory = redis_client.info("memory")
+    stats = redis_client.info("stats")
+
+    # 항목당 메모리는 일부 키의 MEMORY USAGE 평균으로 추정
+    # SCAN은 한 번에 빈 결과를 줄 수 있으므로 표본이 찰 때까지(또는 끝까지) 계속 조회
+    sample = []
+    cursor = 0
+    while True:
+        cursor, keys = redis_client.scan(
+            cursor, match=f"{REDIS_KEY_PREFIX}*", count=CACHE_STATS_SAMPLE_SIZE * 10
+        )
+        sample.extend(keys)
+        if cursor == 0 or len(sample) >= CACHE_STATS_SAMPLE_SIZE:
+            break
+    sample = sample[:CACHE_STATS_SAMPLE_SIZE]
+    bytes_per_entry = 0
+    if sample:
+        pipe = redis_client.pipeline(transaction=False)
+        for key in sample:
+            pipe.memory_usage(key)
+        sizes = [size for size in pipe.execute() if size]
+        bytes_per_entry = int(sum(sizes) / len(sizes)) if sizes else 0
+
+    # used_memory는 인스턴스 전체(다른 DB 포함), cache_memory는 의미 캐시 항목의 추정치
+    usage = {
+        "index": get_active_index(),
+        "entries": entries,
+        "cache_memory": entries * bytes_per_entry,
+        "used_memory": int(memory.get("used_memory", 0)),
+        "max_memory": int(memory.get("maxmemory", 0)),
+        "max_memory_policy": memory.get("maxmemory_policy", ""),
+        "bytes_per_entry": bytes_per_entry,
+        "evicted_keys": int(stats.get("evicted_keys", 0)),
+        "expired_keys": int(stats.get("expired_keys", 0)),
+        "l1_entries": len(l1_cache),
+        "vector_type": CACHE_VECTOR_TYPE,
+        "vector_dim": CACHE_VECTOR_DIM,
+        "embedding_cache": embedding_cache.cache_usage(),
+    }
+    monitoring.record_semantic_cache_usage(
+        entries,
+        usage["cache_memory"],
+        usage["used_memory"],
+        usage["max_memory"],
+        bytes_per_entry,
+        usage["evicted_keys"],
+    )
+    return usage
+
+
+# 벡터 저장 형식별 예상 용량
+# 현재 항목의 벡터 외 크기(텍스트, 해시 오버헤드)는 그대로 두고 벡터 크기만 바꿔 계산
+# 벡터 인덱스가 벡터를 따로 한 벌 더 보관하므로 벡터 크기는 두 번 셈
+# reserved: 같은 인스턴스를 쓰는 다른 캐시(임베딩 캐시 등)가 차지하는 메모리 (예산에서 제외)
+def capacity_report(max_memory: int, bytes_per_entry: int, reserved: int = 0) -> list:
+    if max_memory:
+        max_memory = max(0, max_memory - reserved)
+    current_vector_bytes = CACHE_VECTOR_DIM * VECTOR_TYPE_BYTES[CACHE_VECTOR_TYPE]
+    overhead = max(0, bytes_per_entry - current_vector_bytes)
+    dims = sorted(
+        {dim for dim in (*CAPACITY_DIMS, EMBEDDING_DIM) if dim <= EMBEDDING_DIM},
+        reverse=True,
+    )
+
+    report = []
+    for vector_type, size in VECTOR_TYPE_BYTES.items():
+        for dim in dims:
+            vector_bytes = dim * size
+            per_entry = overhead + vector_bytes * 2
+            report.append(
+                {
+                    "vector_type": vector_type,
+                    "dim": dim,
+                    "vector_bytes": vector_bytes,
+                    "bytes_per_entry": per_entry,
+                    "max_entries": max_memory // per_entry if max_memory else None,
+                    "current": vector_type == CACHE_VECTOR_TYPE
+                    and dim == CACHE_VECTOR_DIM,
+                }
+            )
+    return report
+
+
+# 관리용 캐시 현황 (사용량 + 형식별 예상 용량 + 최근 자주 조회된 질문)
+def get_cache_stats(top_n: int = 20, days: int = 7) -> dict:
+    usage = report_cache_usage()
+    # 임베딩 캐시가 같은 인스턴스를 쓰면 그만큼 의미 캐시 예산에서 제외
+    embedding_usage = usage["embedding_cache"]
+    reserved = 0 if embedding_usage["dedicated"] else embedding_usage["memory"]
+    usage["capacity"] = capacity_report(
+        usage["max_memory"], usage["bytes_per_entry"], reserved
+    )
+    top_questions = [
+        {
+            "question": entry.question,
+            "label": entry.label,
+            "scope": entry.scope,
+            "count": count,
+        }
+        for _, entry, count in _frequent_question_log(top_n, days)
+    ]
+    return {**usage, "top_questions": top_questions}
+
+
+# 캐시 적중 질문 빈도 기록 (on_hit으로 미뤄 둔 적중을 실제로 사용할 때 호출)
+def count_question(doc_id) -> None:
+    _count_question(doc_id)
+
+
+# 질문 빈도 집계 (메모리에 모았다가 주기적으로 한 번에 반영)
+def _count_question(doc_id) -> None:
+    global _question_counts, _question_counts_flushed_at
+    with _question_counts_lock:
+        _question_counts[doc_id] += 1
+        now = time.monotonic()
+        if now - _question_counts_flushed_at < QUESTION_LOG_FLUSH_INTERVAL:
+            return
+        counts = _question_counts
+        _question_counts = Counter()
+        _question_counts_flushed_at = now
+
+    log_key = f"{QUESTION_LOG_PREFIX}{time.strftime('%Y%m%d')}"
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        for counted_id, count in counts.items():
+            pipe.zincrby(log_key, count, counted_id)
+        pipe.expire(log_key, QUESTION_LOG_TTL)
+        pipe.execute()
+    except Exception as e:
+        logging.warning(f"질문 빈도 기록 실패: {e}")
+
+
+# 최근 days일 동안 자주 나온 질문 기록
+# 반환: [(doc_id, CacheEntry(답변 없음), count)]
+def _frequent_question_log(limit: int, days: int = 7) -> list:
+    counts = Counter()
+    day = 86400
+    now = time.time()
+    for offset in range(days):
+        log_key = f"{QUESTION_LOG_PREFIX}{time.strftime('%Y%m%d', time.localtime(now - offset * day))}"
+        for doc_id, score in redis_client.zrevrange(
+            log_key, 0, limit - 1, withscores=True
+        ):
+            counts[doc_id] += score
+
+    top = counts.most_common(limit)
+    pipe = redis_client.pipeline(transaction=False)
+    for doc_id, _ in top:
+        pipe.hgetall(f"{QUESTION_ENTRY_PREFIX}{doc_id}")
+    entries = pipe.execute() if top else []
+
+    return [
+        (
+            doc_id,
+            CacheEntry(
+                entry["question"],
+                "",
+                label=entry.get("label") or DEFAULT_LABEL,
+                scope=entry.get("scope") or GLOBAL_SCOPE,
+            ),
+            int(count),
+        )
+        for (doc_id, count), entry in zip(top, entries)
+        if entry.get("question")
+    ]
+
+
+# 최근 days일 동안 자주 나온 질문 중 캐시 항목이 살아 있고 원본 데이터가 바뀌지 않은 항목
+# 답변/템플릿/버전은 현재 캐시 항목에서 읽음
+# 반환: [(CacheEntry, count)]
+def get_frequent_questions(limit: int, days: int = 7) -> list:
+    logged = _frequent_question_log(limit, days)
+    pipe = redis_client.pipeline(transaction=False)
+    for doc_id, _, _ in logged:
+        pipe.hmget(
+            f"{REDIS_KEY_PREFIX}{doc_id}", "answer", "matched_template", "versions"
+        )
+    live = pipe.execute() if logged else []
+
+    frequent = []
+    for (_, entry, count), (answer, matched_template, versions) in zip(logged, live):
+        if not answer or not data_version.is_current(versions):
+            continue
+        frequent.append(
+            (
+                entry._replace(
+                    answer=answer,
+                    url_data=_parse_matched_template(matched_template),
+                    versions=versions or "",
+                ),
+                count,
+            )
+        )
+    return frequent
+
+
+# 저장된 템플릿 JSON 파싱 (비어 있거나 잘못된 값이면 None)
+def _parse_matched_template(matched_template_json):
+    if not matched_template_json:
+        return None
+    try:
+        return json.loads(matched_template_json)
+    except Exception:
+        return None
+
+
 # 테스트
 if __name__ == "__main__":
     configure_redis()
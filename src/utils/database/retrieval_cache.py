@@ -0,0 +1,117 @@
+import os
+import json
+import hashlib
+import logging
+from typing import NamedTuple
+import numpy as np
+
+import src.layers.monitoring.monitoring as monitoring
+import src.utils.database.connect_redis as connect_redis
+import src.utils.database.data_version as data_version
+from src.utils.tools.lru_cache import LRUCache
+
+# Qdrant 검색 결과 캐시 설정
+# 키에 컬렉션 버전이 들어가므로 동기화/적재로 버전이 오르면 이전 결과는 더 이상 조회되지 않음
+RETRIEVAL_CACHE_SIZE = int(os.getenv("RETRIEVAL_CACHE_SIZE", 4096))
+RETRIEVAL_CACHE_TTL = int(os.getenv("RETRIEVAL_CACHE_TTL", 86400))
+RETRIEVAL_NEGATIVE_TTL = int(os.getenv("RETRIEVAL_NEGATIVE_TTL", 60))
+RETRIEVAL_KEY_PREFIX = "ret:"
+DB_PORT = 0
+
+# 1차: 프로세스 내부 LRU, 2차: Redis (인스턴스 간 공유)
+local_cache = LRUCache(max_size=RETRIEVAL_CACHE_SIZE, ttl_seconds=RETRIEVAL_CACHE_TTL)
+try:
+    redis_client = connect_redis.get_redis_client(DB_PORT)
+except Exception as e:
+    logging.warning(f"검색 결과 캐시 Redis 연결 실패, 로컬 캐시만 사용합니다: {e}")
+    redis_client = None
+
+
+# 캐시된 검색 결과 한 건 (Qdrant ScoredPoint의 id/score/payload와 같은 이름)
+class CachedHit(NamedTuple):
+    id: object
+    score: float
+    payload: dict
+
+
+# 필터를 순서와 무관한 문자열로 변환 (dict 또는 qdrant Filter 모델)
+def _filter_key(query_filter) -> str:
+    if query_filter is None:
+        return ""
+    if hasattr(query_filter, "model_dump"):
+        query_filter = query_filter.model_dump(exclude_none=True)
+    return json.dumps(query_filter, sort_keys=True, ensure_ascii=False, default=str)
+
+
+# 검색 결과 캐시 키 (컬렉션 + 컬렉션 버전 + 질의 벡터 해시 + 필터 + limit)
+def make_cache_key(collection_name, version, query_vector, query_filter, limit) -> str:
+    digest = hashlib.sha1(np.asarray(query_vector, dtype=np.float32).tobytes())
+    digest.update(f"|{_filter_key(query_filter)}|{limit}".encode("utf-8"))
+    return f"{RETRIEVAL_KEY_PREFIX}{collection_name}:{version}:{digest.hexdigest()}"
+
+
+# Qdrant 검색 (캐시 우선 조회)
+# negative_below: 최고 유사도가 이 값 미만이면 "찾지 못함" 결과로 보고 짧게만 보관
+# 반환: CachedHit 목록 (유사도 내림차순)
+def cached_search(
+    qdrant_client,
+    collection_name,
+    query_vector,
+    limit,
+    query_filter=None,
+    negative_below=None,
+) -> list:
+    version = data_version.collection_version(collection_name)
+    key = make_cache_key(collection_name, version, query_vector, query_filter, limit)
+
+    cached = local_cache.get(key)
+    if cached is not None:
+        monitoring.record_retrieval_cache(collection_name, "local", "hit")
+        return cached
+    monitoring.record_retrieval_cache(collection_name, "local", "miss")
+
+    if redis_client is not None:
+        try:
+            raw = redis_client.get(key)
+            if raw:
+                data = json.loads(raw)
+                hits = [CachedHit(*hit) for hit in data["hits"]]
+                local_cache.set(key, hits, ttl_seconds=data["ttl"])
+                monitoring.record_retrieval_cache(collection_name, "redis", "hit")
+                return hits
+            monitoring.record_retrieval_cache(collection_name, "redis", "miss")
+        except Exception as e:
+            logging.warning(f"검색 결과 캐시 조회 실패 [{collection_name}]: {e}")
+
+    search_results = qdrant_client.search(
+        collection_name=collection_name,
+        query_vector=query_vector,
+        limit=limit,
+        query_filter=query_filter,
+        with_payload=True,
+    )
+    hits = [CachedHit(hit.id, hit.score, hit.payload or {}) for hit in search_results]
+
+    negative = not hits or (
+        negative_below is not None and hits[0].score < negative_below
+    )
+    ttl = RETRIEVAL_NEGATIVE_TTL if negative else RETRIEVAL_CACHE_TTL
+    if ttl <= 0:
+        return hits
+
+    local_cache.set(key, hits, ttl_seconds=ttl)
+    if redis_client is not None:
+        try:
+            redis_client.set(
+                key,
+                json.dumps(
+                    {"hits": [list(hit) for hit in hits], "ttl": ttl},
+                    ensure_ascii=False,
+                    default=str,
+                ),
+                ex=ttl,
+            )
+        except Exception as e:
+            logging.warning(f"검색 결과 캐시 저장 실패 [{collection_name}]: {e}")
+
+    return hits
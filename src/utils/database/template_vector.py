@@ -2,14 +2,12 @@ import os
 import uuid
 import logging
 import pandas as pd
-from qdrant_client.models import PointStruct
 from src.utils.database.connect_qdrant import init_qdrant
 from src.utils.tools.embedding import vectorize
+import src.utils.database.data_version as data_version
 
 # 환경 변수 설정
 QDRANT_COLLECTION = "template_vectors"
-EMBEDDING_MODEL = "gemini-embedding-001"
-EMBEDDING_DIM = 768
 CSV_PATH = os.path.join(
     os.path.dirname(__file__), "..", "..", "..", "dataset", "template_dummy.csv"
 )
@@ -26,28 +24,25 @@ def load_templates(csv_path=CSV_PATH):
 
 # 벡터 + 메타데이터 저장 함수
 def upsert_templates_batch(templates):
-    points = []
     # 빈 문자열 제거
     titles = [t for t in templates["title"] if t and t.strip()]
     descriptions = [d for d in templates["description"] if d and d.strip()]
+    payloads = [{**templates, "part": "title", "title": t} for t in titles] + [
+        {**templates, "part": "description", "description": d} for d in descriptions
+    ]
     try:
-        if titles:
-            title_vectors = vectorize(titles)
-            for t, v in zip(titles, title_vectors):
-                title_payload = {**templates, "part": "title", "title": t}
-                points.append(
-                    PointStruct(id=str(uuid.uuid4()), vector=v, payload=title_payload)
-                )
-        if descriptions:
-            desc_vectors = vectorize(descriptions)
-            for d, v in zip(descriptions, desc_vectors):
-                desc_payload = {**templates, "part": "description", "description": d}
-                points.append(
-                    PointStruct(id=str(uuid.uuid4()), vector=v, payload=desc_payload)
-                )
-        if points:
-            qdrant_client.upsert(collection_name=QDRANT_COLLECTION, points=points)
-            logging.info(f"총 {len(points)}개 벡터를 Qdrant에 저장 완료")
+        if payloads:
+            # 제목과 설명을 한 번에 벡터화해 (n, dim) 행렬을 그대로 업로드
+            vectors = vectorize(titles + descriptions)
+            qdrant_client.upload_collection(
+                collection_name=QDRANT_COLLECTION,
+                vectors=vectors,
+                payload=payloads,
+                ids=[str(uuid.uuid4()) for _ in payloads],
+                wait=True,
+            )
+            logging.info(f"총 {len(payloads)}개 벡터를 Qdrant에 저장 완료")
+            data_version.bump(QDRANT_COLLECTION)
         else:
             logging.warning("업서트할 벡터가 없습니다.")
     except Exception as e:
@@ -1,4 +1,3 @@
-from qdrant_client.models import PointStruct
 import json
 import os
 
@@ -6,6 +5,7 @@ from src.utils.tools.embedding import vectorize
 import src.layers.LLM.bedrock_model as bedrock_model
 from src.utils.tools.stt import get_caption
 from src.utils.database.connect_qdrant import init_qdrant
+import src.utils.database.data_version as data_version
 
 # 환경 변수 설정
 QDRANT_COLLECTION = "meeting_vectors"
@@ -26,24 +26,31 @@ def summarize_texts(texts):
     return response
 
 
-# 배치로 Qdrant에 데이터 저장
-def save_data(batch_data, audio_path):
-    points = []
-    for _, (data, vector) in enumerate(batch_data):
-        point_id = hash(f"{audio_path}_{data['start']}_{data['end']}") % (2**31)
+# 배치로 Qdrant에 데이터 저장 (vectors: (n, dim) float32 행렬)
+def save_data(batch, vectors, audio_path):
+    point_ids = []
+    payloads = []
+    for data in batch:
+        point_ids.append(hash(f"{audio_path}_{data['start']}_{data['end']}") % (2**31))
 
         # 메타데이터 구성
-        payload = {
-            "description": data["description"],
-            "file_name": os.path.basename(audio_path),
-            "start": data["start"],
-            "end": data["end"],
-            "text": data["text"],
-        }
-
-        points.append(PointStruct(id=point_id, vector=vector, payload=payload))
-
-    qdrant_client.upsert(collection_name=QDRANT_COLLECTION, points=points)
+        payloads.append(
+            {
+                "description": data["description"],
+                "file_name": os.path.basename(audio_path),
+                "start": data["start"],
+                "end": data["end"],
+                "text": data["text"],
+            }
+        )
+
+    qdrant_client.upload_collection(
+        collection_name=QDRANT_COLLECTION,
+        vectors=vectors,
+        payload=payloads,
+        ids=point_ids,
+        wait=True,
+    )
 
 
 # 요약데이터 저장
@@ -58,10 +65,14 @@ def save_summarize(audio_path, description, summarize):
         "audio_path": audio_path,
     }
 
-    point = PointStruct(id=point_id, vector=vector, payload=payload)
-
-    # Qdrant에 저장
-    qdrant_client.upsert(collection_name=QDRANT_COLLECTION, points=[point])
+    # Qdrant에 저장 (벡터 배열을 리스트로 바꾸지 않고 (1, dim) 뷰로 그대로 전달)
+    qdrant_client.upload_collection(
+        collection_name=QDRANT_COLLECTION,
+        vectors=vector.reshape(1, -1),
+        payload=[payload],
+        ids=[point_id],
+        wait=True,
+    )
 
 
 # 파이프 라인 생성
@@ -96,8 +107,10 @@ def pipeline(file_description, audio_path):
         # 벡터화 (빈 리스트가 아닐 때만)
         if texts:
             vectors = vectorize(texts)
-            batch_data = list(zip(filtered_batch, vectors))
-            save_data(batch_data, audio_path)
+            save_data(filtered_batch, vectors, audio_path)
+
+    # 회의록이 추가되었으므로 사내 정보 캐시 답변은 무효
+    data_version.bump(QDRANT_COLLECTION)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,143 @@
+import os
+import time
+import random
+import logging
+import threading
+import requests
+from concurrent.futures import Future
+from requests.adapters import HTTPAdapter
+
+from src.utils.tools.worker_pool import BoundedWorkerPool, KeyedScheduler
+
+# 환경 변수 설정
+DISPATCH_WORKERS = int(os.getenv("DISPATCH_WORKERS", 4))
+DISPATCH_QUEUE_SIZE = int(os.getenv("DISPATCH_QUEUE_SIZE", 500))
+DISPATCH_MAX_RETRIES = int(os.getenv("DISPATCH_MAX_RETRIES", 3))
+DISPATCH_BACKOFF_BASE = float(os.getenv("DISPATCH_BACKOFF_BASE", 0.5))
+DISPATCH_TIMEOUT = 10
+MIN_SEND_INTERVAL = 0.05  # 429 수신 시 최소 전송 간격 시작값(초)
+MAX_SEND_INTERVAL = 5.0
+DEFAULT_KEY = "default"
+
+
+# 비동기 웹훅 메시지 전송기
+# - keep-alive 세션 재사용
+# - 대화(키)별 전송 순서 보장
+# - 재시도(지수 백오프) 및 429 응답 시 전송 간격 자동 조절
+class MessageDispatcher:
+    def __init__(self, webhook_url, workers: int = DISPATCH_WORKERS):
+        self.webhook_url = webhook_url
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Content-Type": "application/json"})
+
+        self.pool = BoundedWorkerPool(
+            "dispatch",
+            size=workers,
+            queue_size=DISPATCH_QUEUE_SIZE,
+            overflow_policy="reject",
+        )
+        self.scheduler = KeyedScheduler(self.pool, max_pending_per_key=100)
+
+        # 적응형 전송 간격
+        self._throttle_lock = threading.Lock()
+        self._send_interval = 0.0
+        self._next_send_at = 0.0
+
+    # 메시지 전송 예약 (결과는 (성공 여부, 메시지) 튜플로 Future에 설정)
+    def send(self, payload, key=None) -> Future:
+        future = Future()
+        if not self.webhook_url:
+            future.set_result((False, "Webhook URL이 설정되지 않았습니다."))
+            return future
+
+        def reject():
+            future.set_result((False, "전송 대기열이 가득 찼습니다."))
+
+        if not self.scheduler.submit(
+            key or DEFAULT_KEY, self._deliver, payload, future, on_reject=reject
+        ):
+            reject()
+        return future
+
+    def _deliver(self, payload, future):
+        try:
+            result = self._post_with_retry(payload)
+        except Exception as e:
+            result = (False, f"전송 오류: {str(e)}")
+        future.set_result(result)
+
+    # 재시도 포함 전송
+    def _post_with_retry(self, payload):
+        result = (False, "전송 실패")
+        for attempt in range(DISPATCH_MAX_RETRIES + 1):
+            self._wait_for_slot()
+            try:
+                response = self.session.post(
+                    self.webhook_url, json=payload, timeout=DISPATCH_TIMEOUT
+                )
+            except requests.exceptions.RequestException as e:
+                result = (False, f"요청 오류: {str(e)}")
+                self._sleep_backoff(attempt)
+                continue
+
+            if response.status_code == 200:
+                self._on_success()
+                return True, "메시지 전송 성공"
+
+            result = (False, f"HTTP {response.status_code}: {response.text}")
+            if response.status_code == 429:
+                self._on_rate_limited(response.headers.get("Retry-After"))
+            elif response.status_code >= 500:
+                self._sleep_backoff(attempt)
+            else:
+                # 4xx는 재시도해도 결과가 같으므로 중단
+                break
+
+        logging.error(f"웹훅 메시지 전송 실패: {result[1]}")
+        return result
+
+    def _sleep_backoff(self, attempt):
+        if attempt < DISPATCH_MAX_RETRIES:
+            delay = DISPATCH_BACKOFF_BASE * (2**attempt)
+            time.sleep(delay + random.uniform(0, delay / 2))
+
+    # 전송 슬롯 확보 (간격이 0이면 바로 전송)
+    def _wait_for_slot(self):
+        with self._throttle_lock:
+            now = time.monotonic()
+            send_at = max(now, self._next_send_at)
+            self._next_send_at = send_at + self._send_interval
+        if send_at > now:
+            time.sleep(send_at - now)
+
+    # 성공 시 전송 간격을 점진적으로 줄임
+    def _on_success(self):
+        with self._throttle_lock:
+            if self._send_interval:
+                self._send_interval *= 0.9
+                if self._send_interval < MIN_SEND_INTERVAL / 2:
+                    self._send_interval = 0.0
+
+    # 429 수신 시 전송 간격을 늘리고 Retry-After 동안 전송 중지
+    def _on_rate_limited(self, retry_after):
+        try:
+            pause = float(retry_after) if retry_after else 1.0
+        except ValueError:
+            pause = 1.0
+
+        with self._throttle_lock:
+            self._send_interval = min(
+                MAX_SEND_INTERVAL, max(MIN_SEND_INTERVAL, self._send_interval * 2)
+            )
+            self._next_send_at = max(self._next_send_at, time.monotonic() + pause)
+        logging.warning(
+            f"웹훅 전송 제한(429) 감지: {pause:.1f}초 대기, 전송 간격 {self._send_interval:.2f}초"
+        )
+
+    # 남은 메시지를 모두 보낸 뒤 세션 종료
+    def close(self):
+        self.pool.drain()
+        self.session.close()
@@ -3,14 +3,15 @@ import ssl
 import time
 import threading
 import random
-import requests
 import os
 from dotenv import load_dotenv
 import logging
+import atexit
 
 
 import src.layers.guardrail.guardrail as guardrail
 import src.utils.tools.translate as translate
+import src.utils.tools.phrase_catalog as phrase_catalog
 import src.layers.filter.total_model as filter
 import src.layers.prompt.prompt_smalltalk as prompt_smalltalk
 import src.layers.prompt.prompt_internal as prompt_internal
@@ -19,14 +20,22 @@ import src.layers.prompt.faq_prompt as prompt_faq
 import src.layers.prompt.template_prompt as prompt_template
 import src.layers.LLM.bedrock_model as bedrock_model
 import src.utils.database.redis_caching as redis_caching
+import src.utils.database.cache_writer as cache_writer
+import src.utils.database.data_version as data_version
 import src.layers.monitoring.monitoring as monitoring
 import src.utils.tools.context_manager as context_manager
 import src.utils.socket.json_template as json_template
+from src.utils.socket.message_dispatcher import MessageDispatcher
+import src.utils.tools.stage_runner as stage_runner
+import src.utils.tools.single_flight as single_flight
+from src.utils.tools.worker_pool import BoundedWorkerPool, KeyedScheduler
+from src.utils.tools.request_context import RequestContext
 from src.layers.filter.total_model import update_feedback
 
 load_dotenv()
 bedrock_client = bedrock_model.setup_bedrock()
 redis_caching.configure_redis()
+guardrail_engine = guardrail.get_guardrail_engine()
 
 FEEDBACK_PERCENT = 0.1
 
@@ -45,6 +54,17 @@ class WebSocketClient:
         self.connection_failed = False  # 연결 실패 플래그 추가
         self.pre_chat = {}
         self.pre_label = {}
+        self.user_lang = {}
+
+        # 파이프라인 작업용 워커 풀 (메시지마다 스레드를 만들지 않음)
+        self.worker_pool = BoundedWorkerPool("pipeline")
+        # 사용자별 순서 보장 스케줄러
+        self.scheduler = KeyedScheduler(self.worker_pool)
+        # 웹훅 메시지 전송기 (keep-alive 세션, 백그라운드 전송)
+        self.dispatcher = MessageDispatcher(webhook_url)
+        # close()와 atexit 양쪽에서 호출되므로 정리는 한 번만 실행
+        self._drain_started = threading.Event()
+        atexit.register(self.drain_workers)
 
     def pipeline(self, input_text, user_id="default_user"):
         start_time = time.time()
@@ -52,37 +72,74 @@ class WebSocketClient:
         # 변수 초기화
         filtered_label = "unknown"
         filtered_confidence = 0.0
+        filtered_text = None
         INPUT_LANG = "KO"
+        ctx = None
+        moderation_stage = None
+        context_stage = None
+        cache_stage = None
 
         try:
             # 번역 레이어
-            translated_text, INPUT_LANG = translate.translater(input_text)
+            # (파이프라인 언어와 같은 입력은 로컬 감지만 하고 DeepL을 호출하지 않음)
+            translated_text, INPUT_LANG = translate.translate_input(input_text)
             if INPUT_LANG == "EN":
                 INPUT_LANG = "EN-US"
+            # 명령어 응답 등 고정 문구에 사용할 사용자 언어 기억
+            self.user_lang[user_id] = INPUT_LANG
+
+            # 요청 컨텍스트 (임베딩은 한 번만 계산해 캐시/검색 단계가 공유)
+            ctx = RequestContext(
+                input_text=input_text,
+                user_id=user_id,
+                translated_text=translated_text,
+                lang=INPUT_LANG,
+            )
 
             temp_text = "대화의 주제를 확인하는 중이에요"
-            if INPUT_LANG != "KO":
-                temp_text, _ = translate.translater(temp_text, INPUT_LANG)
-            self.send_webhook_message("[SYSTEM] " + temp_text + "...")
+            temp_text = phrase_catalog.localize(temp_text, INPUT_LANG)
+            self.send_webhook_message("[SYSTEM] " + temp_text + "...", user_id)
 
             # 대화 수 기록
             monitoring.record_conversation(language=INPUT_LANG)
 
-            # 가드레일 설정
-            csv_file_path = "./dataset/chat_scenario_dataset.csv"
-            groq_client, blacklist_keywords, blacklist_responses = (
-                guardrail.setup_guardrail(csv_file_path)
-            )
+            # 1차 가드레일 필터링 (로컬 블랙리스트, 즉시 판단)
+            final_response = guardrail_engine.check_stage1(input_text)
 
-            final_response = guardrail.comprehensive_profanity_filter(
-                input_text,
-                blacklist_keywords,
-                blacklist_responses,
-                groq_client,
-            )
+            if final_response is None:
+                # 서로 독립적인 외부 호출을 동시에 시작
+                # (2차 LLM 필터링, 관련 컨텍스트 탐색)
+                moderation_stage = stage_runner.submit(
+                    guardrail_engine.check_stage2, input_text
+                )
+                context_stage = stage_runner.submit(
+                    context_manager.find_related_context,
+                    translated_text,  # 번역된 텍스트 사용
+                    user_id,
+                    bedrock_client,
+                )
+
+                # 필터 레이어 (로컬 모델이므로 외부 호출을 기다리는 동안 수행)
+                filtered_text = filter.hybrid_predict(translated_text, k=1)
+                print(filtered_text)
+
+                if filtered_text:
+                    filtered_label = filtered_text[0][0]  # 필터링된 라벨
+                    filtered_confidence = filtered_text[1][0]  # 필터링된 신뢰도
+                ctx.label = filtered_label
+                ctx.confidence = filtered_confidence
+
+                # 캐시 검색도 투기적으로 미리 시작 (여기서 계산한 임베딩을 이후 단계가 재사용)
+                if filtered_label != "__label__smalltalk":
+                    cache_stage = stage_runner.submit(self.search_cache_stage, ctx)
+
+                # 가드레일 결과 합류
+                final_response = moderation_stage.result()
+
+            if final_response is not None:
+                # 차단된 경우 투기적 작업 취소
+                stage_runner.cancel(context_stage, cache_stage)
 
-            # 가드레일 필터링
-            if "정상적인 대화입니다." != final_response:
                 monitoring.record_success("guardrail_blocked", 1.0)
                 monitoring.record_weekly_response("guardrail", success=True)
 
@@ -92,27 +149,17 @@ class WebSocketClient:
                     "guardrail", total_duration, success=True
                 )
 
-                if INPUT_LANG != "KO":
-                    final_response, _ = translate.translater(final_response, INPUT_LANG)
+                final_response = phrase_catalog.localize(final_response, INPUT_LANG)
 
                 return final_response, None
 
-            # 관련 컨텍스트 찾기 (프롬프트 생성 전에 수행)
-            related_context = context_manager.find_related_context(
-                translated_text,  # 번역된 텍스트 사용
-                user_id,
-                bedrock_client,
-            )
-
-            # 필터 레이어
-            filtered_text = filter.hybrid_predict(translated_text, k=1)
-            print(filtered_text)
+            # 관련 컨텍스트 합류 (프롬프트 생성 전에 필요)
+            related_context = context_stage.result()
 
             if filtered_text:
-                filtered_label = filtered_text[0][0]  # 필터링된 라벨
-                filtered_confidence = filtered_text[1][0]  # 필터링된 신뢰도
-
                 if filtered_confidence <= 0.6 and not related_context:
+                    stage_runner.cancel(cache_stage)
+
                     # 전체 응답 시간 기록 (실패)
                     total_duration = time.time() - start_time
                     monitoring.record_total_response_time(
@@ -123,23 +170,23 @@ class WebSocketClient:
                     context_manager.add_to_history(
                         user_id, input_text, low_confidence_response
                     )
-                    if INPUT_LANG != "KO":
-                        low_confidence_response, _ = translate.translater(
-                            low_confidence_response, INPUT_LANG
-                        )
+                    low_confidence_response = phrase_catalog.localize(
+                        low_confidence_response, INPUT_LANG
+                    )
                     return low_confidence_response, None
 
             # 캐쉬 확인
             url_data = None
             temp_text = "캐시를 확인하는 중이에요"
-            if INPUT_LANG != "KO":
-                temp_text, _ = translate.translater(temp_text, INPUT_LANG)
-            self.send_webhook_message("[SYSTEM] " + temp_text + "...")
+            temp_text = phrase_catalog.localize(temp_text, INPUT_LANG)
+            self.send_webhook_message("[SYSTEM] " + temp_text + "...", user_id)
 
-            if filtered_label != "__label__smalltalk":
-                answer, _, url_data = redis_caching.search_cache(translated_text)
+            if cache_stage is not None:
+                answer, _, url_data = cache_stage.result()
                 if answer:
-                    result, _ = translate.translater(answer, INPUT_LANG)
+                    for doc_id in ctx.cache_hits:
+                        redis_caching.count_question(doc_id)
+                    result = translate.translate_output(answer, INPUT_LANG)
 
                     # 캐시 히트 시 성공 기록
                     monitoring.record_success(filtered_label, filtered_confidence)
@@ -153,56 +200,52 @@ class WebSocketClient:
 
                     return result, url_data
 
-            # 컨텍스트를 포함한 프롬프트 생성
-            if related_context:
-                prompt_text = context_manager.build_context_prompt(
-                    input_text, related_context
-                )
-
-            # 프롬프트 레이어
-            elif "__label__smalltalk" == filtered_label:
-                prompt_text = prompt_smalltalk.build_smalltalk_prompt(input_text)
-                monitoring.record_prompt_usage("smalltalk", filtered_label)
-            elif "__label__org_chart" == filtered_label:
-                prompt_text = prompt_member.make_prompt(input_text)
-                monitoring.record_prompt_usage("org_chart", filtered_label)
-            elif "__label__form_request" == filtered_label:
-                prompt_text, url_data = prompt_template.make_prompt(input_text)
-                monitoring.record_prompt_usage("form_request", filtered_label)
-            elif "__label__internal_info" == filtered_label:
-                tmp = prompt_faq.find_faq_answer(input_text)
-                if tmp["status"] == "fallback_to_rag":
-                    prompt_text = prompt_internal.build_prompt(
-                        input_text, user_id, auth=True
-                    )
-                    monitoring.record_prompt_usage("internal_rag", filtered_label)
-                elif tmp["status"] == "success":
-                    prompt_text = tmp["answer"]
-                    monitoring.record_prompt_usage("faq", filtered_label)
-                else:
-                    temp_text = "관련된 정보를 찾을 수 없어요."
-                    if INPUT_LANG != "KO":
-                        temp_text, _ = translate.translater(temp_text, INPUT_LANG)
-                    return temp_text, None
+            # 프롬프트 생성 및 LLM 호출
+            # 답변이 의존하는 원본 데이터 버전은 검색 전에 기록 (도중에 바뀌면 오래된 항목이 됨)
+            versions = data_version.stamp(
+                data_version.collections_for_label(filtered_label)
+            )
+            shared = False
+            generate_started = time.time()
+            if related_context or filtered_label == "__label__smalltalk":
+                response, url_data = self.generate_response(ctx, related_context)
             else:
-                prompt_text = input_text
-
-            # LLM 레이어
-            temp_text = "답변을 생성하는 중이에요"
-            if INPUT_LANG != "KO":
-                temp_text, _ = translate.translater(temp_text, INPUT_LANG)
-            self.send_webhook_message("[SYSTEM] " + temp_text + "...")
-            response = bedrock_model.call_model(bedrock_client, prompt_text)
+                # 같은 질문이 동시에 들어오면 먼저 시작한 요청의 답변을 함께 사용
+                # (사내 문서 검색은 권한에 따라 결과가 달라지므로 부서 범위로 구분)
+                flight_key = single_flight.make_key(
+                    translated_text, filtered_label, self.cache_scope(ctx)
+                )
+                (response, url_data), shared = single_flight.run(
+                    flight_key, self.generate_response, ctx, None
+                )
 
-            # 캐싱 저장
-            if filtered_label != "__label__smalltalk":
-                redis_caching.add_cache(translated_text, response, url_data)
+            if response is None:
+                temp_text = "관련된 정보를 찾을 수 없어요."
+                temp_text = phrase_catalog.localize(temp_text, INPUT_LANG)
+                return temp_text, None
+
+            # 캐싱 저장 (백그라운드에서 배치로 저장, 응답은 기다리지 않음)
+            # 다른 요청의 답변을 공유받은 경우 그 요청이 저장
+            if filtered_label != "__label__smalltalk" and not shared:
+                cache_writer.submit(
+                    translated_text,
+                    response,
+                    url_data,
+                    ttl_sec=redis_caching.cache_ttl(
+                        filtered_label, versions, time.time() - generate_started
+                    ),
+                    # 임베딩이 없으면 저장 스레드가 배치로 계산 (응답 경로에서 API 호출 안 함)
+                    vector=ctx.computed_embedding(),
+                    versions=versions,
+                    label=filtered_label,
+                    scope=self.cache_scope(ctx),
+                )
 
             # 기억 추가
             context_manager.add_to_history(user_id, input_text, response)
 
             # 아웃풋에 대한 번역
-            response, _ = translate.translater(response, INPUT_LANG)
+            response = translate.translate_output(response, INPUT_LANG)
 
             # 전체 응답 시간 기록(성공)
             total_duration = time.time() - start_time
@@ -240,6 +283,214 @@ class WebSocketClient:
             logging.error(f"챗봇 파이프라인 오류: {e}")
             raise
 
+        finally:
+            # 차단/예외 등으로 끝난 요청의 남은 투기적 스테이지 정리
+            if ctx is not None:
+                ctx.cancelled.set()
+            stage_runner.cancel(moderation_stage, context_stage, cache_stage)
+
+    def cache_scope(self, ctx):
+        """캐시/동일 질문 합치기 범위 (사내 문서 답변은 부서별, 나머지는 공용)"""
+        if ctx.label != "__label__internal_info":
+            return redis_caching.GLOBAL_SCOPE
+        if not ctx.scope:
+            department = prompt_internal.search_department(ctx.user_id)
+            ctx.scope = f"dept:{department}" if department else "dept:none"
+        return ctx.scope
+
+    def search_cache_stage(self, ctx):
+        """캐시 조회 (같은 질문은 임베딩 없이 바로 반환, 없으면 벡터 검색)"""
+        # 적중 빈도는 답변을 실제로 사용할 때 기록 (가드레일에 차단되면 기록하지 않음)
+        scope = self.cache_scope(ctx)
+        result = redis_caching.lookup_exact(
+            ctx.translated_text, scope=scope, on_hit=ctx.cache_hits.append
+        )
+        if not result[0]:
+            # 이미 차단/실패한 요청이면 임베딩/벡터 검색 생략
+            if ctx.cancelled.is_set():
+                return None, 0.0, None
+            result = redis_caching.search_cache(
+                ctx.translated_text,
+                query_vector=ctx.embed(),
+                label=ctx.label,
+                scope=scope,
+                on_hit=ctx.cache_hits.append,
+            )
+
+        answer, similarity, _ = result
+        monitoring.record_semantic_cache_lookup(
+            ctx.label,
+            ctx.lang,
+            redis_caching.lookup_result(answer, similarity),
+            similarity,
+        )
+        return result
+
+    def generate_response(self, ctx, related_context=None):
+        """라벨별 프롬프트 생성 후 LLM 호출 (관련 정보가 없으면 (None, None))"""
+        # Qdrant 컬렉션은 원문(한국어)으로 적재되어 있으므로 원문 임베딩으로 검색
+        # (번역문 임베딩은 시맨틱 캐시 조회에만 사용)
+        input_text = ctx.input_text
+        filtered_label = ctx.label
+        url_data = None
+
+        # 컨텍스트를 포함한 프롬프트 생성
+        if related_context:
+            prompt_text = context_manager.build_context_prompt(
+                input_text, related_context
+            )
+
+        # 프롬프트 레이어
+        elif "__label__smalltalk" == filtered_label:
+            prompt_text = prompt_smalltalk.build_smalltalk_prompt(input_text)
+            monitoring.record_prompt_usage("smalltalk", filtered_label)
+        elif "__label__org_chart" == filtered_label:
+            prompt_text = prompt_member.make_prompt(input_text, ctx.embed(input_text))
+            monitoring.record_prompt_usage("org_chart", filtered_label)
+        elif "__label__form_request" == filtered_label:
+            prompt_text, url_data = prompt_template.make_prompt(
+                input_text, ctx.embed(input_text)
+            )
+            monitoring.record_prompt_usage("form_request", filtered_label)
+        elif "__label__internal_info" == filtered_label:
+            tmp = prompt_faq.find_faq_answer(
+                input_text, query_vector=ctx.embed(input_text)
+            )
+            if tmp["status"] == "fallback_to_rag":
+                prompt_text = prompt_internal.build_prompt(
+                    input_text,
+                    ctx.user_id,
+                    auth=True,
+                    query_vector=ctx.embed(input_text),
+                )
+                monitoring.record_prompt_usage("internal_rag", filtered_label)
+            elif tmp["status"] == "success":
+                prompt_text = tmp["answer"]
+                monitoring.record_prompt_usage("faq", filtered_label)
+            else:
+                return None, None
+        else:
+            prompt_text = input_text
+
+        # LLM 레이어
+        temp_text = "답변을 생성하는 중이에요"
+        temp_text = phrase_catalog.localize(temp_text, ctx.lang)
+        self.send_webhook_message("[SYSTEM] " + temp_text + "...", ctx.user_id)
+        response = bedrock_model.call_model(bedrock_client, prompt_text)
+
+        return response, url_data
+
+    def localize(self, text, user_id):
+        """고정 문구를 사용자의 마지막 입력 언어로 변환 (번역표 조회)"""
+        return phrase_catalog.localize(text, self.user_lang.get(user_id, "KO"))
+
+    def handle_user_message(self, text, user_id):
+        """사용자 메시지 처리 (같은 사용자의 메시지는 레인에서 순서대로 실행)"""
+        # FAQ 처리
+        if self.pre_label.get(user_id) == "faq-category":
+            if text.isdigit():
+                category_id = int(text)
+                self.send_blockkit_message(
+                    json_template.faq_question_template(category_id),
+                    user_id,
+                )
+                self.pre_label[user_id] = "faq-question"
+            else:
+                self.send_webhook_message(
+                    self.localize(
+                        '숫자만 입력해 주세요! 다른 대화가 하고 싶으시면 "@나가기"를 입력해주세요!',
+                        user_id,
+                    ),
+                    user_id,
+                )
+        elif self.pre_label.get(user_id) == "faq-question":
+            if text.isdigit():
+                question_id = int(text)
+                self.send_blockkit_message(
+                    json_template.faq_answer_template(question_id),
+                    user_id,
+                )
+                self.pre_label[user_id] = None
+            else:
+                self.send_webhook_message(
+                    self.localize(
+                        '숫자만 입력해 주세요! 다른 대화가 하고 싶으시면 "@나가기"를 입력해주세요!',
+                        user_id,
+                    ),
+                    user_id,
+                )
+
+        # @ 처리
+        elif isinstance(text, str) and text.startswith("@"):
+            if text == "@좋아요" or text == "@싫어요":
+                if self.pre_label.get(user_id) is not None:
+                    return_message = "피드백 감사합니다! 더 좋은 서비스를 제공하기 위해 노력하겠습니다!"
+                    self.send_webhook_message(
+                        self.localize(return_message, user_id), user_id
+                    )
+
+                    # 피드백 적용 후 재예측
+                    update_feedback(
+                        self.pre_chat[user_id],
+                        self.pre_label[user_id],
+                        is_correct=(True if text == "@좋아요" else False),
+                        learning_rate=0.1,
+                    )
+
+                    monitoring.record_user_feedback(
+                        label_type=self.pre_label.get(user_id),
+                        feedback_type=("like" if text == "@좋아요" else "dislike"),
+                    )
+
+                    print(
+                        f"[{text} {self.pre_label.get(user_id)}] {self.pre_chat.get(user_id)} : 피드백 적용 완료"
+                    )
+                    self.pre_chat[user_id] = None
+
+                else:
+                    return_message = "평가를 진행하기 전에 대화를 먼저 해주세요!"
+                    self.send_webhook_message(
+                        self.localize(return_message, user_id), user_id
+                    )
+            elif text.upper() == "@FAQ":
+                payload = json_template.faq_category_template()
+                self.send_blockkit_message(payload, user_id)
+                self.pre_label[user_id] = "faq-category"
+            elif text == "@나가기" and (
+                self.pre_label.get(user_id) == "faq-category"
+                or self.pre_label.get(user_id) == "faq-question"
+            ):
+                self.send_webhook_message(
+                    self.localize(
+                        "FAQ 대화가 종료되었습니다. 궁금한 것을 물어보세요!", user_id
+                    ),
+                    user_id,
+                )
+                self.pre_label[user_id] = None
+
+            else:
+                self.send_webhook_message(
+                    self.localize(
+                        "오타가 있거나 언급된 내용을 지원하지 않습니다. 다시 입력해주세요!",
+                        user_id,
+                    ),
+                    user_id,
+                )
+        else:
+            # pipeline 실행 후 send_webhook_message로 응답 전송
+            response_text, url_data = self.pipeline(text, user_id)
+            self.send_webhook_message(response_text, user_id)
+            # URL 데이터가 있는 경우 메시지 전송
+            if url_data != None and url_data["url"] != None:
+                payload = json_template.url_template(url_data)
+                self.send_blockkit_message(payload, user_id)
+            # pipeline 작업이 끝난 뒤 10% 확률로 피드백 메시지 전송
+            if random.random() < FEEDBACK_PERCENT:
+                payload = json_template.feedback_template()
+                self.send_blockkit_message(payload, user_id)
+            else:
+                self.pre_label[user_id] = None
+
     def on_message(self, ws, message):
         try:
             import json
@@ -275,103 +526,25 @@ class WebSocketClient:
                             ):
                                 return {"text": "메시지를 찾을 수 없습니다."}
 
-                            # FAQ 처리
-                            if self.pre_label.get(user_id) == "faq-category":
-                                if text.isdigit():
-                                    category_id = int(text)
-                                    self.send_blockkit_message(
-                                        json_template.faq_question_template(category_id)
-                                    )
-                                    self.pre_label[user_id] = "faq-question"
-                                else:
-                                    self.send_webhook_message(
-                                        '숫자만 입력해 주세요! 다른 대화가 하고 싶으시면 "@나가기"를 입력해주세요!'
-                                    )
-                            elif self.pre_label.get(user_id) == "faq-question":
-                                if text.isdigit():
-                                    question_id = int(text)
-                                    self.send_blockkit_message(
-                                        json_template.faq_answer_template(question_id)
-                                    )
-                                    self.pre_label[user_id] = None
-                                else:
-                                    self.send_webhook_message(
-                                        '숫자만 입력해 주세요! 다른 대화가 하고 싶으시면 "@나가기"를 입력해주세요!'
-                                    )
-
-                            # @ 처리
-                            elif isinstance(text, str) and text.startswith("@"):
-                                if text == "@좋아요" or text == "@싫어요":
-                                    if self.pre_label.get(user_id) is not None:
-                                        return_message = "피드백 감사합니다! 더 좋은 서비스를 제공하기 위해 노력하겠습니다!"
-                                        self.send_webhook_message(return_message)
-
-                                        # 피드백 적용 후 재예측
-                                        update_feedback(
-                                            self.pre_chat[user_id],
-                                            self.pre_label[user_id],
-                                            is_correct=(
-                                                True if text == "@좋아요" else False
-                                            ),
-                                            learning_rate=0.1,
-                                        )
-
-                                        monitoring.record_user_feedback(
-                                            label_type=self.pre_label.get(user_id),
-                                            feedback_type=(
-                                                "like"
-                                                if text == "@좋아요"
-                                                else "dislike"
-                                            ),
-                                        )
-
-                                        print(
-                                            f"[{text} {self.pre_label.get(user_id)}] {self.pre_chat.get(user_id)} : 피드백 적용 완료"
-                                        )
-                                        self.pre_chat[user_id] = None
-
-                                    else:
-                                        return_message = (
-                                            "평가를 진행하기 전에 대화를 먼저 해주세요!"
-                                        )
-                                        self.send_webhook_message(return_message)
-                                elif text.upper() == "@FAQ":
-                                    payload = json_template.faq_category_template()
-                                    self.send_blockkit_message(payload)
-                                    self.pre_label[user_id] = "faq-category"
-                                elif text == "@나가기" and (
-                                    self.pre_label.get(user_id) == "faq-category"
-                                    or self.pre_label.get(user_id) == "faq-question"
-                                ):
-                                    self.send_webhook_message(
-                                        "FAQ 대화가 종료되었습니다. 궁금한 것을 물어보세요!"
-                                    )
-                                    self.pre_label[user_id] = None
-
-                                else:
-                                    self.send_webhook_message(
-                                        "오타가 있거나 언급된 내용을 지원하지 않습니다. 다시 입력해주세요!"
-                                    )
-                            else:
-
-                                def worker():
-                                    # pipeline 실행 후 send_webhook_message로 응답 전송
-                                    response_text, url_data = self.pipeline(
-                                        text, user_id
-                                    )
-                                    self.send_webhook_message(response_text)
-                                    # URL 데이터가 있는 경우 메시지 전송
-                                    if url_data != None and url_data["url"] != None:
-                                        payload = json_template.url_template(url_data)
-                                        self.send_blockkit_message(payload)
-                                    # pipeline 작업이 끝난 뒤 10% 확률로 피드백 메시지 전송
-                                    if random.random() < FEEDBACK_PERCENT:
-                                        payload = json_template.feedback_template()
-                                        self.send_blockkit_message(payload)
-                                    else:
-                                        self.pre_label[user_id] = None
-
-                                threading.Thread(target=worker, daemon=True).start()
+                            # 사용자별 레인에 넣어 도착 순서대로 처리
+                            # (다른 사용자의 메시지는 워커 풀에서 병렬 처리)
+                            def notify_busy(user_id=user_id):
+                                self.send_webhook_message(
+                                    self.localize(
+                                        "지금은 요청이 많아 처리할 수 없어요. 잠시 후 다시 시도해주세요.",
+                                        user_id,
+                                    ),
+                                    user_id,
+                                )
+
+                            if not self.scheduler.submit(
+                                user_id,
+                                self.handle_user_message,
+                                text,
+                                user_id,
+                                on_reject=notify_busy,
+                            ):
+                                notify_busy()
 
                     else:
                         print(f"\n[이벤트] {event_type}: {data}")
@@ -445,43 +618,19 @@ class WebSocketClient:
         self.ping_thread = threading.Thread(target=ping_worker, daemon=True)
         self.ping_thread.start()
 
-    def send_webhook_message(self, text):
-        """Webhook을 통해 메시지 전송"""
+    def send_webhook_message(self, text, user_id=None, wait=False):
+        """Webhook을 통해 메시지 전송 (기본은 대기열에 넣고 바로 반환)"""
         if not self.webhook_url:
             return False, "Webhook URL이 설정되지 않았습니다."
 
-        try:
-            payload = {"text": text}
+        return self.send_blockkit_message({"text": text}, user_id, wait)
 
-            response = requests.post(
-                self.webhook_url,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=10,
-            )
-
-            if response.status_code == 200:
-                return True, "메시지 전송 성공"
-            else:
-                return False, f"HTTP {response.status_code}: {response.text}"
-
-        except requests.exceptions.RequestException as e:
-            return False, f"요청 오류: {str(e)}"
-
-    def send_blockkit_message(self, payload):
-        try:
-            response = requests.post(
-                self.webhook_url,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=10,
-            )
-            if response.status_code == 200:
-                return True, "메시지 전송 성공"
-            else:
-                return False, f"HTTP {response.status_code}: {response.text}"
-        except requests.exceptions.RequestException as e:
-            return False, f"요청 오류: {str(e)}"
+    def send_blockkit_message(self, payload, user_id=None, wait=False):
+        """전송기를 통해 메시지 전송 (같은 user_id의 메시지는 순서대로 전송)"""
+        future = self.dispatcher.send(payload, key=user_id)
+        if wait:
+            return future.result()
+        return True, "메시지 전송 대기열 등록"
 
     def start_input_thread(self):
         """사용자 입력을 받는 스레드 시작"""
@@ -499,7 +648,9 @@ class WebSocketClient:
                     elif user_input:
                         # Webhook을 통해 메시지 전송
                         if self.webhook_url:
-                            success, message = self.send_webhook_message(user_input)
+                            success, message = self.send_webhook_message(
+                                user_input, wait=True
+                            )
                             if success:
                                 print(f"[전송 성공] {user_input}")
                             else:
@@ -593,6 +744,18 @@ class WebSocketClient:
                 self.ws.close()
             except Exception as e:
                 print(f"[에러] 소켓 종료 중 오류: {e}")
+        # 처리 중인 답변은 끝까지 전송
+        self.drain_workers()
         # os._exit(0) 대신 메인 스레드에서만 종료
 
-
+    def drain_workers(self):
+        """진행 중인 파이프라인 작업 정리 (한 번만 실행)"""
+        if self._drain_started.is_set():
+            return
+        self._drain_started.set()
+        self.worker_pool.drain()
+        stage_runner.shutdown(wait=False)
+        # 남은 답변 메시지까지 전송 후 종료
+        self.dispatcher.close()
+        # 대기 중인 캐시 쓰기 저장
+        cache_writer.drain()
@@ -1,41 +1,76 @@
-import os
-import logging
-from google import genai
-from dotenv import load_dotenv
-from google.genai import types
-
-# 환경 변수 설정
-env_path = os.path.join(os.path.dirname(__file__), "..", "..", "..", ".env")
-load_dotenv(dotenv_path=os.path.abspath(env_path))
-
-EMBEDDING_MODEL = "gemini-embedding-001"
-EMBEDDING_DIM = 768
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-
-# Google Gemini 클라이언트 초기화
-client = genai.Client(api_key=GEMINI_API_KEY)
-
-
-# 텍스트를 벡터화
-def vectorize(texts) -> list:
-    # texts가 str이면 리스트로 변환
-    if isinstance(texts, str):
-        texts = [texts]
-        is_one = True
-    else:
-        is_one = len(texts) == 1
-
-    try:
-        response = client.models.embed_content(
-            model=EMBEDDING_MODEL,
-            contents=texts,
-            config=types.EmbedContentConfig(output_dimensionality=EMBEDDING_DIM),
-        )
-        if is_one:
-            return response.embeddings[0].values
-        else:
-            return [embedding.values for embedding in response.embeddings]
-
-    except Exception as e:
-        logging.error(f"벡터화 중 오류 발생: {e}")
-        raise
+import os
+import logging
+import numpy as np
+
+import src.utils.tools.embedding_cache as embedding_cache
+from src.utils.tools.embedding_batcher import EmbeddingBatcher
+from src.utils.tools.embedding_provider import get_provider
+
+# 임베딩 백엔드 (EMBEDDING_PROVIDER 설정에 따라 gemini/local/hashing)
+provider = get_provider()
+EMBEDDING_MODEL = provider.model
+EMBEDDING_DIM = provider.dim
+
+# 동시 요청 마이크로 배치 사용 여부
+EMBEDDING_BATCHING = os.getenv("EMBEDDING_BATCHING", "true").lower() == "true"
+
+
+# 벡터를 연속된 float32 배열로 변환 (이미 float32 배열이면 복사하지 않음)
+def as_float32(vector) -> np.ndarray:
+    return np.ascontiguousarray(vector, dtype=np.float32)
+
+
+# 텍스트를 벡터화 (임베딩 캐시 우선 조회, 없는 텍스트만 원격 호출)
+# str 입력은 (dim,) 벡터, 리스트 입력은 (n, dim) 행렬(float32) 반환
+def vectorize(texts) -> np.ndarray:
+    # texts가 str이면 리스트로 변환
+    if isinstance(texts, str):
+        texts = [texts]
+        is_one = True
+    else:
+        texts = list(texts)
+        is_one = False
+
+    try:
+        vectors = embedding_cache.get_many(texts, EMBEDDING_MODEL, EMBEDDING_DIM)
+
+        # 캐시에 없는 텍스트만 중복 없이 모아 한 번에 요청
+        missing = list(dict.fromkeys(t for t, v in zip(texts, vectors) if v is None))
+        if missing:
+            missing_matrix = _embed_missing(missing)
+            embedding_cache.set_many(
+                missing, missing_matrix, EMBEDDING_MODEL, EMBEDDING_DIM
+            )
+            # 모든 텍스트가 서로 다르고 캐시에 없었으면 받은 행렬을 그대로 반환 (복사 없음)
+            if len(missing) == len(texts):
+                return missing_matrix[0] if is_one else as_float32(missing_matrix)
+            computed = dict(zip(missing, missing_matrix))
+            vectors = [
+                v if v is not None else computed[t] for t, v in zip(texts, vectors)
+            ]
+
+        if is_one:
+            return vectors[0]
+
+        # 캐시 적중이 섞이면 한 번에 쌓아 (n, dim) 행렬 생성
+        return np.stack(vectors).astype(np.float32, copy=False)
+
+    except Exception as e:
+        logging.error(f"벡터화 중 오류 발생: {e}")
+        raise
+
+
+# 캐시에 없는 텍스트 임베딩 (동시에 들어온 요청은 배치로 묶어서 호출)
+def _embed_missing(texts) -> np.ndarray:
+    if EMBEDDING_BATCHING:
+        return np.stack(batcher.embed(texts))
+    return _embed_remote(texts)
+
+
+# 임베딩 백엔드 호출 ((n, dim) float32 행렬 반환)
+def _embed_remote(texts) -> np.ndarray:
+    return provider.embed(texts)
+
+
+# 임베딩 마이크로 배처 (원격 호출 함수 정의 이후 생성)
+batcher = EmbeddingBatcher(_embed_remote)
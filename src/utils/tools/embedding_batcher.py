@@ -0,0 +1,104 @@
+import os
+import time
+import queue
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import src.layers.monitoring.monitoring as monitoring
+
+# 마이크로 배치 설정
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", 64))
+EMBEDDING_BATCH_WAIT_MS = float(os.getenv("EMBEDDING_BATCH_WAIT_MS", 5))
+EMBEDDING_BATCH_CONCURRENCY = int(os.getenv("EMBEDDING_BATCH_CONCURRENCY", 4))
+
+
+# 동시에 들어온 임베딩 요청을 모아 한 번의 배치 호출로 처리
+# embed_fn(texts) -> 벡터 리스트 (texts와 같은 순서)
+class EmbeddingBatcher:
+    def __init__(
+        self,
+        embed_fn,
+        max_batch_size: int = EMBEDDING_BATCH_SIZE,
+        max_wait_ms: float = EMBEDDING_BATCH_WAIT_MS,
+        concurrency: int = EMBEDDING_BATCH_CONCURRENCY,
+    ):
+        self.embed_fn = embed_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self._queue = queue.Queue()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, concurrency), thread_name_prefix="embedding-batch"
+        )
+        self._thread = None
+        self._lock = threading.Lock()
+
+    # 텍스트 목록 임베딩 (배치 크기 이상인 대량 요청은 모으지 않고 바로 호출)
+    def embed(self, texts) -> list:
+        texts = list(texts)
+        if not texts:
+            return []
+        if len(texts) >= self.max_batch_size:
+            return self._call_chunked(texts)
+
+        self._ensure_started()
+        future = Future()
+        self._queue.put((time.monotonic(), texts, future))
+        return future.result()
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._collect, name="embedding-batcher", daemon=True
+                )
+                self._thread.start()
+
+    # 첫 요청 이후 max_wait 동안 또는 max_batch_size개가 찰 때까지 모아서 전송
+    def _collect(self):
+        while True:
+            first = self._queue.get()
+            batch = [first]
+            count = len(first[1])
+            deadline = first[0] + self.max_wait
+
+            while count < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(item)
+                count += len(item[1])
+
+            self._executor.submit(self._flush, batch)
+
+    def _flush(self, batch):
+        wait_seconds = time.monotonic() - batch[0][0]
+
+        # 같은 텍스트는 한 번만 요청
+        unique = list(dict.fromkeys(text for _, texts, _ in batch for text in texts))
+        monitoring.record_embedding_batch(
+            len(unique), len(unique) / self.max_batch_size, wait_seconds
+        )
+
+        try:
+            computed = dict(zip(unique, self._call_chunked(unique)))
+        except Exception as e:
+            logging.error(f"임베딩 배치 호출 실패 ({len(unique)}개): {e}")
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+
+        for _, texts, future in batch:
+            future.set_result([computed[text] for text in texts])
+
+    def _call_chunked(self, texts) -> list:
+        vectors = []
+        for i in range(0, len(texts), self.max_batch_size):
+            vectors.extend(self.embed_fn(texts[i : i + self.max_batch_size]))
+        return vectors
@@ -0,0 +1,142 @@
+import os
+import hashlib
+import logging
+import numpy as np
+
+import src.layers.monitoring.monitoring as monitoring
+import src.utils.database.connect_redis as connect_redis
+from src.utils.tools.lru_cache import LRUCache
+from src.utils.tools.text_normalize import normalize_question
+
+# 임베딩 캐시 설정
+EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", 20000))
+EMBEDDING_CACHE_TTL = int(os.getenv("EMBEDDING_CACHE_TTL", 86400))
+EMBEDDING_KEY_PREFIX = "emb:"
+DB_PORT = 3
+# 메모리 추정에 사용하는 표본 키 수
+EMBEDDING_STATS_SAMPLE_SIZE = 50
+
+# 전용 Redis 인스턴스 (지정하면 의미 캐시와 maxmemory 예산을 나눠 씀)
+# 지정하지 않으면 의미 캐시 인스턴스의 DB 3을 함께 쓰므로 vec: 항목과 같은 예산에서 LRU로 밀려남
+EMBEDDING_REDIS_HOST = os.getenv("EMBEDDING_REDIS_HOST")
+EMBEDDING_REDIS_PORT = int(os.getenv("EMBEDDING_REDIS_PORT", 6379))
+EMBEDDING_REDIS_MAX_MEMORY = os.getenv("EMBEDDING_REDIS_MAX_MEMORY", "64mb")
+DEDICATED = bool(EMBEDDING_REDIS_HOST)
+
+# 1차: 프로세스 내부 LRU, 2차: Redis (float32 바이트로 저장, 인스턴스 간 공유)
+local_cache = LRUCache(max_size=EMBEDDING_CACHE_SIZE)
+try:
+    redis_client = connect_redis.get_redis_client(
+        DB_PORT,
+        decode_responses=False,
+        host=EMBEDDING_REDIS_HOST,
+        port=EMBEDDING_REDIS_PORT if DEDICATED else None,
+    )
+except Exception as e:
+    logging.warning(f"임베딩 캐시 Redis 연결 실패, 로컬 캐시만 사용합니다: {e}")
+    redis_client = None
+
+
+# 전용 인스턴스의 메모리 예산 설정 (공유 인스턴스는 의미 캐시 설정을 따름)
+def configure() -> None:
+    if not DEDICATED or redis_client is None:
+        return
+    try:
+        redis_client.config_set("maxmemory-policy", "allkeys-lru")
+        redis_client.config_set("maxmemory", EMBEDDING_REDIS_MAX_MEMORY)
+    except Exception as e:
+        logging.warning(f"임베딩 캐시 Redis 설정 실패: {e}")
+
+
+# 임베딩 캐시 키 (모델, 차원, 정규화한 텍스트의 해시)
+# 대소문자/공백/끝 문장부호만 다른 질문은 같은 임베딩을 공유
+def make_cache_key(text, model, dim):
+    raw = f"{model}|{dim}|{normalize_question(text)}"
+    return EMBEDDING_KEY_PREFIX + hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+# 여러 텍스트의 임베딩 조회 (없는 항목은 None)
+def get_many(texts, model, dim):
+    keys = [make_cache_key(text, model, dim) for text in texts]
+    results = [local_cache.get(key) for key in keys]
+
+    missing = [i for i, vector in enumerate(results) if vector is None]
+    monitoring.record_embedding_cache("local", "hit", len(texts) - len(missing))
+    monitoring.record_embedding_cache("local", "miss", len(missing))
+    if not missing or redis_client is None:
+        return results
+
+    try:
+        raws = redis_client.mget([keys[i] for i in missing])
+    except Exception as e:
+        logging.warning(f"임베딩 캐시 조회 실패: {e}")
+        return results
+
+    hits = 0
+    for i, raw in zip(missing, raws):
+        if raw is None or len(raw) != dim * 4:
+            continue
+        vector = np.frombuffer(raw, dtype=np.float32)
+        local_cache.set(keys[i], vector)
+        results[i] = vector
+        hits += 1
+
+    monitoring.record_embedding_cache("redis", "hit", hits)
+    monitoring.record_embedding_cache("redis", "miss", len(missing) - hits)
+    return results
+
+
+# 여러 텍스트의 임베딩 저장
+# 배치 행렬의 행을 그대로 보관하면 행렬 전체가 유지되므로 벡터별로 분리해 저장
+# 캐시된 배열은 여러 호출자가 공유하므로 읽기 전용으로 고정
+def set_many(texts, vectors, model, dim):
+    keys = [make_cache_key(text, model, dim) for text in texts]
+    vectors = [np.array(vector, dtype=np.float32) for vector in vectors]
+    for key, vector in zip(keys, vectors):
+        vector.setflags(write=False)
+        local_cache.set(key, vector)
+
+    if redis_client is None:
+        return
+
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        for key, vector in zip(keys, vectors):
+            pipe.set(key, vector.data, ex=EMBEDDING_CACHE_TTL)
+        pipe.execute()
+    except Exception as e:
+        logging.warning(f"임베딩 캐시 저장 실패: {e}")
+
+
+# Redis 임베딩 캐시 현황 (항목 수, 추정 메모리, 전용 인스턴스 여부)
+# 공유 인스턴스라면 memory만큼 의미 캐시가 쓸 수 있는 예산이 줄어듦
+def cache_usage() -> dict:
+    usage = {"dedicated": DEDICATED, "entries": 0, "memory": 0, "max_memory": 0}
+    if redis_client is None:
+        return usage
+
+    try:
+        usage["entries"] = int(redis_client.dbsize())
+        if DEDICATED:
+            memory = redis_client.info("memory")
+            usage["memory"] = int(memory.get("used_memory", 0))
+            usage["max_memory"] = int(memory.get("maxmemory", 0))
+            return usage
+
+        # 공유 인스턴스는 일부 키의 MEMORY USAGE 평균으로 추정
+        _, keys = redis_client.scan(
+            0,
+            match=f"{EMBEDDING_KEY_PREFIX}*",
+            count=EMBEDDING_STATS_SAMPLE_SIZE * 10,
+        )
+        keys = keys[:EMBEDDING_STATS_SAMPLE_SIZE]
+        if keys:
+            pipe = redis_client.pipeline(transaction=False)
+            for key in keys:
+                pipe.memory_usage(key)
+            sizes = [size for size in pipe.execute() if size]
+            if sizes:
+                usage["memory"] = usage["entries"] * int(sum(sizes) / len(sizes))
+    except Exception as e:
+        logging.warning(f"임베딩 캐시 현황 조회 실패: {e}")
+    return usage
@@ -0,0 +1,141 @@
+import os
+import re
+import hashlib
+import logging
+import threading
+import numpy as np
+from abc import ABC, abstractmethod
+from dotenv import load_dotenv
+
+# 환경 변수 설정
+env_path = os.path.join(os.path.dirname(__file__), "..", "..", "..", ".env")
+load_dotenv(dotenv_path=os.path.abspath(env_path))
+
+# 임베딩 백엔드 선택 (gemini | local | hashing)
+EMBEDDING_PROVIDER = os.getenv("EMBEDDING_PROVIDER", "gemini").lower()
+EMBEDDING_DIM = int(os.getenv("EMBEDDING_DIM", 768))
+GEMINI_EMBEDDING_MODEL = os.getenv("GEMINI_EMBEDDING_MODEL", "gemini-embedding-001")
+LOCAL_EMBEDDING_MODEL = os.getenv(
+    "LOCAL_EMBEDDING_MODEL", "intfloat/multilingual-e5-small"
+)
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+# 임베딩 백엔드 공통 인터페이스
+# model: 캐시 키 등에 사용하는 모델 식별자, dim: 벡터 차원
+class EmbeddingProvider(ABC):
+    name = "base"
+
+    def __init__(self, model: str, dim: int):
+        self.model = model
+        self.dim = dim
+
+    # 텍스트 목록 임베딩 ((n, dim) float32 행렬 반환)
+    @abstractmethod
+    def embed(self, texts) -> np.ndarray: ...
+
+
+# Google Gemini 임베딩 API
+class GeminiProvider(EmbeddingProvider):
+    name = "gemini"
+
+    def __init__(self, model: str = GEMINI_EMBEDDING_MODEL, dim: int = EMBEDDING_DIM):
+        super().__init__(model, dim)
+        from google import genai
+        from google.genai import types
+
+        self._types = types
+        self.client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+
+    def embed(self, texts) -> np.ndarray:
+        response = self.client.models.embed_content(
+            model=self.model,
+            contents=list(texts),
+            config=self._types.EmbedContentConfig(output_dimensionality=self.dim),
+        )
+        return np.array(
+            [embedding.values for embedding in response.embeddings], dtype=np.float32
+        )
+
+
+# 로컬 CPU 모델 (sentence-transformers 필요)
+class LocalProvider(EmbeddingProvider):
+    name = "local"
+
+    def __init__(self, model: str = LOCAL_EMBEDDING_MODEL):
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise ImportError(
+                "로컬 임베딩을 사용하려면 sentence-transformers 패키지가 필요합니다."
+            ) from e
+
+        self.encoder = SentenceTransformer(model, device="cpu")
+        super().__init__(model, self.encoder.get_sentence_embedding_dimension())
+
+    def embed(self, texts) -> np.ndarray:
+        vectors = self.encoder.encode(
+            list(texts), convert_to_numpy=True, normalize_embeddings=True
+        )
+        return np.ascontiguousarray(vectors, dtype=np.float32)
+
+
+# 해시 기반 결정적 임베딩 (외부 호출 없음, 테스트/벤치마크용)
+# 단어와 문자 3-gram을 feature hashing으로 투영하므로 비슷한 문장은 비슷한 벡터가 됨
+class HashingProvider(EmbeddingProvider):
+    name = "hashing"
+
+    def __init__(self, dim: int = EMBEDDING_DIM):
+        super().__init__(f"hashing-v1-{dim}", dim)
+
+    def _features(self, text: str):
+        tokens = _TOKEN_PATTERN.findall(text.lower())
+        for token in tokens:
+            yield "w:" + token
+            padded = f" {token} "
+            for i in range(len(padded) - 2):
+                yield "c:" + padded[i : i + 3]
+
+    def embed(self, texts) -> np.ndarray:
+        texts = list(texts)
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self._features(text):
+                digest = hashlib.blake2b(
+                    feature.encode("utf-8"), digest_size=8
+                ).digest()
+                value = int.from_bytes(digest, "little")
+                sign = 1.0 if value & 1 else -1.0
+                matrix[row, (value >> 1) % self.dim] += sign
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+        return matrix
+
+
+PROVIDERS = {
+    GeminiProvider.name: GeminiProvider,
+    LocalProvider.name: LocalProvider,
+    HashingProvider.name: HashingProvider,
+}
+
+_provider = None
+_lock = threading.Lock()
+
+
+# 설정된 임베딩 백엔드 (프로세스 내 싱글톤)
+def get_provider() -> EmbeddingProvider:
+    global _provider
+    if _provider is None:
+        with _lock:
+            if _provider is None:
+                provider_cls = PROVIDERS.get(EMBEDDING_PROVIDER)
+                if provider_cls is None:
+                    raise ValueError(f"알 수 없는 임베딩 백엔드: {EMBEDDING_PROVIDER}")
+                _provider = provider_cls()
+                logging.info(
+                    f"임베딩 백엔드: {_provider.name} ({_provider.model}, {_provider.dim}차원)"
+                )
+    return _provider
@@ -0,0 +1,125 @@
+import os
+import logging
+
+# 환경 변수 설정
+LID_MODEL_PATH = os.getenv(
+    "LID_MODEL_PATH", "./src/layers/filter/pretrained/lid.176.ftz"
+)
+# 모델 파일은 저장소에 포함하지 않으므로 이미지 빌드 시 download_lid_model()로 받음
+LID_MODEL_URL = os.getenv(
+    "LID_MODEL_URL",
+    "https://dl.fbaipublicfiles.com/fasttext/supervised-models/lid.176.ftz",
+)
+HANGUL_RATIO_THRESHOLD = 0.3
+LID_MIN_CONFIDENCE = 0.6
+
+# fastText LID 라벨 -> DeepL 언어 코드
+LID_TO_DEEPL = {
+    "ko": "KO",
+    "en": "EN",
+    "ja": "JA",
+    "zh": "ZH",
+    "de": "DE",
+    "fr": "FR",
+    "es": "ES",
+    "it": "IT",
+    "pt": "PT",
+    "ru": "RU",
+    "vi": "VI",
+    "id": "ID",
+    "th": "TH",
+}
+
+lid_model = None
+_lid_load_failed = False
+
+
+# 한글 문자 여부
+def is_hangul(char: str) -> bool:
+    code = ord(char)
+    return (
+        0xAC00 <= code <= 0xD7A3  # 완성형 음절
+        or 0x1100 <= code <= 0x11FF  # 자모
+        or 0x3130 <= code <= 0x318F  # 호환 자모
+    )
+
+
+# 일본어 가나 여부
+def is_kana(char: str) -> bool:
+    return 0x3040 <= ord(char) <= 0x30FF
+
+
+# 글자 중 한글 비율
+def hangul_ratio(text: str) -> float:
+    letters = [c for c in text if c.isalpha()]
+    if not letters:
+        return 0.0
+    return sum(1 for c in letters if is_hangul(c)) / len(letters)
+
+
+# fastText LID 모델 다운로드 (이미 있으면 그대로 사용)
+def download_lid_model(path: str = LID_MODEL_PATH, url: str = LID_MODEL_URL) -> bool:
+    if os.path.exists(path):
+        return True
+    try:
+        import urllib.request
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        urllib.request.urlretrieve(url, path)
+        logging.info(f"언어 감지 모델 다운로드 완료: {path}")
+        return True
+    except Exception as e:
+        logging.error(f"언어 감지 모델 다운로드 실패: {e}")
+        return False
+
+
+# fastText LID 모델 지연 로드 (없으면 휴리스틱만 사용)
+def _load_lid_model():
+    global lid_model, _lid_load_failed
+    if lid_model is not None or _lid_load_failed:
+        return lid_model
+
+    try:
+        import fasttext
+
+        lid_model = fasttext.load_model(LID_MODEL_PATH)
+        logging.info(f"언어 감지 모델 로드 완료: {LID_MODEL_PATH}")
+    except Exception as e:
+        logging.warning(f"언어 감지 모델 로드 실패, 휴리스틱만 사용합니다: {e}")
+        _lid_load_failed = True
+    return lid_model
+
+
+# 로컬 언어 감지 (DeepL 코드 반환, 판단할 수 없으면 None)
+def detect_language(text: str) -> str | None:
+    if not text or not text.strip():
+        return None
+
+    # 한글 비율이 충분하면 한국어로 판단
+    if hangul_ratio(text) >= HANGUL_RATIO_THRESHOLD:
+        return "KO"
+
+    # 가나가 포함되면 일본어로 판단
+    if any(is_kana(c) for c in text):
+        return "JA"
+
+    model = _load_lid_model()
+    if model is None:
+        return None
+
+    try:
+        labels, probs = model.predict(text.replace("\n", " "), k=1)
+    except Exception as e:
+        logging.warning(f"언어 감지 중 오류: {e}")
+        return None
+
+    if not labels or probs[0] < LID_MIN_CONFIDENCE:
+        return None
+    return LID_TO_DEEPL.get(labels[0].replace("__label__", ""))
+
+
+# 두 언어 코드가 같은 언어인지 비교 (EN-US, EN-GB -> EN)
+def same_language(lang_a: str | None, lang_b: str | None) -> bool:
+    if not lang_a or not lang_b:
+        return False
+    return lang_a.upper().split("-")[0] == lang_b.upper().split("-")[0]
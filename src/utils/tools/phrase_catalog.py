@@ -0,0 +1,102 @@
+import os
+import json
+import logging
+import tempfile
+import threading
+
+import src.utils.tools.translate as translate
+
+# 고정 문구 번역표 경로 (한국어 원문 -> {언어 코드: 번역문})
+CATALOG_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "dataset", "system_phrases.json"
+)
+# 실행 중 추가된 번역 저장 경로 (저장소의 dataset/ 밖, 번역표에 있는 문구만 저장)
+RUNTIME_CATALOG_PATH = os.getenv(
+    "PHRASE_CATALOG_RUNTIME_PATH",
+    os.path.join(tempfile.gettempdir(), "chatbot_system_phrases.json"),
+)
+SOURCE_LANG = "KO"
+
+_lock = threading.Lock()
+_catalog = {}
+_runtime = {}
+
+
+def _read_json(path: str) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logging.error(f"고정 문구 번역표 로드 실패 ({path}): {e}")
+        return {}
+
+
+# 번역표 로드 (배포된 번역표 + 실행 중 추가된 번역)
+def load_catalog(
+    path: str = CATALOG_PATH, runtime_path: str = RUNTIME_CATALOG_PATH
+) -> dict:
+    global _catalog, _runtime
+    catalog = _read_json(path)
+    runtime = {
+        text: translations
+        for text, translations in _read_json(runtime_path).items()
+        if text in catalog
+    }
+    for text, translations in runtime.items():
+        catalog[text] = {**translations, **catalog[text]}
+    logging.info(f"고정 문구 번역표 로드 완료: {len(catalog)}개")
+
+    with _lock:
+        _catalog = catalog
+        _runtime = runtime
+    return catalog
+
+
+# 실행 중 추가된 번역 저장 (잠금 안에서 고유한 임시 파일에 쓴 뒤 교체)
+def save_catalog(path: str = RUNTIME_CATALOG_PATH) -> None:
+    with _lock:
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=".system_phrases.", dir=os.path.dirname(path) or "."
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(_runtime, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logging.warning(f"고정 문구 번역표 저장 실패: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+# 고정 문구를 사용자 언어로 변환
+# 번역표에 있는 문구는 한 번만 번역한 뒤 메모리와 파일에 저장
+# 번역표에 없는 문구(동적 메시지 등)는 번역 캐시만 사용하고 저장하지 않음
+def localize(text: str, lang: str) -> str:
+    if not text or lang == SOURCE_LANG:
+        return text
+
+    translations = _catalog.get(text)
+    if translations is not None and translations.get(lang) is not None:
+        return translations[lang]
+
+    try:
+        translated, _ = translate.translater(text, lang)
+    except Exception as e:
+        logging.error(f"고정 문구 번역 실패 ({lang}): {e}")
+        return text
+
+    if translations is None:
+        return translated
+
+    with _lock:
+        translations[lang] = translated
+        _runtime.setdefault(text, {})[lang] = translated
+    save_catalog()
+    logging.info(f"고정 문구 번역 추가 ({lang}): {text[:30]}")
+    return translated
+
+
+load_catalog()
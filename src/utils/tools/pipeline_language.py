@@ -0,0 +1,87 @@
+import os
+import logging
+from dotenv import load_dotenv
+
+# 환경 변수 설정
+env_path = os.path.join(os.path.dirname(__file__), "..", "..", ".env")
+load_dotenv(dotenv_path=os.path.abspath(env_path))
+
+# 파이프라인 내부 처리 언어 (분류/캐시/컨텍스트가 이 언어의 텍스트를 사용)
+# 분류 모델이 해당 언어로 학습되어 있을 때만 적용하고, 아니면 기존 영어 파이프라인 유지
+DEFAULT_PIPELINE_LANG = "EN-GB"
+REQUESTED_PIPELINE_LANG = os.getenv("PIPELINE_LANG", DEFAULT_PIPELINE_LANG)
+
+# 분류 모델의 학습 언어 기록 파일 (재학습 시 model.bin과 함께 저장)
+# 기록이 없는 모델은 영어 데이터로 학습된 기존 모델로 간주
+MODEL_LANG_PATH = "./src/layers/filter/pretrained/model.lang"
+
+# 한국어 전환 시 사용할 학습 데이터
+KO_TRAIN_DATA_PATH = "./dataset/train_ko.txt"
+
+
+def _is_korean(lang) -> bool:
+    return bool(lang) and lang.upper().startswith("KO")
+
+
+# 현재 분류 모델의 학습 언어
+def model_language(path: str = MODEL_LANG_PATH) -> str:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read().strip() or DEFAULT_PIPELINE_LANG
+    except FileNotFoundError:
+        return DEFAULT_PIPELINE_LANG
+    except Exception as e:
+        logging.warning(f"분류 모델 학습 언어 확인 실패: {e}")
+        return DEFAULT_PIPELINE_LANG
+
+
+# 분류 모델의 학습 언어 기록
+def save_model_language(lang: str, path: str = MODEL_LANG_PATH) -> None:
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(lang)
+    except Exception as e:
+        logging.warning(f"분류 모델 학습 언어 저장 실패: {e}")
+
+
+# 실제로 사용할 파이프라인 언어
+# 한국어를 요청해도 한국어로 학습된 모델이 없으면 영어로 동작
+def resolve_pipeline_lang(requested: str = REQUESTED_PIPELINE_LANG) -> str:
+    if not _is_korean(requested):
+        return requested
+    if _is_korean(model_language()):
+        return requested
+    logging.warning(
+        f"PIPELINE_LANG={requested} 이지만 분류 모델이 한국어로 학습되지 않아 "
+        f"{DEFAULT_PIPELINE_LANG}로 동작합니다. "
+        "python -m src.utils.tools.pipeline_language KO 실행 후 다시 시작해주세요."
+    )
+    return DEFAULT_PIPELINE_LANG
+
+
+PIPELINE_LANG = resolve_pipeline_lang()
+
+
+# 한국어 파이프라인 전환 단계 (이미지 빌드 또는 배포 전에 실행)
+# 1) 언어 감지 모델을 받고 2) 한국어 분류 모델을 학습해 model.lang에 KO를 기록
+# 이후 PIPELINE_LANG=KO로 시작하면 한국어 입력은 번역 없이 처리됨
+if __name__ == "__main__":
+    import sys
+
+    from src.utils.tools.language_detection import download_lid_model
+    from src.layers.filter.fasttext_model import model_retrain
+
+    logging.basicConfig(level=logging.INFO)
+    target = sys.argv[1] if len(sys.argv) > 1 else REQUESTED_PIPELINE_LANG
+
+    if not download_lid_model():
+        sys.exit(1)
+
+    if not _is_korean(target):
+        logging.info(f"{target} 파이프라인은 기존 영어 분류 모델을 사용합니다.")
+        sys.exit(0)
+
+    if model_retrain(KO_TRAIN_DATA_PATH, target) is None:
+        logging.error(f"한국어 분류 모델 학습 실패: {KO_TRAIN_DATA_PATH}")
+        sys.exit(1)
+    logging.info(f"분류 모델 학습 언어: {model_language()}")
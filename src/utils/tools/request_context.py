@@ -0,0 +1,58 @@
+import threading
+from dataclasses import dataclass, field
+from concurrent.futures import Future
+
+from src.utils.tools.embedding import vectorize
+
+
+# 요청 단위 컨텍스트
+# 한 메시지를 처리하는 동안 번역 결과, 언어, 라벨, 권한 범위, 임베딩을 모든 단계가 공유
+@dataclass
+class RequestContext:
+    input_text: str
+    user_id: str = "default_user"
+    translated_text: str = ""
+    lang: str = "KO"
+    label: str = "unknown"
+    confidence: float = 0.0
+    scope: str = ""  # 캐시/동일 질문 합치기 범위 (처음 필요할 때 결정)
+    embeddings: dict = field(default_factory=dict, repr=False)
+    # 투기적 캐시 조회에서 적중한 doc_id (답변을 실제로 사용할 때 빈도 기록)
+    cache_hits: list = field(default_factory=list, repr=False)
+    # 요청이 차단/실패해 더 이상 스테이지 결과가 필요 없음
+    cancelled: threading.Event = field(default_factory=threading.Event, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    # 텍스트 임베딩 (요청 안에서 같은 텍스트는 한 번만 계산)
+    # 동시에 실행되는 스테이지가 같은 텍스트를 요청하면 먼저 시작한 쪽의 결과를 기다림
+    def embed(self, text: str | None = None):
+        if text is None:
+            text = self.translated_text or self.input_text
+        key = text.strip()
+
+        with self._lock:
+            future = self.embeddings.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self.embeddings[key] = future
+
+        if is_owner:
+            try:
+                future.set_result(vectorize(text))
+            except Exception as e:
+                with self._lock:
+                    self.embeddings.pop(key, None)
+                future.set_exception(e)
+
+        return future.result()
+
+    # 이미 계산된 임베딩만 반환 (계산 전이거나 실패했으면 None, 새로 계산하지 않음)
+    def computed_embedding(self, text: str | None = None):
+        if text is None:
+            text = self.translated_text or self.input_text
+        with self._lock:
+            future = self.embeddings.get(text.strip())
+        if future is None or not future.done() or future.exception() is not None:
+            return None
+        return future.result()
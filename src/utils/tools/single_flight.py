@@ -0,0 +1,159 @@
+import os
+import json
+import time
+import uuid
+import hashlib
+import logging
+import threading
+from concurrent.futures import Future
+
+import src.layers.monitoring.monitoring as monitoring
+import src.utils.database.connect_redis as connect_redis
+from src.utils.tools.text_normalize import normalize_question
+
+# 동일 질문 합치기 설정
+SINGLE_FLIGHT_ENABLED = os.getenv("SINGLE_FLIGHT_ENABLED", "true").lower() == "true"
+CLAIM_TTL_MS = int(os.getenv("SINGLE_FLIGHT_CLAIM_MS", 30000))
+RESULT_TTL_SECONDS = int(os.getenv("SINGLE_FLIGHT_RESULT_TTL", 30))
+WAIT_TIMEOUT = float(os.getenv("SINGLE_FLIGHT_WAIT_TIMEOUT", 45))
+POLL_INTERVAL = 0.1
+CLAIM_PREFIX = "sf:claim:"
+RESULT_PREFIX = "sf:result:"
+DB_PORT = 0
+
+_MISSING = object()
+
+# 인스턴스 간 처리 선점/결과 공유용 Redis (연결 실패 시 프로세스 내부에서만 합침)
+try:
+    redis_client = connect_redis.get_redis_client(DB_PORT)
+    _release_claim = redis_client.register_script(
+        "if redis.call('get', KEYS[1]) == ARGV[1] then "
+        "return redis.call('del', KEYS[1]) else return 0 end"
+    )
+except Exception as e:
+    logging.warning(
+        f"single-flight Redis 연결 실패, 프로세스 내부에서만 동작합니다: {e}"
+    )
+    redis_client = None
+    _release_claim = None
+
+_inflight = {}
+_lock = threading.Lock()
+
+
+# 합치기 키 (정규화된 질문 + 라벨 + 권한 범위)
+def make_key(question: str, label: str, scope: str = "") -> str:
+    raw = f"{label}|{scope}|{normalize_question(question)}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+# 같은 키의 작업이 진행 중이면 그 결과를 기다리고, 아니면 직접 실행
+# 결과는 인스턴스 간 공유를 위해 JSON 직렬화 가능해야 함
+# 반환: (결과, 다른 요청의 결과를 공유받았는지 여부)
+def run(key: str, fn, *args, **kwargs):
+    if not SINGLE_FLIGHT_ENABLED:
+        return fn(*args, **kwargs), False
+
+    with _lock:
+        future = _inflight.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = Future()
+            _inflight[key] = future
+
+    if not is_leader:
+        try:
+            result = future.result(timeout=WAIT_TIMEOUT)
+            monitoring.record_single_flight("local_follower")
+            return result, True
+        except Exception as e:
+            # 선행 요청이 실패하거나 너무 오래 걸리면 직접 처리
+            logging.warning(f"single-flight 대기 실패, 직접 처리합니다: {e}")
+            monitoring.record_single_flight("fallback")
+            return fn(*args, **kwargs), False
+
+    try:
+        result, shared = _run_leader(key, fn, *args, **kwargs)
+        future.set_result(result)
+        return result, shared
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _lock:
+            _inflight.pop(key, None)
+
+
+# 프로세스 내 대표 요청: Redis 선점 키로 다른 인스턴스와 조율
+def _run_leader(key, fn, *args, **kwargs):
+    if redis_client is None:
+        monitoring.record_single_flight("leader")
+        return fn(*args, **kwargs), False
+
+    claim_key = f"{CLAIM_PREFIX}{key}"
+    result_key = f"{RESULT_PREFIX}{key}"
+    token = uuid.uuid4().hex
+    try:
+        claimed = redis_client.set(claim_key, token, nx=True, px=CLAIM_TTL_MS)
+    except Exception as e:
+        logging.warning(f"single-flight 선점 실패: {e}")
+        claimed = True
+        token = None
+
+    if claimed:
+        monitoring.record_single_flight("leader")
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            _release(claim_key, token)
+            raise
+        _publish(claim_key, result_key, token, result)
+        return result, False
+
+    # 다른 인스턴스가 처리 중이면 결과를 기다림
+    result = _wait_remote(claim_key, result_key)
+    if result is not _MISSING:
+        monitoring.record_single_flight("remote_follower")
+        return result, True
+
+    monitoring.record_single_flight("fallback")
+    return fn(*args, **kwargs), False
+
+
+# 결과 공유 후 선점 해제
+def _publish(claim_key, result_key, token, result):
+    if token is None:
+        return
+    try:
+        redis_client.set(
+            result_key, json.dumps(result, ensure_ascii=False), ex=RESULT_TTL_SECONDS
+        )
+    except Exception as e:
+        logging.warning(f"single-flight 결과 공유 실패: {e}")
+    _release(claim_key, token)
+
+
+def _release(claim_key, token):
+    if token is None:
+        return
+    try:
+        _release_claim(keys=[claim_key], args=[token])
+    except Exception as e:
+        logging.warning(f"single-flight 선점 해제 실패: {e}")
+
+
+# 다른 인스턴스의 결과 대기 (선점이 사라졌는데 결과가 없으면 _MISSING)
+def _wait_remote(claim_key, result_key):
+    deadline = time.monotonic() + WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            raw, claim = redis_client.mget(result_key, claim_key)
+        except Exception as e:
+            logging.warning(f"single-flight 결과 조회 실패: {e}")
+            return _MISSING
+        if raw is not None:
+            return json.loads(raw)
+        if claim is None:
+            return _MISSING
+        time.sleep(POLL_INTERVAL)
+    return _MISSING
@@ -0,0 +1,81 @@
+import os
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future, CancelledError
+
+from src.utils.tools.worker_pool import WORKER_POOL_SIZE
+
+# 환경 변수 설정
+PIPELINE_CONCURRENT = os.getenv("PIPELINE_CONCURRENT", "true").lower() == "true"
+# 파이프라인 하나가 동시에 띄우는 스테이지 수 (2차 가드레일, 컨텍스트 탐색, 캐시 조회)
+STAGES_PER_PIPELINE = 3
+# 모든 파이프라인 워커가 동시에 스테이지를 띄워도 다른 요청 뒤에 줄 서지 않도록 워커 수에 맞춤
+STAGE_WORKERS = int(
+    os.getenv("PIPELINE_STAGE_WORKERS", WORKER_POOL_SIZE * STAGES_PER_PIPELINE)
+)
+
+
+# 순차 모드용 지연 실행 스테이지
+# result()가 처음 호출될 때 실행되므로 취소된 투기적 작업은 아예 실행되지 않음
+class DeferredStage:
+    def __init__(self, fn, *args, **kwargs):
+        self._call = (fn, args, kwargs)
+        self._lock = threading.Lock()
+        self._done = False
+        self._cancelled = False
+        self._result = None
+        self._error = None
+
+    def result(self, timeout=None):
+        with self._lock:
+            if self._cancelled:
+                raise CancelledError()
+            if not self._done:
+                fn, args, kwargs = self._call
+                try:
+                    self._result = fn(*args, **kwargs)
+                except Exception as e:
+                    self._error = e
+                self._done = True
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+    def cancel(self):
+        with self._lock:
+            if self._done:
+                return False
+            self._cancelled = True
+            return True
+
+    def done(self):
+        return self._done or self._cancelled
+
+
+_executor = (
+    ThreadPoolExecutor(max_workers=STAGE_WORKERS, thread_name_prefix="pipeline-stage")
+    if PIPELINE_CONCURRENT
+    else None
+)
+
+
+# 스테이지 실행 (동시 모드: 스레드 풀에서 바로 시작, 순차 모드: 지연 실행)
+def submit(fn, *args, **kwargs) -> Future | DeferredStage:
+    if _executor is None:
+        return DeferredStage(fn, *args, **kwargs)
+    return _executor.submit(fn, *args, **kwargs)
+
+
+# 더 이상 필요 없는 투기적 스테이지 취소
+# 이미 실행 중인 작업은 끝까지 실행되지만 결과는 버려짐
+def cancel(*stages) -> None:
+    for stage in stages:
+        if stage is not None and not stage.done():
+            stage.cancel()
+
+
+# 스테이지 실행기 종료
+def shutdown(wait: bool = True) -> None:
+    if _executor is not None:
+        logging.info("파이프라인 스테이지 실행기를 종료합니다.")
+        _executor.shutdown(wait=wait, cancel_futures=True)
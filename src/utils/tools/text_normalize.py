@@ -0,0 +1,12 @@
+import re
+import unicodedata
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING = re.compile(r"[\s?!.~,;]+$")
+
+
+# 질문 정규화 (유니코드 정규화, 소문자, 공백 정리, 끝 문장부호 제거)
+def normalize_question(text: str) -> str:
+    text = unicodedata.normalize("NFC", text).lower()
+    text = _WHITESPACE.sub(" ", text).strip()
+    return _TRAILING.sub("", text)
@@ -1,7 +1,16 @@
 import os
+import json
 import deepl
+import hashlib
+import logging
+import unicodedata
 from dotenv import load_dotenv
 
+import src.layers.monitoring.monitoring as monitoring
+import src.utils.database.connect_redis as connect_redis
+from src.utils.tools.lru_cache import LRUCache
+from src.utils.tools.language_detection import detect_language, same_language
+from src.utils.tools.pipeline_language import PIPELINE_LANG
 
 # 환경 변수 설정
 env_path = os.path.join(os.path.dirname(__file__), "..", "..", ".env")
@@ -12,10 +21,72 @@ load_dotenv(dotenv_path=os.path.abspath(env_path))
 DEEPL_API_KEY = os.getenv("DEEPL_API_KEY")
 deepl_client = deepl.DeepLClient(DEEPL_API_KEY)
 
+# 번역 캐시 설정
+TRANSLATION_CACHE_SIZE = int(os.getenv("TRANSLATION_CACHE_SIZE", 2048))
+TRANSLATION_CACHE_TTL = int(os.getenv("TRANSLATION_CACHE_TTL", 86400 * 7))
+TRANSLATION_KEY_PREFIX = "trans:"
+DB_PORT = 2
 
-# 번역 함수 정의
+# 1차: 프로세스 내부 LRU, 2차: Redis (인스턴스 간 공유)
+local_cache = LRUCache(max_size=TRANSLATION_CACHE_SIZE)
+try:
+    redis_client = connect_redis.get_redis_client(DB_PORT)
+except Exception as e:
+    logging.warning(f"번역 캐시 Redis 연결 실패, 로컬 캐시만 사용합니다: {e}")
+    redis_client = None
+
+
+# 번역 캐시 키 (정규화된 텍스트 + 언어 쌍의 해시)
+def make_cache_key(text, source_lang, target_lang):
+    normalized = unicodedata.normalize("NFC", text).strip()
+    raw = f"{source_lang or 'AUTO'}|{target_lang}|{normalized}"
+    return TRANSLATION_KEY_PREFIX + hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+# 번역 함수 정의 (캐시 우선 조회)
 # lang을 기준으로 (유저가 입력한 언어) -> 영어 -> LLM -> 영어 -> (유저가 입력한 언어)로 번역 예정
 def translater(text, lang="EN-GB"):
+    key = make_cache_key(text, detect_language(text), lang)
+
+    cached = local_cache.get(key)
+    if cached is not None:
+        monitoring.record_translation_cache("local", "hit")
+        return cached
+    monitoring.record_translation_cache("local", "miss")
+
+    if redis_client is not None:
+        try:
+            raw = redis_client.get(key)
+            if raw:
+                data = json.loads(raw)
+                result = (data["text"], data["source_lang"])
+                local_cache.set(key, result)
+                monitoring.record_translation_cache("redis", "hit")
+                return result
+            monitoring.record_translation_cache("redis", "miss")
+        except Exception as e:
+            logging.warning(f"번역 캐시 조회 실패: {e}")
+
+    result = _translate_remote(text, lang)
+
+    local_cache.set(key, result)
+    if redis_client is not None:
+        try:
+            redis_client.set(
+                key,
+                json.dumps(
+                    {"text": result[0], "source_lang": result[1]}, ensure_ascii=False
+                ),
+                ex=TRANSLATION_CACHE_TTL,
+            )
+        except Exception as e:
+            logging.warning(f"번역 캐시 저장 실패: {e}")
+
+    return result
+
+
+# DeepL 번역 호출
+def _translate_remote(text, lang):
     # \n을 */로 치환
     text_with_placeholder = text.replace("\n", "*/")
 
@@ -28,3 +99,26 @@ def translater(text, lang="EN-GB"):
     translated_text = result.text.replace("*/", "\n")
 
     return (translated_text, result.detected_source_lang)
+
+
+# 입력 번역 (파이프라인 언어와 같으면 DeepL 호출 생략)
+def translate_input(text):
+    detected_lang = detect_language(text)
+    if same_language(detected_lang, PIPELINE_LANG):
+        monitoring.record_translation_skipped("inbound")
+        return text, detected_lang
+
+    return translater(text, PIPELINE_LANG)
+
+
+# 출력 번역 (이미 사용자 언어로 작성된 응답이면 DeepL 호출 생략)
+def translate_output(text, lang):
+    if not text:
+        return text
+
+    if same_language(detect_language(text), lang):
+        monitoring.record_translation_skipped("outbound")
+        return text
+
+    translated_text, _ = translater(text, lang)
+    return translated_text
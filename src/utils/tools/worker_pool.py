@@ -0,0 +1,273 @@
+import os
+import time
+import queue
+import logging
+import threading
+from collections import deque
+
+import src.layers.monitoring.monitoring as monitoring
+
+# 환경 변수 설정
+WORKER_POOL_SIZE = int(os.getenv("PIPELINE_WORKERS", 8))
+WORKER_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", 100))
+# reject: 새 작업 거절, drop_oldest: 가장 오래된 대기 작업 폐기, caller_runs: 호출 스레드에서 직접 실행
+# caller_runs를 KeyedScheduler와 함께 쓰면 호출 스레드가 해당 키의 레인을 끝까지 처리하므로
+# (웹소켓 수신 스레드라면 그동안 메시지를 받지 못함) 수신 스레드가 막혀도 되는 경우에만 사용
+WORKER_OVERFLOW_POLICY = os.getenv("PIPELINE_OVERFLOW_POLICY", "reject")
+DRAIN_TIMEOUT_SECONDS = float(os.getenv("PIPELINE_DRAIN_TIMEOUT", 30))
+LANE_MAX_PENDING = int(os.getenv("PIPELINE_LANE_MAX_PENDING", 20))
+
+OVERFLOW_POLICIES = ("reject", "drop_oldest", "caller_runs")
+
+
+# 고정 크기 워커 + 제한된 대기열을 가진 작업 풀
+class BoundedWorkerPool:
+    def __init__(
+        self,
+        name: str = "pipeline",
+        size: int = WORKER_POOL_SIZE,
+        queue_size: int = WORKER_QUEUE_SIZE,
+        overflow_policy: str = WORKER_OVERFLOW_POLICY,
+    ):
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"지원하지 않는 overflow 정책입니다: {overflow_policy}")
+
+        self.name = name
+        self.size = size
+        self.overflow_policy = overflow_policy
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._accepting = True
+        self._lock = threading.Lock()
+        self._active = 0
+        self._drain_lock = threading.Lock()
+        self._drain_result = None
+        self._workers = []
+
+        for i in range(size):
+            worker = threading.Thread(
+                target=self._worker_loop, name=f"{name}-worker-{i}", daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    # 작업 제출 (수락되면 True, 거절/폐기되면 False)
+    # on_drop: drop_oldest 정책으로 대기 중에 폐기될 때 호출되는 콜백
+    def submit(self, fn, *args, on_drop=None, **kwargs) -> bool:
+        if not self._accepting:
+            logging.warning(f"[{self.name}] 종료 중이라 작업을 받지 않습니다.")
+            monitoring.record_worker_rejected(self.name, "shutdown")
+            return False
+
+        item = (time.monotonic(), fn, args, kwargs, on_drop)
+        try:
+            self._queue.put_nowait(item)
+            monitoring.record_worker_queue_depth(self.name, self._queue.qsize())
+            return True
+        except queue.Full:
+            pass
+
+        if self.overflow_policy == "caller_runs":
+            monitoring.record_worker_rejected(self.name, "caller_runs")
+            self._run(item)
+            return True
+
+        if self.overflow_policy == "drop_oldest":
+            try:
+                dropped = self._queue.get_nowait()
+                self._queue.task_done()
+                monitoring.record_worker_rejected(self.name, "drop_oldest")
+                if dropped is not None and dropped[4] is not None:
+                    dropped[4]()
+            except queue.Empty:
+                pass
+            try:
+                self._queue.put_nowait(item)
+                return True
+            except queue.Full:
+                pass
+
+        logging.warning(f"[{self.name}] 대기열이 가득 차 작업을 거절했습니다.")
+        monitoring.record_worker_rejected(self.name, "reject")
+        return False
+
+    # overflow 정책을 적용하지 않고 빈 자리가 있을 때만 제출
+    def try_submit(self, fn, *args, on_drop=None, **kwargs) -> bool:
+        if not self._accepting:
+            return False
+        try:
+            self._queue.put_nowait((time.monotonic(), fn, args, kwargs, on_drop))
+            monitoring.record_worker_queue_depth(self.name, self._queue.qsize())
+            return True
+        except queue.Full:
+            return False
+
+    def _worker_loop(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                break
+            try:
+                self._run(item)
+            finally:
+                self._queue.task_done()
+
+    def _run(self, item):
+        enqueued_at, fn, args, kwargs, _ = item
+        monitoring.record_worker_wait_time(self.name, time.monotonic() - enqueued_at)
+        monitoring.record_worker_queue_depth(self.name, self._queue.qsize())
+
+        with self._lock:
+            self._active += 1
+        try:
+            fn(*args, **kwargs)
+        except Exception as e:
+            logging.error(f"[{self.name}] 작업 실행 중 오류: {e}")
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    # 대기 중인 작업 수
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    # 실행 중인 작업 수
+    def active(self) -> int:
+        return self._active
+
+    # 새 작업을 막고 대기열의 작업이 끝날 때까지 기다림
+    # 한 번만 실행 (제한 시간 초과/예외로 끝나도 이후 호출은 첫 결과를 바로 반환)
+    def drain(self, timeout: float = DRAIN_TIMEOUT_SECONDS) -> bool:
+        with self._drain_lock:
+            if self._drain_result is None:
+                self._drain_result = False
+                self._drain_result = self._drain(timeout)
+            return self._drain_result
+
+    def _drain(self, timeout) -> bool:
+        self._accepting = False
+        deadline = time.monotonic() + timeout
+        logging.info(
+            f"[{self.name}] 작업 정리 시작 (대기 {self.pending()}개, 실행 중 {self.active()}개)"
+        )
+
+        while self._queue.unfinished_tasks > 0:
+            if time.monotonic() >= deadline:
+                logging.warning(
+                    f"[{self.name}] 제한 시간 내에 작업을 모두 끝내지 못했습니다. (남은 작업 {self._queue.unfinished_tasks}개)"
+                )
+                return False
+            time.sleep(0.05)
+
+        for _ in self._workers:
+            self._queue.put(None)
+        logging.info(f"[{self.name}] 작업 정리 완료")
+        return True
+
+
+# 키(사용자)별 순서를 보장하는 스케줄러
+# 같은 키의 작업은 도착 순서대로 하나씩, 다른 키의 작업은 워커 풀에서 병렬로 실행
+class KeyedScheduler:
+    def __init__(
+        self, pool: BoundedWorkerPool, max_pending_per_key: int = LANE_MAX_PENDING
+    ):
+        self.pool = pool
+        self.max_pending_per_key = max_pending_per_key
+        self._lanes = {}
+        self._lock = threading.Lock()
+
+    # 작업 제출 (수락되면 True)
+    # on_reject: 수락된 뒤 레인이 풀에 들어가지 못해 실행되지 못할 때 호출되는 콜백
+    def submit(self, key, fn, *args, on_reject=None, **kwargs) -> bool:
+        task = (fn, args, kwargs, on_reject)
+        with self._lock:
+            lane = self._lanes.get(key)
+            if lane is not None:
+                # 이미 실행 중인 레인이 있으면 뒤에 줄 세움
+                if len(lane) >= self.max_pending_per_key:
+                    logging.warning(
+                        f"[{self.pool.name}] {key} 레인이 가득 차 작업을 거절했습니다."
+                    )
+                    monitoring.record_worker_rejected(self.pool.name, "lane_full")
+                    return False
+                lane.append(task)
+                return True
+            self._lanes[key] = deque([task])
+
+        if not self.pool.submit(
+            self._run_lane, key, on_drop=lambda: self._drop_head(key)
+        ):
+            # 그 사이 뒤에 줄 선 작업은 이미 수락되었으므로 각 호출자에게 거절을 알림
+            with self._lock:
+                lane = self._lanes.pop(key, deque())
+            if lane and lane[0] is task:
+                lane.popleft()
+            self._reject(key, lane)
+            return False
+        return True
+
+    # 레인의 맨 앞 작업 실행 후 다음 작업을 풀에 다시 제출
+    def _run_lane(self, key):
+        while True:
+            with self._lock:
+                fn, args, kwargs, _ = self._lanes[key][0]
+            try:
+                fn(*args, **kwargs)
+            except Exception as e:
+                logging.error(f"[{self.pool.name}] {key} 작업 실행 중 오류: {e}")
+
+            if not self._advance(key):
+                return
+            # 다른 사용자와 번갈아 실행되도록 풀에 재제출, 자리가 없으면 현재 스레드에서 계속 실행
+            if self.pool.try_submit(
+                self._run_lane, key, on_drop=lambda: self._drop_head(key)
+            ):
+                return
+
+    # 완료된 작업 제거 (남은 작업이 있으면 True)
+    def _advance(self, key) -> bool:
+        with self._lock:
+            lane = self._lanes.get(key)
+            if lane:
+                lane.popleft()
+            if not lane:
+                self._lanes.pop(key, None)
+                return False
+            return True
+
+    # 대기열에서 레인 실행 작업이 폐기된 경우 맨 앞 작업을 거절 처리하고 다음 작업 진행
+    # 다음 작업을 풀에 넣을 자리가 없으면 남은 작업도 모두 거절 처리
+    def _drop_head(self, key):
+        logging.warning(f"[{self.pool.name}] {key} 레인의 작업이 폐기되었습니다.")
+        with self._lock:
+            lane = self._lanes.get(key)
+            head = lane[0] if lane else None
+        if head is not None:
+            self._reject(key, [head])
+
+        if self._advance(key):
+            if not self.pool.try_submit(
+                self._run_lane, key, on_drop=lambda: self._drop_head(key)
+            ):
+                with self._lock:
+                    lane = self._lanes.pop(key, deque())
+                self._reject(key, lane)
+
+    # 실행되지 못한 작업의 호출자에게 거절 알림
+    def _reject(self, key, tasks):
+        for _, _, _, on_reject in tasks:
+            monitoring.record_worker_rejected(self.pool.name, "lane_dropped")
+            if on_reject is None:
+                logging.warning(
+                    f"[{self.pool.name}] {key} 레인의 작업이 실행되지 못했습니다."
+                )
+                continue
+            try:
+                on_reject()
+            except Exception as e:
+                logging.error(f"[{self.pool.name}] {key} 거절 알림 중 오류: {e}")
+
+    # 현재 작업이 있는 키 수
+    def active_keys(self) -> int:
+        with self._lock:
+            return len(self._lanes)